@@ -0,0 +1,279 @@
+"""
+Local GitHub API stand-in for benchmarks
+Serves the issues, labels, assignees and comments endpoints (with pagination,
+ETag revalidation and `since`) plus the batched issue GraphQL query and the
+Projects v2 Status update, seeded
+with N synthetic DEV- issues, and counts every request and byte it sees
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlparse
+
+ISSUE_ALIAS = re.compile(r"i(\d+): issue\(number: (\d+)\)")
+STATUS_OPTIONS = ("Todo", "Ready", "In Progress", "In QA", "Done")
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def synthetic_issue(number: int, owner: str, repo: str, epics: int = 5) -> Dict[str, Any]:
+    """An open DEV- issue shaped like the GitHub REST payload."""
+    epic = f"PEPIC-{(number % epics) + 1:03d}"
+    return {
+        "id": 1000000 + number,
+        "node_id": f"I_bench{number}",
+        "number": number,
+        "title": f"DEV-{number:04d}: Synthetic task {number}",
+        "body": f"Benchmark task {number} for {epic}.\n\nAcceptance criteria:\n- It builds\n",
+        "state": "open",
+        "labels": [{"name": "dev_ready"}, {"name": epic}],
+        "assignees": [],
+        "assignee": None,
+        "html_url": f"https://github.com/{owner}/{repo}/issues/{number}",
+        "comments": 0,
+        "updated_at": _timestamp(time.time() - 86400 + number)
+    }
+
+
+class FakeGitHub:
+    """In-memory repository state plus the HTTP server exposing it."""
+
+    def __init__(self, issues: int = 100, owner: str = "bench", repo: str = "sissificate",
+                 login: str = "bench-bot", latency: float = 0.0):
+        self.owner = owner
+        self.repo = repo
+        self.login = login
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.issues: Dict[int, Dict[str, Any]] = {
+            n: synthetic_issue(n, owner, repo) for n in range(1, issues + 1)
+        }
+        self.comments: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        self.next_comment_id = 1
+        self.project_status: Dict[int, str] = {}
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.server: Optional[ThreadingHTTPServer] = None
+
+    # -- lifecycle --------------------------------------------------------
+
+    def start(self) -> str:
+        """Serve on a free localhost port in a background thread; returns the base URL."""
+        fake = self
+
+        class Handler(GitHubHandler):
+            github = fake
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
+
+    def totals(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                key: sum(route[key] for route in self.stats.values())
+                for key in ("requests", "not_modified", "bytes_in", "bytes_out")
+            }
+
+    # -- request handling -------------------------------------------------
+
+    def _touch(self, issue: Dict[str, Any]):
+        issue["updated_at"] = _timestamp(time.time())
+
+    def handle(self, method: str, path: str, query: Dict[str, List[str]],
+               body: Any) -> Tuple[int, Any, Dict[str, str]]:
+        """Route a request; returns (status, JSON payload, extra headers)."""
+        if path == "/user":
+            return 200, {"login": self.login}, {}
+        if path == "/graphql" and method == "POST":
+            return 200, self._graphql(body or {}), {}
+
+        prefix = f"/repos/{self.owner}/{self.repo}/issues"
+        if not path.startswith(prefix):
+            return 404, {"message": "Not Found"}, {}
+        parts = [unquote(p) for p in path[len(prefix):].strip("/").split("/") if p]
+
+        with self.lock:
+            if not parts:
+                if method == "GET":
+                    return self._list_issues(query)
+                return 405, {"message": "Method not allowed"}, {}
+
+            if parts[0] == "comments" and len(parts) == 2 and method == "DELETE":
+                for comments in self.comments.values():
+                    for comment in comments:
+                        if comment["id"] == int(parts[1]):
+                            comments.remove(comment)
+                            return 204, None, {}
+                return 404, {"message": "Not Found"}, {}
+
+            issue = self.issues.get(int(parts[0]))
+            if issue is None:
+                return 404, {"message": "Not Found"}, {}
+            rest = parts[1:]
+
+            if not rest:
+                if method == "PATCH":
+                    for key in ("state", "title", "body"):
+                        if key in (body or {}):
+                            issue[key] = body[key]
+                    self._touch(issue)
+                return 200, issue, {}
+
+            if rest[0] == "assignees":
+                logins = (body or {}).get("assignees", [])
+                current = [a["login"] for a in issue["assignees"]]
+                if method == "POST":
+                    current += [login for login in logins if login not in current]
+                elif method == "DELETE":
+                    current = [login for login in current if login not in logins]
+                issue["assignees"] = [{"login": login} for login in current]
+                issue["assignee"] = issue["assignees"][0] if issue["assignees"] else None
+                self._touch(issue)
+                return (201 if method == "POST" else 200), issue, {}
+
+            if rest[0] == "labels":
+                names = [label["name"] for label in issue["labels"]]
+                if method == "POST":
+                    names += [name for name in (body or {}).get("labels", []) if name not in names]
+                elif method == "DELETE" and len(rest) > 1:
+                    names = [name for name in names if name != rest[1]]
+                issue["labels"] = [{"name": name} for name in names]
+                self._touch(issue)
+                return 200, issue["labels"], {}
+
+            if rest[0] == "comments":
+                if method == "POST":
+                    comment = {"id": self.next_comment_id, "body": (body or {}).get("body", ""),
+                               "user": {"login": self.login}, "created_at": _timestamp(time.time())}
+                    self.next_comment_id += 1
+                    self.comments[issue["number"]].append(comment)
+                    issue["comments"] += 1
+                    self._touch(issue)
+                    return 201, comment, {}
+                return 200, self.comments[issue["number"]], {}
+
+        return 404, {"message": "Not Found"}, {}
+
+    def _list_issues(self, query: Dict[str, List[str]]) -> Tuple[int, Any, Dict[str, str]]:
+        state = query.get("state", ["open"])[0]
+        since = query.get("since", [""])[0]
+        per_page = min(int(query.get("per_page", ["30"])[0]), 100)
+        page = int(query.get("page", ["1"])[0])
+        descending = query.get("direction", ["desc"])[0] == "desc"
+
+        matching = [
+            issue for issue in self.issues.values()
+            if (state == "all" or issue["state"] == state) and issue["updated_at"] >= since
+        ]
+        matching.sort(key=lambda issue: (issue["updated_at"], issue["number"]), reverse=descending)
+        items = matching[(page - 1) * per_page:page * per_page]
+
+        headers = {}
+        if page * per_page < len(matching):
+            params = {key: values[0] for key, values in query.items()}
+            params["page"] = str(page + 1)
+            headers["Link"] = f'<{self.url}/repos/{self.owner}/{self.repo}/issues?{urlencode(params)}>; rel="next"'
+        return 200, items, headers
+
+    def _graphql(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        query, variables = body.get("query", ""), body.get("variables") or {}
+        if "updateProjectV2ItemFieldValue" in query:
+            with self.lock:
+                self.project_status[int(variables["item"])] = STATUS_OPTIONS[int(variables["option"])]
+            return {"data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": variables["item"]}}}}
+        if 'field(name: "Status")' in query:
+            options = [{"id": str(i), "name": name} for i, name in enumerate(STATUS_OPTIONS)]
+            item = {"id": str(variables["number"]),
+                    "project": {"id": "P_bench", "number": 6, "field": {"id": "F_status", "options": options}}}
+            return {"data": {"repository": {"issue": {"projectItems": {
+                "nodes": [item], "pageInfo": {"hasNextPage": False, "endCursor": None}
+            }}}}}
+        aliases = ISSUE_ALIAS.findall(query)
+        if not aliases:
+            return {"errors": [{"message": "Only the batched issue query is supported"}]}
+        repository = {}
+        with self.lock:
+            for alias, number in aliases:
+                issue = self.issues.get(int(number))
+                if issue:
+                    repository[f"i{alias}"] = {
+                        "number": issue["number"],
+                        "state": issue["state"].upper(),
+                        "assignees": {"nodes": issue["assignees"]},
+                        "labels": {"nodes": issue["labels"]},
+                        "projectItems": {"nodes": [{"project": {"number": 6}, "status": {
+                            "name": self.project_status.get(issue["number"], "Ready")
+                        }}]}
+                    }
+        return {"data": {"repository": repository}}
+
+
+class GitHubHandler(BaseHTTPRequestHandler):
+    github: FakeGitHub
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this each response waits on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _serve(self):
+        github = self.github
+        if github.latency:
+            time.sleep(github.latency)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        body = json.loads(raw) if raw else None
+        url = urlparse(self.path)
+        status, payload, headers = github.handle(self.command, url.path, parse_qs(url.query), body)
+
+        data = json.dumps(payload).encode() if payload is not None else b""
+        etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+        not_modified = self.command == "GET" and status == 200 and self.headers.get("If-None-Match") == etag
+        if not_modified:
+            status, data = 304, b""
+
+        route = re.sub(r"/\d+", "/{n}", url.path)
+        with github.lock:
+            stats = github.stats[f"{self.command} {route}"]
+            stats["requests"] += 1
+            stats["not_modified"] += int(not_modified)
+            stats["bytes_in"] += len(raw)
+            stats["bytes_out"] += len(data)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Remaining", "5000")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = do_PUT = _serve
@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+"""
+End-to-end benchmarks for Sissificate Development Crew
+Runs backlog sync and full pickup-to-report cycles for 1..N concurrent agents
+against the local GitHub stand-in and the scripted LLM, and reports wall time,
+tool calls, bytes moved and per-stage latency, plus CLI startup and import time
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fake_github import FakeGitHub  # noqa: E402
+
+STAGES = ("select", "claim", "crew", "report", "release")
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+MAIN_SCRIPT = SRC_DIR / "sissificate_dev" / "main.py"
+
+
+def bench_environment(workdir: Path, github_url: str, fake: FakeGitHub) -> Dict[str, str]:
+    """Environment that points every component at the stand-ins inside workdir."""
+    return {
+        "GITHUB_API_URL": github_url,
+        "GITHUB_TOKEN": "bench-token",
+        "GITHUB_OWNER": fake.owner,
+        "GITHUB_REPO": fake.repo,
+        "GITHUB_PROJECT_NUMBER": "6",
+        "OPENAI_API_KEY": "bench",
+        "SISSIFICATE_PROJECT_PATH": str(workdir / "project"),
+        "SISSIFICATE_CACHE_DIR": str(workdir / "cache"),
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "CREWAI_TRACING_ENABLED": "false",
+        "OTEL_SDK_DISABLED": "true",
+    }
+
+
+def seed_project(root: Path, issues: int):
+    """A tiny project tree with one DEV- spec per synthetic issue."""
+    tasks = root / "docs" / "workboard" / "development" / "tasks"
+    tasks.mkdir(parents=True, exist_ok=True)
+    for number in range(1, issues + 1):
+        task_id = f"DEV-{number:04d}"
+        (tasks / f"{task_id}.md").write_text(
+            f"# {task_id}\n\nStatus: dev_ready\n\n## Acceptance criteria\n- Export a task() function\n"
+        )
+    src = root / "src" / "components"
+    src.mkdir(parents=True, exist_ok=True)
+    for index in range(20):
+        (src / f"Component{index}.tsx").write_text(
+            f"export function Component{index}() {{\n  return <div>Component {index}</div>;\n}}\n"
+        )
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def bench_sync(issues: int, updates: int = 10) -> Dict[str, Any]:
+    """Cold and incremental mirror syncs, the path panel.fetch_github_issues takes."""
+    fake = FakeGitHub(issues=issues)
+    url = fake.start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ.update(bench_environment(Path(tmp), url, fake))
+            from sissificate_dev.github_client import GitHubClient
+            from sissificate_dev.issue_sync import open_mirror
+
+            client = GitHubClient(token="bench-token", base_url=url)
+            mirror = open_mirror()
+            results: Dict[str, Any] = {"issues": issues}
+
+            for name in ("cold", "warm"):
+                fake.reset_stats()
+                started = time.perf_counter()
+                written = mirror.sync(client)
+                results[name] = {"seconds": time.perf_counter() - started, "written": written, **fake.totals()}
+
+            for number in range(1, min(updates, issues) + 1):
+                fake.handle("POST", f"/repos/{fake.owner}/{fake.repo}/issues/{number}/labels", {},
+                            {"labels": ["in-progress"]})
+            fake.reset_stats()
+            started = time.perf_counter()
+            written = mirror.sync(client)
+            results["incremental"] = {"seconds": time.perf_counter() - started, "written": written, **fake.totals()}
+
+            started = time.perf_counter()
+            rows = mirror.query(prefix="DEV-")
+            results["query"] = {"seconds": time.perf_counter() - started, "rows": len(rows)}
+            return results
+    finally:
+        fake.stop()
+
+
+def agent_worker(agent_index: int, environment: Dict[str, str], budget, results, llm_delay: float,
+                 max_concurrent_tasks: int):
+    """One agent process: select, claim, run the crew, report, release, until the budget is spent."""
+    os.environ.update(environment)
+    os.environ["AGENT_ID"] = f"bench-{agent_index}"
+    os.environ["AGENT_NAME"] = f"agent-bench-{agent_index}"
+    os.environ["GITHUB_ASSIGNEE"] = f"bench-agent-{agent_index}"
+
+    from fake_llm import ScriptedLLM
+    from sissificate_dev.crew import SissificateDevCrew
+    from sissificate_dev.github_client import get_client
+    from sissificate_dev.task_lease import GitHubClaim, LeaseManager, claim_task
+    from sissificate_dev.task_selector import select_task
+
+    llm = ScriptedLLM(delay=llm_delay)
+    # The scripted LLM has no provider quota to protect
+    crew_instance = SissificateDevCrew(llm_cache=False, llm=llm, max_rpm={},
+                                       max_concurrent_tasks=max_concurrent_tasks)
+    leases = LeaseManager()
+    github_claim = GitHubClaim()
+    client = get_client()
+    lost = set()
+    results.put({"agent": agent_index, "ready_at": time.time()})
+
+    while True:
+        with budget.get_lock():
+            if budget.value <= 0:
+                return
+            budget.value -= 1
+
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        task = select_task(exclude=lost)
+        timings["select"] = time.perf_counter() - started
+        if not task:
+            return
+
+        started = time.perf_counter()
+        claimed = claim_task(task, leases=leases, github=github_claim)
+        timings["claim"] = time.perf_counter() - started
+        if not claimed:
+            lost.add(task["task_id"])
+            with budget.get_lock():
+                budget.value += 1
+            results.put({"agent": agent_index, "task_id": task["task_id"], "contended": True, "timings": timings})
+            continue
+
+        calls, tool_calls, prompt_bytes = llm.calls, llm.tool_calls, llm.prompt_bytes
+        started = time.perf_counter()
+        crew_instance.kickoff(task)
+        timings["crew"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        issue = f"/repos/{github_claim.owner}/{github_claim.repo}/issues/{task['issue_number']}"
+        client.request("POST", f"{issue}/comments", json_data={"body": f"{task['task_id']} implemented"})
+        client.request("PATCH", issue, json_data={"state": "closed"})
+        timings["report"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        leases.release(task["task_id"])
+        timings["release"] = time.perf_counter() - started
+
+        results.put({
+            "agent": agent_index,
+            "task_id": task["task_id"],
+            "contended": False,
+            "timings": timings,
+            "llm_calls": llm.calls - calls,
+            "tool_calls": llm.tool_calls - tool_calls,
+            "prompt_bytes": llm.prompt_bytes - prompt_bytes,
+            "finished_at": time.time()
+        })
+
+
+def bench_agents(agents: int, issues: int, tasks: int, llm_delay: float,
+                 max_concurrent_tasks: int = 0) -> Dict[str, Any]:
+    """`tasks` full cycles shared between `agents` concurrent agent processes."""
+    fake = FakeGitHub(issues=issues)
+    url = fake.start()
+    context = mp.get_context("spawn")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            seed_project(workdir / "project", issues)
+            environment = bench_environment(workdir, url, fake)
+            budget = context.Value("i", tasks)
+            results = context.Queue()
+
+            started_at = time.time()
+            started = time.perf_counter()
+            processes = [
+                context.Process(target=agent_worker, args=(i, environment, budget, results, llm_delay,
+                                                                max_concurrent_tasks))
+                for i in range(1, agents + 1)
+            ]
+            for process in processes:
+                process.start()
+
+            records = []
+            while any(p.is_alive() for p in processes) or not results.empty():
+                try:
+                    records.append(results.get(timeout=0.2))
+                except Exception:
+                    pass
+            for process in processes:
+                process.join()
+            wall = time.perf_counter() - started
+    finally:
+        fake.stop()
+
+    ready = [r["ready_at"] for r in records if "ready_at" in r]
+    records = [r for r in records if "task_id" in r]
+    done = [r for r in records if not r["contended"]]
+    # Worker startup (imports, crew construction) is reported apart from the task cycles
+    cycle_start = max(ready) if ready else started_at
+    cycle = max((r["finished_at"] for r in done), default=cycle_start) - cycle_start
+    report: Dict[str, Any] = {
+        "agents": agents,
+        "max_concurrent_tasks": max_concurrent_tasks,
+        "issues": issues,
+        "tasks_done": len(done),
+        "contended_claims": len(records) - len(done),
+        "wall_seconds": wall,
+        "startup_seconds": cycle_start - started_at,
+        "cycle_seconds": cycle,
+        "tasks_per_minute": len(done) / cycle * 60 if cycle > 0 else 0.0,
+        "llm_calls": sum(r["llm_calls"] for r in done),
+        "tool_calls": sum(r["tool_calls"] for r in done),
+        "llm_prompt_bytes": sum(r["prompt_bytes"] for r in done),
+        "http": fake.totals(),
+        "http_routes": {route: dict(stats) for route, stats in sorted(fake.stats.items())},
+        "stages": {}
+    }
+    for stage in STAGES:
+        values = [r["timings"][stage] for r in records if stage in r["timings"]]
+        report["stages"][stage] = {
+            "count": len(values),
+            "mean": statistics.fmean(values) if values else 0.0,
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95)
+        }
+    return report
+
+
+def time_command(command: List[str], environment: Dict[str, str], repeat: int) -> Dict[str, Any]:
+    """Wall time of a fresh interpreter running `command`, and whether it imported crewai."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(command, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    traced = subprocess.run([sys.executable, "-X", "importtime", *command[1:]], env=environment,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "imports_crewai": any(line.split("|")[-1].strip() == "crewai" for line in traced.stderr.splitlines())
+    }
+
+
+def slowest_imports(module: str, environment: Dict[str, str], top: int = 10) -> List[Dict[str, Any]]:
+    """Packages by cumulative import time (python -X importtime); nested ones are counted inside their parent too."""
+    traced = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], env=environment,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    packages: Dict[str, int] = {}
+    for line in traced.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if "." not in name:
+            packages[name] = max(packages.get(name, 0), int(cumulative))
+    ranked = sorted(packages.items(), key=lambda item: -item[1])[:top]
+    return [{"package": name, "seconds": micros / 1e6} for name, micros in ranked]
+
+
+def bench_startup(repeat: int = 5) -> Dict[str, Any]:
+    """CLI paths every one-shot worker launch pays for, each in a fresh interpreter."""
+    fake = FakeGitHub(issues=0)
+    url = fake.start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            seed_project(workdir / "project", 0)
+            environment = {**os.environ, **bench_environment(workdir, url, fake), "PYTHONPATH": str(SRC_DIR)}
+            main = [sys.executable, str(MAIN_SCRIPT)]
+            return {
+                "commands": {
+                    "--help": time_command(main + ["--help"], environment, repeat),
+                    "--check": time_command(main + ["--check"], environment, repeat),
+                    "nothing to do": time_command(main, environment, repeat),
+                    "import crew": time_command([sys.executable, "-c", "import sissificate_dev.crew"],
+                                                environment, repeat),
+                },
+                "slowest_imports": slowest_imports("sissificate_dev.crew", environment)
+            }
+    finally:
+        fake.stop()
+
+
+def print_startup(results: Dict[str, Any]):
+    print("\n⏱️  CLI startup (fresh interpreter)")
+    print(f"{'command':<16}{'min':>9}{'median':>9}  crewai")
+    for name, r in results["commands"].items():
+        print(f"{name:<16}{r['min']:>9.3f}{r['median']:>9.3f}  {'yes' if r['imports_crewai'] else 'no'}")
+    print("   slowest imports under sissificate_dev.crew: " +
+          ", ".join(f"{i['package']} {i['seconds']:.2f}s" for i in results["slowest_imports"][:5]))
+
+
+def print_sync(results: Dict[str, Any]):
+    print(f"\n📥 Backlog sync ({results['issues']} issues)")
+    print(f"{'phase':<12}{'seconds':>10}{'written':>10}{'requests':>10}{'304s':>8}{'bytes out':>12}")
+    for phase in ("cold", "warm", "incremental"):
+        r = results[phase]
+        print(f"{phase:<12}{r['seconds']:>10.3f}{r['written']:>10}{r['requests']:>10}"
+              f"{r['not_modified']:>8}{r['bytes_out']:>12}")
+    print(f"{'query':<12}{results['query']['seconds']:>10.3f}{results['query']['rows']:>10}")
+
+
+def print_agents(report: Dict[str, Any]):
+    print(f"\n🤖 {report['agents']} agent(s): {report['tasks_done']} tasks in {report['cycle_seconds']:.2f}s "
+          f"({report['tasks_per_minute']:.1f}/min, {report['contended_claims']} lost claims); "
+          f"startup {report['startup_seconds']:.2f}s, wall {report['wall_seconds']:.2f}s")
+    print(f"   LLM calls {report['llm_calls']}, tool calls {report['tool_calls']}, "
+          f"prompt bytes {report['llm_prompt_bytes']}")
+    http = report["http"]
+    print(f"   HTTP requests {http['requests']} ({http['not_modified']} 304s), "
+          f"bytes in {http['bytes_in']}, bytes out {http['bytes_out']}")
+    print(f"   {'stage':<10}{'count':>7}{'mean':>10}{'p50':>10}{'p95':>10}")
+    for stage, stats in report["stages"].items():
+        print(f"   {stage:<10}{stats['count']:>7}{stats['mean']:>10.3f}{stats['p50']:>10.3f}{stats['p95']:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sissificate Development Crew benchmarks")
+    parser.add_argument("--scenario", choices=("all", "startup", "sync", "agents"), default="all")
+    parser.add_argument("--issues", type=int, default=200, help="Synthetic DEV- issues in the backlog (default: 200)")
+    parser.add_argument("--agents", type=int, default=4, help="Run with 1..N concurrent agents (default: 4)")
+    parser.add_argument("--tasks", type=int, default=8, help="Task cycles per agent-count run (default: 8)")
+    parser.add_argument("--llm-delay", type=float, default=0.0, help="Simulated seconds per LLM call (default: 0)")
+    parser.add_argument("--max-concurrent-tasks", type=int, default=0,
+                        help="Crew tasks each agent runs at once (default: agents.yaml; 1 = sequential)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {}
+    if args.scenario in ("all", "startup"):
+        results["startup"] = bench_startup()
+        print_startup(results["startup"])
+    if args.scenario in ("all", "sync"):
+        results["sync"] = bench_sync(args.issues)
+        print_sync(results["sync"])
+    if args.scenario in ("all", "agents"):
+        results["agents"] = []
+        for agents in range(1, args.agents + 1):
+            report = bench_agents(agents, args.issues, args.tasks, args.llm_delay, args.max_concurrent_tasks)
+            results["agents"].append(report)
+            print_agents(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Developer-first interface for autonomous agents
 """
 
 import streamlit as st
+import html
 import subprocess
 import json
 import os
@@ -12,9 +13,20 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-import requests
 from typing import Optional, List, Dict, Any
 
+from sissificate_dev import agent_runs
+from sissificate_dev.github_client import get_client
+from sissificate_dev.issue_sync import IssueMirror
+
+# Characters of each run's log kept in the session for display
+LOG_BUFFER_CHARS = 20000
+# Cards per Kanban column before "Load more"
+COLUMN_PAGE_SIZE = 25
+STATUS_ICONS = {
+    "running": "🟢", "stopping": "🟠", "completed": "✅", "failed": "❌", "stopped": "⏹️", "exited": "⚪"
+}
+
 st.set_page_config(
     page_title="Sissificate Agents",
     page_icon="🤖",
@@ -245,44 +257,96 @@ def load_env() -> Dict[str, str]:
     }
 
 
+@st.cache_resource
+def board_mirror(owner: str, repo: str) -> IssueMirror:
+    """One mirror per repository for every session and rerun; it opens a connection per call."""
+    return IssueMirror(owner, repo)
+
+
 @st.cache_resource(ttl=30)
-def fetch_github_issues(token: str, owner: str, repo: str) -> List[Dict]:
+def fetch_github_issues(token: str, owner: str, repo: str, version: int = 0) -> List[Dict]:
+    """Board issues from the mirror; `version` is only part of the cache key."""
     if not token:
         return []
-    try:
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28"
-        }
-        response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/issues",
-            headers=headers,
-            params={"state": "open", "per_page": 100}
-        )
-        if response.status_code == 200:
-            issues = response.json()
-            return [i for i in issues if i.get("title", "").startswith("DEV-")]
-        return []
-    except Exception:
-        return []
+    mirror = board_mirror(owner, repo)
+    # Live webhooks keep the mirror current; then only an occasional reconcile sync runs
+    if mirror.needs_sync():
+        try:
+            mirror.sync(get_client(token))
+        except Exception:
+            # Keep showing the last mirrored board when GitHub is unreachable
+            pass
+    issues = mirror.query(prefix="DEV-")
+    statuses = mirror.project_statuses()
+    for issue in issues:
+        if issue["number"] in statuses:
+            issue["project_status"] = statuses[issue["number"]]
+    return issues
+
+
+@st.fragment(run_every=1)
+def watch_mirror(owner: str, repo: str):
+    """Rerun the page as soon as the webhook receiver (or a sync) changes the mirror."""
+    version = board_mirror(owner, repo).version()
+    if version != st.session_state.mirror_version:
+        st.session_state.mirror_version = version
+        st.rerun()
 
 
 def categorize_tasks(issues: List[Dict]) -> Dict[str, List[Dict]]:
     ready, active, done, failed = [], [], [], []
     for issue in issues:
         labels = [l.get("name", "") for l in issue.get("labels", [])]
+        # Projects v2 Status pushed by webhooks, when there is no status label
+        project_status = issue.get("project_status")
         if "in-progress" in labels:
             active.append(issue)
         elif "done" in labels or "completed" in labels:
             done.append(issue)
         elif "failed" in labels or "blocked" in labels:
             failed.append(issue)
+        elif project_status in ("In Progress", "In QA"):
+            active.append(issue)
+        elif project_status == "Done":
+            done.append(issue)
         else:
             ready.append(issue)
     return {"ready": ready, "active": active, "done": done, "failed": failed}
 
 
+@st.cache_resource(max_entries=8)
+def categorize_cached(version: int, _issues: List[Dict]) -> Dict[str, List[Dict]]:
+    # Keyed on the mirror version the issues were fetched for: any change to them bumps it.
+    # cache_resource hands back the same columns instead of unpickling a copy every rerun
+    return categorize_tasks(_issues)
+
+
+def render_column_html(title: str, key: str, tasks: List[Dict], limit: int) -> str:
+    """One HTML block for a whole column instead of a widget per card."""
+    cards = []
+    for task in tasks[:limit]:
+        task_id, _, task_title = task["title"].partition(":")
+        task_title = task_title.strip() or task["title"]
+        is_selected = st.session_state.selected_task == task_id
+        short_title = task_title[:40] + ("..." if len(task_title) > 40 else "")
+        cards.append(f"""<div class="task-card {'selected' if is_selected else ''}">
+<div class="task-id">{html.escape(task_id)}</div>
+<div class="task-title">{html.escape(short_title)}</div>
+<div class="task-meta"><span>#{task['number']}</span>
+<a href="{html.escape(task.get('html_url') or '#')}" target="_blank">🔗</a></div>
+</div>""")
+    if not cards:
+        cards.append("""<div class="empty-state">
+<div class="empty-state-icon">📭</div>
+<div>No tasks</div>
+</div>""")
+    shown = f"{min(limit, len(tasks))}/{len(tasks)}" if len(tasks) > limit else str(len(tasks))
+    return f"""<div class="kanban-column">
+<div class="kanban-header {key}"><span>{title}</span><span>{shown}</span></div>
+{''.join(cards)}
+</div>"""
+
+
 def save_env(env: Dict[str, str]):
     env_content = f"""OPENAI_API_KEY={env['openai_key']}
 GITHUB_TOKEN={env['github_token']}
@@ -301,14 +365,14 @@ def main():
         st.session_state.selected_task = None
     if "command_input" not in st.session_state:
         st.session_state.command_input = ""
-    if "agents" not in st.session_state:
-        st.session_state.agents = []
-    if "logs" not in st.session_state:
-        st.session_state.logs = []
+    if "log_tails" not in st.session_state:
+        st.session_state.log_tails = {}
     if "show_config" not in st.session_state:
         st.session_state.show_config = False
     
     env = load_env()
+    if "mirror_version" not in st.session_state:
+        st.session_state.mirror_version = board_mirror(env["github_owner"], env["github_repo"]).version()
     
     with st.container():
         st.markdown("""
@@ -320,8 +384,10 @@ def main():
         if not env["openai_key"] or not env["github_token"]:
             st.warning("⚠️ Configuration required - Click ⚙️ Settings below")
     
-    issues = fetch_github_issues(env["github_token"], env["github_owner"], env["github_repo"])
-    categorized = categorize_tasks(issues)
+    issues = fetch_github_issues(env["github_token"], env["github_owner"], env["github_repo"],
+                                 st.session_state.mirror_version)
+    watch_mirror(env["github_owner"], env["github_repo"])
+    categorized = categorize_cached(st.session_state.mirror_version, issues)
     
     total_ready = len(categorized["ready"])
     total_active = len(categorized["active"])
@@ -394,7 +460,7 @@ def main():
             st.cache_resource.clear()
             st.rerun()
         elif cmd_lower == "clear":
-            st.session_state.logs = []
+            clear_logs()
             st.toast("Logs cleared", icon="🗑️")
     
     if st.session_state.get("show_config"):
@@ -424,6 +490,8 @@ def main():
                     "project_path": project_path
                 })
                 save_env(env)
+                # The cached mirror, board and columns belong to the old token and repository
+                st.cache_resource.clear()
                 st.toast("Configuration saved!", icon="✅")
                 st.session_state.show_config = False
                 st.rerun()
@@ -440,48 +508,22 @@ def main():
     ]
     
     for col, (title, key, tasks, color) in zip([c1, c2, c3, c4], columns):
+        limit_key = f"column_limit_{key}"
+        limit = st.session_state.setdefault(limit_key, COLUMN_PAGE_SIZE)
         with col:
-            st.markdown(f"""
-            <div class="kanban-column">
-                <div class="kanban-header {key}">
-                    <span>{title}</span>
-                    <span>{len(tasks)}</span>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(render_column_html(title, key, tasks, limit), unsafe_allow_html=True)
             
-            if not tasks:
-                st.markdown("""
-                <div class="empty-state">
-                    <div class="empty-state-icon">📭</div>
-                    <div>No tasks</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                for task in tasks:
-                    task_id = task["title"].split(":")[0]
-                    task_title = ":".join(task["title"].split(":")[1:]).strip() if ":" in task["title"] else task["title"]
-                    is_selected = st.session_state.selected_task == task_id
-                    
-                    with st.container():
-                        st.markdown(f"""
-                        <div class="task-card {'selected' if is_selected else ''}" 
-                             onclick="this.classList.toggle('selected')">
-                            <div class="task-id">{task_id}</div>
-                            <div class="task-title">{task_title[:40]}{'...' if len(task_title) > 40 else ''}</div>
-                            <div class="task-meta">
-                                <span>#{task['number']}</span>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if key == "ready":
-                            btn_col1, btn_col2 = st.columns(2)
-                            with btn_col1:
-                                if st.button("▶️", key=f"launch_{task['number']}", help="Launch agent"):
-                                    st.session_state.selected_task = task_id
-                                    st.session_state.show_launch = True
-                            with btn_col2:
-                                st.link_button("🔗", task["html_url"], help="View on GitHub")
+            if key == "ready" and tasks:
+                visible = [task["title"].split(":")[0] for task in tasks[:limit]]
+                choice = st.selectbox("Task", visible, key="ready_choice", label_visibility="collapsed")
+                if st.button("▶️ Launch", key="launch_selected", help="Launch agent", use_container_width=True):
+                    st.session_state.selected_task = choice
+                    st.session_state.show_launch = True
+            
+            if len(tasks) > limit:
+                if st.button(f"Load more ({len(tasks) - limit})", key=f"more_{key}", use_container_width=True):
+                    st.session_state[limit_key] = limit + COLUMN_PAGE_SIZE
+                    st.rerun()
     
     st.markdown("---")
     
@@ -503,23 +545,10 @@ def main():
                     if not env["openai_key"]:
                         st.error("❌ OpenAI API key not configured")
                     else:
-                        cmd = ["python", "src/sissificate_dev/main.py", "--task", task_id, "--agent-id", str(agent_id)]
-                        if epic:
-                            cmd.extend(["--epic", epic])
-                        if dry_run:
-                            cmd.append("--dry-run")
-                        
-                        st.code(" ".join(cmd), language="bash")
-                        
-                        st.session_state.agents.append({
-                            "id": len(st.session_state.agents) + 1,
-                            "task": task_id,
-                            "agent_id": agent_id,
-                            "status": "pending",
-                            "started": datetime.now().strftime("%H:%M:%S")
-                        })
-                        
-                        st.toast(f"🚀 Agent launched for {task_id}!", icon="✅")
+                        run = agent_runs.launch(task_id=task_id, agent_id=str(agent_id), epic=epic or None,
+                                                dry_run=dry_run)
+                        st.code(run["command"], language="bash")
+                        st.toast(f"🚀 Agent launched for {task_id} (pid {run['pid']})", icon="✅")
                         st.session_state.show_launch = False
             
             with b2:
@@ -528,23 +557,7 @@ def main():
                     st.rerun()
     
     st.markdown("### 🤖 Active Agents")
-    
-    if st.session_state.agents:
-        for agent in st.session_state.agents:
-            c1, c2, c3, c4 = st.columns([1, 3, 2, 1])
-            with c1:
-                status_icon = {"running": "🟢", "completed": "✅", "failed": "❌", "pending": "⚪"}.get(agent["status"], "⚪")
-                st.write(f"{status_icon} Agent {agent['agent_id']}")
-            with c2:
-                st.write(f"**{agent['task']}**")
-            with c3:
-                st.write(agent["started"])
-            with c4:
-                if agent["status"] == "running":
-                    if st.button("⏹️", key=f"stop_{agent['id']}"):
-                        agent["status"] = "stopped"
-    else:
-        st.info("No agents running. Select a task from the Kanban board to launch.")
+    render_agents()
     
     st.markdown("### 📜 Recent Logs")
     
@@ -555,20 +568,62 @@ def main():
             st.rerun()
     with log_col3:
         if st.button("🗑️ Clear", use_container_width=True):
-            st.session_state.logs = []
+            clear_logs()
     
-    if not st.session_state.logs:
-        st.session_state.logs = [
-            {"time": datetime.now().strftime("%H:%M:%S"), "level": "INFO", "message": "Control panel initialized"},
-        ]
-    
-    log_text = ""
-    for log in st.session_state.logs[-20:]:
-        color = {"INFO": "#888", "WARNING": "#eab308", "ERROR": "#ef4444", "DEBUG": "#666"}.get(log["level"], "#888")
-        log_text += f'<span style="color:{color}">[{log["time"]}] [{log["level"]}] {log["message"]}</span><br>'
-    
-    st.markdown(f'<div class="log-panel">{log_text}</div>', unsafe_allow_html=True)
+    render_logs()
+
+
+@st.fragment(run_every=2)
+def render_agents():
+    """Runs from the shared registry; refreshes on its own without rerunning the page."""
+    agent_runs.refresh()
+    runs = agent_runs.list_runs(limit=12)
+    if not runs:
+        st.info("No agents running. Select a task from the Kanban board to launch.")
+        return
+    
+    for run in runs:
+        c1, c2, c3, c4 = st.columns([1, 3, 2, 1])
+        with c1:
+            st.write(f"{STATUS_ICONS.get(run['status'], '⚪')} Agent {run['agent_id']}")
+        with c2:
+            st.write(f"**{run['task_id'] or 'Auto-select'}** · pid {run['pid']}")
+        with c3:
+            started = datetime.fromtimestamp(run["started_at"]).strftime("%H:%M:%S")
+            st.write(f"{started} · {run['status']}")
+        with c4:
+            if run["status"] == "running":
+                if st.button("⏹️", key=f"stop_{run['run_id']}", help="Stop agent"):
+                    agent_runs.stop(run["run_id"])
+                    st.toast(f"🛑 Stopping agent {run['agent_id']}", icon="⏹️")
+
+
+def clear_logs():
+    # Keep the offsets so cleared output is not read again
+    for tail_state in st.session_state.get("log_tails", {}).values():
+        tail_state["text"] = ""
+
 
+@st.fragment(run_every=1)
+def render_logs():
+    """Tail each recent run's log from the last byte offset read."""
+    runs = agent_runs.list_runs(limit=6)
+    if not runs:
+        st.markdown('<div class="log-panel"><span style="color:#888">No agent runs yet</span></div>',
+                    unsafe_allow_html=True)
+        return
+    
+    tails = st.session_state.setdefault("log_tails", {})
+    tabs = st.tabs([f"{STATUS_ICONS.get(r['status'], '⚪')} {r['task_id'] or 'Agent ' + r['agent_id']}" for r in runs])
+    for tab, run in zip(tabs, runs):
+        state = tails.setdefault(run["run_id"], {"offset": 0, "text": ""})
+        text, state["offset"] = agent_runs.tail(run["log_path"], state["offset"])
+        if text:
+            state["text"] = (state["text"] + text)[-LOG_BUFFER_CHARS:]
+        with tab:
+            body = html.escape(state["text"]) or '<span style="color:#666">Waiting for output...</span>'
+            st.markdown(f'<div class="log-panel" style="white-space: pre-wrap">{body}</div>',
+                        unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
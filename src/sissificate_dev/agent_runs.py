@@ -0,0 +1,232 @@
+"""
+Agent process registry
+Launches main.py as detached agent processes, records them in a host-wide
+SQLite registry that outlives panel reruns and sessions, stops them, and
+tails their per-run logs by byte offset
+"""
+
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sissificate_dev.settings import cache_dir
+
+MAIN_SCRIPT = Path(__file__).resolve().parent / "main.py"
+# Runs start from the crew checkout so main.py finds its .env
+CREW_ROOT = Path(__file__).resolve().parents[2]
+STOP_GRACE = 10.0
+TAIL_CHUNK = 64 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    task_id TEXT,
+    agent_id TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    command TEXT NOT NULL,
+    log_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    exit_code INTEGER,
+    started_at REAL NOT NULL,
+    stop_requested_at REAL,
+    ended_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs (status);
+"""
+
+# Popen handles of the runs this process started, so their exit codes can be collected
+_children: Dict[int, subprocess.Popen] = {}
+
+
+def logs_dir() -> Path:
+    path = cache_dir() / "agent-logs"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(cache_dir() / "agent-runs.sqlite3", timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        yield conn
+    finally:
+        conn.close()
+
+
+def launch(task_id: Optional[str] = None, agent_id: str = "1", epic: Optional[str] = None,
+           dry_run: bool = False, extra_args: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Start an agent in its own session with output going to a per-run log file.
+
+    Returns:
+        The registry row of the new run
+    """
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    log_path = logs_dir() / f"{run_id}.log"
+    command = [sys.executable, "-u", str(MAIN_SCRIPT), "--agent-id", str(agent_id)]
+    if task_id:
+        command += ["--task", task_id]
+    if epic:
+        command += ["--epic", epic]
+    if dry_run:
+        command.append("--dry-run")
+    command += extra_args or []
+
+    with open(log_path, "ab") as log:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            cwd=CREW_ROOT,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            # Own session: the run survives panel restarts and stop() can signal its whole tree
+            start_new_session=True
+        )
+    _children[process.pid] = process
+
+    with _connect() as conn:
+        conn.execute(
+            "INSERT INTO runs (run_id, task_id, agent_id, pid, command, log_path, status, started_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, 'running', ?)",
+            (run_id, task_id, str(agent_id), process.pid, " ".join(command), str(log_path), time.time())
+        )
+        conn.commit()
+    return get_run(run_id)
+
+
+def _exit_status(pid: int) -> Tuple[bool, Optional[int]]:
+    """(still running, exit code if known) for a run's pid."""
+    child = _children.get(pid)
+    if child is not None:
+        code = child.poll()
+        if code is None:
+            return True, None
+        _children.pop(pid, None)
+        return False, code
+
+    # Started by another panel session: reap it if it is our child, else just probe it
+    try:
+        waited, status = os.waitpid(pid, os.WNOHANG)
+        if waited:
+            return False, os.waitstatus_to_exitcode(status)
+        return True, None
+    except ChildProcessError:
+        pass
+    try:
+        os.kill(pid, 0)
+        return True, None
+    except ProcessLookupError:
+        return False, None
+    except PermissionError:
+        return True, None
+
+
+def _kill_group(pid: int, sig: int):
+    try:
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def refresh(grace: float = STOP_GRACE) -> int:
+    """
+    Mark runs whose process has exited, and force-kill runs that ignored a
+    stop for longer than `grace` seconds. Returns how many runs changed.
+    """
+    changed = 0
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT run_id, pid, status, stop_requested_at FROM runs WHERE status IN ('running', 'stopping')"
+        ).fetchall()
+        for row in rows:
+            alive, code = _exit_status(row["pid"])
+            if alive:
+                if row["status"] == "stopping" and time.time() - row["stop_requested_at"] > grace:
+                    _kill_group(row["pid"], signal.SIGKILL)
+                continue
+            if row["status"] == "stopping":
+                status = "stopped"
+            elif code is None:
+                status = "exited"
+            else:
+                status = "completed" if code == 0 else "failed"
+            conn.execute("UPDATE runs SET status = ?, exit_code = ?, ended_at = ? WHERE run_id = ?",
+                         (status, code, time.time(), row["run_id"]))
+            changed += 1
+        conn.commit()
+    return changed
+
+
+def get_run(run_id: str) -> Optional[Dict[str, Any]]:
+    with _connect() as conn:
+        row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def list_runs(limit: int = 50, active_only: bool = False) -> List[Dict[str, Any]]:
+    """Most recent runs first."""
+    query = "SELECT * FROM runs"
+    if active_only:
+        query += " WHERE status IN ('running', 'stopping')"
+    with _connect() as conn:
+        rows = conn.execute(query + " ORDER BY started_at DESC LIMIT ?", (limit,)).fetchall()
+    return [dict(row) for row in rows]
+
+
+def stop(run_id: str) -> bool:
+    """
+    Ask a run to stop with SIGTERM to its process group, without waiting.
+
+    The agent releases its lease and GitHub claim on SIGTERM; refresh()
+    kills it outright if it is still alive after the grace period.
+    Returns False if the run was no longer active.
+    """
+    run = get_run(run_id)
+    if not run or run["status"] not in ("running", "stopping"):
+        return False
+    with _connect() as conn:
+        conn.execute("UPDATE runs SET status = 'stopping', stop_requested_at = ? WHERE run_id = ?",
+                     (time.time(), run_id))
+        conn.commit()
+    _kill_group(run["pid"], signal.SIGTERM)
+    return True
+
+
+def tail(log_path: str, offset: int = 0, limit: int = TAIL_CHUNK) -> Tuple[str, int]:
+    """
+    Bytes of a log written since `offset`.
+
+    Returns:
+        (new text, offset to pass next time); the first call of a long log
+        starts `limit` bytes from the end instead of at 0
+    """
+    try:
+        size = os.path.getsize(log_path)
+    except OSError:
+        return "", offset
+    if size < offset:
+        # Log was truncated or replaced; start over
+        offset = 0
+    if size - offset > limit:
+        offset = size - limit
+    if size == offset:
+        return "", offset
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        data = f.read(size - offset)
+    # Hold back a partial last line (and any split UTF-8 sequence) until it is complete
+    end = data.rfind(b"\n")
+    if end != -1:
+        data = data[:end + 1]
+    return data.decode("utf-8", errors="replace"), offset + len(data)
@@ -0,0 +1,263 @@
+"""
+Record/replay cassettes for crew runs
+Record mode appends every LLM exchange and tool call of a run to a JSONL file;
+replay mode feeds them back with no API keys, network access or subprocesses
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.agent_utils import extract_tool_call_info
+from pydantic import Field
+
+from sissificate_dev.llm import DelegatingLLM
+from sissificate_dev.llm_cache import cache_key
+
+CASSETTE_VERSION = 3
+
+
+class CassetteMiss(Exception):
+    """Raised when replay needs an LLM response the cassette does not have."""
+
+
+class Cassette:
+    """
+    One recorded crew run.
+
+    Lines are {"kind": "meta" | "route" | "llm" | "tool", ...}. Every LLM
+    stack the crew routes to (one per model chain) gets a "route" line with
+    its model and capabilities, and its exchanges carry the route key. An
+    "llm" response is text, or a list of native tool calls in OpenAI's shape. Replay matches LLM
+    requests by content hash and tool calls by name + arguments; a request
+    that changed since recording (e.g. an edited prompt) gets the next unused
+    response of the same route in recorded order instead.
+    """
+
+    def __init__(self, path: str, mode: str, meta: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.mode = mode
+        self.meta: Dict[str, Any] = meta or {}
+        # Route key -> {"model", "supports_stop_words", "supports_function_calling", "context_window_size"}
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.llm_entries: List[Dict[str, Any]] = []
+        self.llm_by_key: Dict[str, Deque[int]] = defaultdict(deque)
+        self.llm_used: set = set()
+        self.llm_next: Dict[Optional[str], int] = defaultdict(int)
+        self.tools: Dict[str, Deque[Any]] = defaultdict(deque)
+        self.stats = {"llm_calls": 0, "llm_misses": 0, "tool_calls": 0, "tool_misses": 0}
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def inputs(self) -> Dict[str, Any]:
+        return self.meta.get("inputs", {})
+
+    @classmethod
+    def record(cls, path: str, inputs: Dict[str, Any], **meta: Any) -> "Cassette":
+        """Start a new cassette, overwriting any file at path."""
+        cassette = cls(path, "record", {
+            "version": CASSETTE_VERSION, "inputs": inputs, "recorded_at": time.time(), **meta
+        })
+        cassette.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cassette.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"kind": "meta", **cassette.meta}, default=str) + "\n")
+        return cassette
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Open a recorded cassette for replay."""
+        cassette = cls(path, "replay")
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                kind = entry.pop("kind")
+                if kind == "meta":
+                    cassette.meta.update(entry)
+                elif kind == "route":
+                    cassette.routes[entry.pop("key")] = entry
+                elif kind == "llm":
+                    cassette.llm_by_key[entry["key"]].append(len(cassette.llm_entries))
+                    cassette.llm_entries.append(entry)
+                elif kind == "tool":
+                    cassette.tools[tool_key(entry["name"], entry["args"])].append(entry["result"])
+        return cassette
+
+    def _append(self, entry: Dict[str, Any]):
+        # One line per entry, flushed right away, so a crashed run still leaves a usable prefix
+        with self.lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+    def update_meta(self, **meta: Any):
+        self.meta.update(meta)
+        if not self.replaying:
+            self._append({"kind": "meta", **meta})
+
+    def update_route(self, route: str, **info: Any):
+        """Model and capabilities of one LLM stack, for replaying its exchanges."""
+        self.routes[route] = info
+        if not self.replaying:
+            self._append({"kind": "route", "key": route, **info})
+
+    def record_llm(self, key: str, model: str, response: Any, route: Optional[str] = None):
+        self._append({"kind": "llm", "key": key, "model": model, "route": route, "response": response})
+
+    def replay_llm(self, key: str, route: Optional[str] = None) -> Any:
+        with self.lock:
+            self.stats["llm_calls"] += 1
+            matches = self.llm_by_key.get(key)
+            while matches and matches[0] in self.llm_used:
+                matches.popleft()
+            if matches:
+                index = matches.popleft()
+            else:
+                self.stats["llm_misses"] += 1
+                # Cassettes from before routes were recorded have no route on their entries
+                same_route = any(entry.get("route") == route for entry in self.llm_entries)
+                index = self.llm_next[route]
+                while index < len(self.llm_entries) and (
+                    index in self.llm_used or (same_route and self.llm_entries[index].get("route") != route)
+                ):
+                    index += 1
+                self.llm_next[route] = index
+                if index >= len(self.llm_entries):
+                    raise CassetteMiss(f"No recorded LLM response left for route {route} in {self.path}")
+            self.llm_used.add(index)
+            return self.llm_entries[index]["response"]
+
+    def record_tool(self, name: str, args: Dict[str, Any], result: Any):
+        self._append({"kind": "tool", "name": name, "args": args, "result": result})
+
+    def replay_tool(self, name: str, args: Dict[str, Any]) -> Any:
+        with self.lock:
+            self.stats["tool_calls"] += 1
+            results = self.tools.get(tool_key(name, args))
+            if results:
+                return results.popleft()
+            self.stats["tool_misses"] += 1
+            return f"Error: no recorded result for {name}({json.dumps(args, default=str)})"
+
+
+def tool_key(name: str, args: Dict[str, Any]) -> str:
+    return f"{name}:{json.dumps(args, sort_keys=True, default=str)}"
+
+
+def tool_call_entries(tool_calls: List[Any]) -> List[Dict[str, Any]]:
+    """Native tool calls of any provider as OpenAI-style dicts, which crewai reads back the same way."""
+    entries = []
+    for tool_call in tool_calls:
+        info = extract_tool_call_info(tool_call)
+        if info is None:
+            raise CassetteMiss(f"Cannot record a {type(tool_call).__name__} tool call")
+        call_id, name, args = info
+        entries.append({"id": call_id, "type": "function", "function": {
+            "name": name, "arguments": args if isinstance(args, str) else json.dumps(args)
+        }})
+    return entries
+
+
+_active: Optional[Cassette] = None
+
+
+def use_cassette(cassette: Optional[Cassette]):
+    """Route every @recorded tool through this cassette (None to turn it off)."""
+    global _active
+    _active = cassette
+
+
+def active_cassette() -> Optional[Cassette]:
+    return _active
+
+
+def recorded(func: Callable) -> Callable:
+    """
+    Make a tool function recordable. Goes under @tool so crewai still sees the
+    original signature and docstring.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cassette = _active
+        if cassette is None:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        call_args = dict(bound.arguments)
+        if cassette.replaying:
+            return cassette.replay_tool(func.__name__, call_args)
+        result = func(*args, **kwargs)
+        cassette.record_tool(func.__name__, call_args, result)
+        return result
+
+    return wrapper
+
+
+class RecordingLLM(DelegatingLLM):
+    """Writes every text or tool-call response of the inner LLM to a cassette."""
+
+    cassette: Any = Field(default=None, exclude=True)
+    route: Optional[str] = None
+
+    def call(self, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+             callbacks: Optional[List[Any]] = None, available_functions: Optional[Dict[str, Any]] = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        response = self.delegate(messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        if isinstance(response, list) and response:
+            recorded_response: Any = tool_call_entries(response)
+        elif isinstance(response, str):
+            recorded_response = response
+        else:
+            raise CassetteMiss(f"Cannot record a {type(response).__name__} response; "
+                               "only text and tool-call responses are supported")
+        self.cassette.record_llm(cache_key(self.model, messages, tools, self.stop_sequences, response_model),
+                                 self.model, recorded_response, route=self.route)
+        return response
+
+    call._crewai_rate_limit_wrapped = True
+
+
+class ReplayLLM(BaseLLM):
+    """Answers one route's exchanges from a cassette; never touches the network."""
+
+    cassette: Any = Field(default=None, exclude=True)
+    route: Optional[str] = None
+
+    def __init__(self, cassette: Cassette, route: Optional[str] = None, **kwargs: Any):
+        # Requests are matched by a hash that includes the model the route was recorded with
+        model = cassette.routes.get(route, {}).get("model") or cassette.meta.get("model", "replay")
+        super().__init__(model=model, cassette=cassette, route=route, **kwargs)
+
+    @property
+    def _route_info(self) -> Dict[str, Any]:
+        return self.cassette.routes.get(self.route) or self.cassette.meta
+
+    def call(self, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+             callbacks: Optional[List[Any]] = None, available_functions: Optional[Dict[str, Any]] = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        key = cache_key(self.model, messages, tools, self.stop_sequences, response_model)
+        return self.cassette.replay_llm(key, route=self.route if self.route in self.cassette.routes else None)
+
+    call._crewai_rate_limit_wrapped = True
+
+    def supports_function_calling(self) -> bool:
+        # Cassettes from before tool calls were recorded only hold ReAct text exchanges
+        return self._route_info.get("supports_function_calling", False)
+
+    def supports_stop_words(self) -> bool:
+        return self._route_info.get("supports_stop_words", True)
+
+    def get_context_window_size(self) -> int:
+        return self._route_info.get("context_window_size", super().get_context_window_size())
@@ -0,0 +1,384 @@
+"""
+Trigram code-search index
+An on-disk inverted index of the shared checkout, shared by every agent on the
+host. It honors .gitignore (via git ls-files) and updates incrementally from
+mtimes; a task's worktree searches it plus the files that differ from the checkout
+"""
+
+import fnmatch
+import hashlib
+import os
+import re
+import sqlite3
+import subprocess
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sissificate_dev.settings import cache_dir, project_path, workspace_path
+
+MAX_FILE_BYTES = 1024 * 1024
+# Minimum seconds between freshness checks of the tree, across all processes
+REFRESH_INTERVAL = 5.0
+# Any subset of a query's trigrams is a valid filter; cap it to keep the SQL small
+MAX_QUERY_TRIGRAMS = 64
+# Index databases untouched for this long may be pruned once their tree is gone
+PRUNE_AGE = 60.0
+SKIP_DIRS = {".git", "node_modules", ".next", "dist", "build", "coverage", ".turbo", ".vercel"}
+# A counted repetition; {0,n} makes the atom before it optional
+REPEAT = re.compile(r"\{(\d*)(?:,(\d*))?\}")
+# A whole escape sequence: \xhh, \uhhhh, \Uhhhhhhhh, \N{name}, octal, backreference or one character
+ESCAPE = re.compile(r"\\(?:x[0-9a-fA-F]{0,2}|u[0-9a-fA-F]{0,4}|U[0-9a-fA-F]{0,8}|N\{[^}]*\}|0[0-7]{0,2}|"
+                    r"[0-7]{3}|[1-9][0-9]?|.)?", re.DOTALL)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    trigram INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_file ON postings (file_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def trigrams(text: str) -> Set[int]:
+    """Case-folded trigrams packed into integers (3 x 21-bit code points)."""
+    text = text.lower()
+    return {
+        (ord(text[i]) << 42) | (ord(text[i + 1]) << 21) | ord(text[i + 2])
+        for i in range(len(text) - 2)
+    }
+
+
+def _skip_group(pattern: str, i: int, opening: str, closing: str) -> int:
+    """Index just past the bracket or parenthesis that closes the one at i."""
+    depth = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[" and opening == "(":
+            i = _skip_group(pattern, i, "[", "]")
+            continue
+        if char == opening and (opening == "(" or depth == 0):
+            depth += 1
+            # A ] right after [ or [^ is part of the class
+            if opening == "[":
+                i += 1
+                if pattern[i:i + 1] == "^":
+                    i += 1
+                if pattern[i:i + 1] == "]":
+                    i += 1
+                continue
+        elif char == closing:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def literal_fragments(pattern: str) -> List[str]:
+    """
+    Literal runs every match of a regex must contain. Classes, groups and any
+    atom an optional quantifier applies to break a run instead of joining it;
+    alternation or verbose mode yields none, so every file is scanned.
+    """
+    if "|" in pattern or re.search(r"\(\?[a-zA-Z]*x", pattern):
+        return []
+    fragments: List[str] = []
+    current: List[str] = []
+
+    def cut():
+        if len(current) >= 3:
+            fragments.append("".join(current))
+        current.clear()
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        repeat = REPEAT.match(pattern, i) if char == "{" else None
+        if char == "\\":
+            # Escapes are never part of a run: \d or \b match no fixed text, and the
+            # payload of \x41 or \101 is not the text it matches
+            cut()
+            i = ESCAPE.match(pattern, i).end()
+        elif char in "?*" or (repeat and not (repeat.group(1) or "0").strip("0")):
+            # The atom before an optional quantifier may be absent from a match
+            if current:
+                current.pop()
+            cut()
+            i = repeat.end() if repeat else i + 1
+        elif char == "+" or repeat:
+            # At least one copy of the atom is there, but what follows is not adjacent to it
+            cut()
+            i = repeat.end() if repeat else i + 1
+        elif char in "[(":
+            cut()
+            i = _skip_group(pattern, i, char, "]" if char == "[" else ")")
+        elif char in ".^$)]":
+            cut()
+            i += 1
+        else:
+            current.append(char)
+            i += 1
+    cut()
+    return fragments
+
+
+def list_project_files(root: str) -> List[str]:
+    """Tracked and untracked-but-not-ignored files, relative to root."""
+    try:
+        output = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root, capture_output=True, check=True
+        ).stdout
+        return [p for p in output.decode("utf-8", errors="replace").split("\0") if p]
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        pass
+
+    # Not a git checkout: walk the tree, skipping build output and top-level .gitignore patterns
+    ignored: List[str] = []
+    gitignore = os.path.join(root, ".gitignore")
+    if os.path.exists(gitignore):
+        with open(gitignore, "r", encoding="utf-8") as f:
+            ignored = [line.strip().strip("/") for line in f if line.strip() and not line.startswith("#")]
+
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in SKIP_DIRS and not any(fnmatch.fnmatch(d, pattern) for pattern in ignored)
+        ]
+        for name in filenames:
+            rel_path = os.path.normpath(os.path.join(rel_dir, name))
+            if not any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(rel_path, p) for p in ignored):
+                files.append(rel_path)
+    return files
+
+
+def _git_paths(root: str, *args: str) -> Set[str]:
+    output = subprocess.run(["git", *args, "-z"], cwd=root, capture_output=True, check=True).stdout
+    return {p for p in output.decode("utf-8", errors="replace").split("\0") if p}
+
+
+def changed_paths(root: str, workspace: str) -> Optional[Set[str]]:
+    """
+    Paths whose content in `workspace` (a worktree of `root`) may differ from
+    the indexed `root`, or None if git cannot tell.
+    """
+    try:
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+        paths = _git_paths(workspace, "diff", "--name-only", "--no-renames", head)
+        paths |= _git_paths(workspace, "ls-files", "--others", "--exclude-standard")
+        # The checkout's own uncommitted edits are indexed but not in the worktree
+        paths |= _git_paths(root, "diff", "--name-only", "--no-renames", "HEAD")
+        paths |= _git_paths(root, "ls-files", "--others", "--exclude-standard")
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    return paths
+
+
+def index_path(root: str) -> Path:
+    """Database file of the index of one tree."""
+    digest = hashlib.sha1(os.path.realpath(root).encode()).hexdigest()[:12]
+    return cache_dir() / f"code-index-{digest}.sqlite3"
+
+
+def prune_indexes() -> int:
+    """Delete index databases whose tree is gone (e.g. per-worktree ones); returns how many."""
+    removed = 0
+    for database in cache_dir().glob("code-index-*.sqlite3"):
+        try:
+            if time.time() - database.stat().st_mtime < PRUNE_AGE:
+                continue
+            conn = sqlite3.connect(database, timeout=1)
+            try:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'root'").fetchone()
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error):
+            continue
+        if row and os.path.isdir(row[0]):
+            continue
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{database}{suffix}").unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+class CodeIndex:
+    """
+    Trigram index of the shared checkout, searched from the current workspace.
+
+    When the workspace is a task's worktree, files it changed relative to the
+    checkout are scanned directly instead of being looked up in the index.
+    """
+
+    def __init__(self, root: Optional[str] = None, db_path: Optional[Path] = None,
+                 workspace: Optional[str] = None):
+        self.root = os.path.realpath(root or project_path())
+        self.workspace = os.path.realpath(workspace or (root if root else workspace_path()))
+        self.db_path = Path(db_path) if db_path else index_path(self.root)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('root', ?)", (self.root,))
+            conn.commit()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def _read(self, rel_path: str, tree: Optional[str] = None) -> Optional[str]:
+        try:
+            with open(os.path.join(tree or self.root, rel_path), "rb") as f:
+                data = f.read(MAX_FILE_BYTES + 1)
+        except OSError:
+            return None
+        if len(data) > MAX_FILE_BYTES or b"\0" in data[:8192]:
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the index in line with the tree.
+
+        Only files whose mtime or size changed are re-read. The check itself is
+        skipped if another agent refreshed within REFRESH_INTERVAL seconds.
+
+        Returns:
+            Counts of indexed, removed and unchanged files
+        """
+        stats = {"indexed": 0, "removed": 0, "unchanged": 0}
+        with self._connect() as conn:
+            # BEGIN IMMEDIATE makes concurrent refreshes queue up instead of duplicating work
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'refreshed_at'").fetchone()
+            if not force and row and time.time() - float(row[0]) < REFRESH_INTERVAL:
+                conn.rollback()
+                return stats
+
+            known = {path: (file_id, mtime, size) for file_id, path, mtime, size in
+                     conn.execute("SELECT id, path, mtime_ns, size FROM files")}
+            seen = set()
+            for rel_path in list_project_files(self.root):
+                try:
+                    stat = os.stat(os.path.join(self.root, rel_path))
+                except OSError:
+                    continue
+                seen.add(rel_path)
+                existing = known.get(rel_path)
+                if existing and existing[1] == stat.st_mtime_ns and existing[2] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+
+                if existing:
+                    conn.execute("DELETE FROM postings WHERE file_id = ?", (existing[0],))
+                    conn.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                                 (stat.st_mtime_ns, stat.st_size, existing[0]))
+                    file_id = existing[0]
+                else:
+                    file_id = conn.execute("INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                                           (rel_path, stat.st_mtime_ns, stat.st_size)).lastrowid
+
+                content = self._read(rel_path)
+                if content is not None:
+                    conn.executemany("INSERT OR IGNORE INTO postings (trigram, file_id) VALUES (?, ?)",
+                                     ((t, file_id) for t in trigrams(content)))
+                stats["indexed"] += 1
+
+            for rel_path, (file_id, _, _) in known.items():
+                if rel_path not in seen:
+                    conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+                    conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                    stats["removed"] += 1
+
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)", (str(time.time()),))
+            conn.commit()
+        return stats
+
+    def _candidates(self, conn: sqlite3.Connection, required: Set[int]) -> List[str]:
+        required = set(sorted(required)[:MAX_QUERY_TRIGRAMS])
+        if not required:
+            return [row[0] for row in conn.execute("SELECT path FROM files")]
+        placeholders = ",".join("?" * len(required))
+        return [row[0] for row in conn.execute(
+            f"""SELECT files.path FROM postings JOIN files ON files.id = postings.file_id
+                WHERE postings.trigram IN ({placeholders})
+                GROUP BY postings.file_id HAVING COUNT(*) = ?""",
+            (*required, len(required))
+        )]
+
+    def search(self, query: str, regex: bool = False, path_glob: str = "",
+               max_results: int = 50, refresh: bool = True) -> List[Tuple[str, int, str]]:
+        """
+        Find lines matching a literal string (case-insensitive) or a regex.
+
+        Returns:
+            (path, line number, line) hits; files whose path matches the query
+            come first, then files with the most hits
+        """
+        if refresh:
+            self.refresh()
+
+        if regex:
+            matcher = re.compile(query, re.IGNORECASE)
+            required: Set[int] = set()
+            for fragment in literal_fragments(query):
+                required |= trigrams(fragment)
+        else:
+            matcher = re.compile(re.escape(query), re.IGNORECASE)
+            required = trigrams(query)
+
+        with self._connect() as conn:
+            candidates = self._candidates(conn, required)
+        if self.workspace != self.root:
+            overlay = changed_paths(self.root, self.workspace)
+            if overlay is None:
+                candidates = list_project_files(self.workspace)
+            else:
+                candidates = [path for path in candidates if path not in overlay] + sorted(overlay)
+
+        ranked = []
+        for rel_path in candidates:
+            if path_glob and not fnmatch.fnmatch(rel_path, path_glob):
+                continue
+            content = self._read(rel_path, self.workspace)
+            if content is None:
+                continue
+            hits = [
+                (rel_path, number, line.strip()[:200])
+                for number, line in enumerate(content.splitlines(), start=1)
+                if matcher.search(line)
+            ]
+            if hits:
+                in_path = bool(matcher.search(rel_path))
+                ranked.append((not in_path, -len(hits), rel_path, hits))
+
+        ranked.sort()
+        results: List[Tuple[str, int, str]] = []
+        for _, _, _, hits in ranked:
+            results.extend(hits[:max_results - len(results)])
+            if len(results) >= max_results:
+                break
+        return results
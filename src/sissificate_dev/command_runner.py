@@ -0,0 +1,179 @@
+"""
+Streaming command execution
+Runs shell commands with output streamed to a per-run log file, bounded
+memory (head + ring-buffered tail), and separate idle/total timeouts
+"""
+
+import os
+import selectors
+import signal
+import subprocess
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sissificate_dev.settings import cache_dir
+from sissificate_dev.tracing import annotate
+
+DEFAULT_TIMEOUT = int(os.environ.get("SISSIFICATE_COMMAND_TIMEOUT", "1800"))
+DEFAULT_IDLE_TIMEOUT = int(os.environ.get("SISSIFICATE_COMMAND_IDLE_TIMEOUT", "300"))
+HEAD_BYTES = 4000
+TAIL_BYTES = 8000
+READ_CHUNK = 65536
+KILL_GRACE = 5.0
+
+
+def runs_dir() -> Path:
+    path = cache_dir() / "runs"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def log_path(run_id: str) -> Path:
+    # run_id comes back from the LLM; never let it escape the runs directory
+    return runs_dir() / f"{Path(run_id).name}.log"
+
+
+class RingBuffer:
+    """Keeps only the last `capacity` bytes written to it."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = bytearray()
+
+    def write(self, chunk: bytes):
+        self.data += chunk
+        if len(self.data) > self.capacity:
+            del self.data[:len(self.data) - self.capacity]
+
+    def getvalue(self) -> bytes:
+        return bytes(self.data)
+
+
+def _terminate(process: subprocess.Popen):
+    # The command runs in its own session, so this also stops the children it spawned
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+    except ProcessLookupError:
+        pass
+
+
+def run_streaming(command: str, cwd: str, timeout: Optional[float] = None,
+                  idle_timeout: Optional[float] = None, head_bytes: int = HEAD_BYTES,
+                  tail_bytes: int = TAIL_BYTES) -> Dict[str, Any]:
+    """
+    Run a shell command, streaming stdout+stderr to disk.
+
+    Args:
+        command: Shell command line
+        cwd: Working directory
+        timeout: Hard limit on total run time in seconds
+        idle_timeout: Kill the command after this many seconds without output
+        head_bytes: Bytes kept from the start of the output
+        tail_bytes: Bytes kept from the end of the output
+
+    Returns:
+        Dict with run_id, exit_code, timed_out ("idle", "total" or None),
+        duration, total_bytes, omitted_bytes, log_path, head and tail
+    """
+    timeout = timeout or DEFAULT_TIMEOUT
+    idle_timeout = idle_timeout or DEFAULT_IDLE_TIMEOUT
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    path = log_path(run_id)
+
+    head = bytearray()
+    tail = RingBuffer(tail_bytes)
+    total_bytes = 0
+    timed_out = None
+    started = time.monotonic()
+    last_output = started
+
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=True
+    )
+    fd = process.stdout.fileno()
+    finished = False
+    try:
+        with open(path, "wb") as log, selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                now = time.monotonic()
+                if now - started >= timeout:
+                    timed_out = "total"
+                    break
+                if now - last_output >= idle_timeout:
+                    timed_out = "idle"
+                    break
+
+                wait = min(timeout - (now - started), idle_timeout - (now - last_output), 1.0)
+                if not selector.select(timeout=max(wait, 0)):
+                    continue
+
+                chunk = os.read(fd, READ_CHUNK)
+                if not chunk:
+                    break
+                last_output = time.monotonic()
+                log.write(chunk)
+                total_bytes += len(chunk)
+                if len(head) < head_bytes:
+                    head += chunk[:head_bytes - len(head)]
+                tail.write(chunk)
+
+        if timed_out:
+            _terminate(process)
+        else:
+            process.wait()
+        process.stdout.close()
+        finished = True
+    finally:
+        if not finished:
+            # SystemExit (SIGTERM from the panel), KeyboardInterrupt or a write error: the
+            # command's own session is out of reach of whoever stops us, so stop it here
+            _terminate(process)
+            process.stdout.close()
+
+    # Only the bytes after the head belong in the tail, in case the output was short
+    after_head = total_bytes - len(head)
+    tail_data = tail.getvalue()[-after_head:] if after_head > 0 else b""
+    annotate(exit_code=process.returncode, timed_out=timed_out, output_bytes=total_bytes, command_run_id=run_id)
+
+    return {
+        "run_id": run_id,
+        "exit_code": process.returncode,
+        "timed_out": timed_out,
+        "duration": round(time.monotonic() - started, 2),
+        "total_bytes": total_bytes,
+        "omitted_bytes": total_bytes - len(head) - len(tail_data),
+        "log_path": str(path),
+        "head": head.decode("utf-8", errors="replace"),
+        "tail": tail_data.decode("utf-8", errors="replace")
+    }
+
+
+def read_log(run_id: str, offset: int = 0, limit: int = TAIL_BYTES) -> Dict[str, Any]:
+    """A window of a saved run log; negative offsets count from the end."""
+    path = log_path(run_id)
+    size = path.stat().st_size
+    if offset < 0:
+        offset = max(size + offset, 0)
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(limit)
+    return {
+        "run_id": run_id,
+        "offset": offset,
+        "next_offset": offset + len(data),
+        "size": size,
+        "text": data.decode("utf-8", errors="replace")
+    }
@@ -0,0 +1,145 @@
+"""
+Token budgets for agent context
+Caps what a tool result or a finished task can add to later prompts: oversized
+tool results keep their head and tail plus a pointer to the full text, and task
+outputs are cut down to their compact JSON before the next task sees them
+"""
+
+import functools
+import json
+import os
+import re
+import uuid
+from typing import Any, Callable, Optional, Tuple
+
+from sissificate_dev.command_runner import log_path
+
+# Rough size of a token in English text and code; close enough to budget with
+CHARS_PER_TOKEN = 4
+TOOL_OUTPUT_TOKENS = int(os.environ.get("SISSIFICATE_TOOL_OUTPUT_TOKENS", "4000"))
+TASK_OUTPUT_TOKENS = int(os.environ.get("SISSIFICATE_TASK_OUTPUT_TOKENS", "1000"))
+
+# Share of a clipped result kept from the start; the rest comes from the end
+HEAD_SHARE = 0.6
+FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def spill(text: str) -> str:
+    """Save text where read_command_log can page through it; returns its run ID."""
+    output_id = f"out-{uuid.uuid4().hex[:12]}"
+    with open(log_path(output_id), "w", encoding="utf-8") as f:
+        f.write(text)
+    return output_id
+
+
+def clip(text: str, max_tokens: int) -> str:
+    """Text within the budget, or its head and tail with a pointer to the rest."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    output_id = spill(text)
+    size = len(text.encode("utf-8"))
+    head_chars = int(max_tokens * CHARS_PER_TOKEN * HEAD_SHARE)
+    tail_chars = max_tokens * CHARS_PER_TOKEN - head_chars
+    omitted = len(text) - head_chars - tail_chars
+    return (
+        f"{text[:head_chars]}\n"
+        f"... {omitted} characters omitted (about {estimate_tokens(text) - max_tokens} tokens over budget). "
+        f"The full output ({size} bytes) is saved as run {output_id}: page through it with "
+        f"read_command_log(run_id=\"{output_id}\", offset=...), or narrow the request ...\n"
+        f"{text[-tail_chars:]}"
+    )
+
+
+def budgeted(tool: Any, max_tokens: Optional[int] = None) -> Any:
+    """Copy of a crewai tool whose string results are clipped to max_tokens."""
+    max_tokens = max_tokens or TOOL_OUTPUT_TOKENS
+    func = tool.func
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = func(*args, **kwargs)
+        return clip(result, max_tokens) if isinstance(result, str) else result
+
+    return tool.model_copy(update={"func": wrapper})
+
+
+def slim_github(data: Any) -> Any:
+    """
+    GitHub API payload without what agents never use: the *_url link fields
+    (html_url stays) and everything about a user but the login.
+    """
+    if isinstance(data, list):
+        return [slim_github(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "login" in data and "avatar_url" in data:
+        return {"login": data["login"]}
+    return {
+        key: slim_github(value) for key, value in data.items()
+        if key == "html_url" or not key.endswith("_url")
+    }
+
+
+def dumps_compact(data: Any) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def extract_json(text: str) -> Optional[Any]:
+    """The first JSON object or array in a model answer (fenced or inline), if any."""
+    candidates = FENCE.findall(text) + [text]
+    decoder = json.JSONDecoder()
+    for candidate in candidates:
+        for match in re.finditer(r"[\[{]", candidate):
+            try:
+                value, _ = decoder.raw_decode(candidate, match.start())
+            except ValueError:
+                continue
+            if isinstance(value, (dict, list)) and value:
+                return value
+    return None
+
+
+def _shrink(value: Any, max_chars: int, max_items: int) -> Any:
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + "…"
+    if isinstance(value, list):
+        items = [_shrink(item, max_chars, max_items) for item in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"(+{len(value) - max_items} more)")
+        return items
+    if isinstance(value, dict):
+        return {key: _shrink(item, max_chars, max_items) for key, item in value.items()}
+    return value
+
+
+def compact_output(text: str, max_tokens: Optional[int] = None) -> str:
+    """
+    What a finished task passes on to the tasks that use it.
+
+    The JSON object the task was asked for (expected_output in tasks.yaml) is
+    re-serialized without whitespace; long strings and lists are shortened
+    until it fits the budget. Answers without JSON are clipped instead.
+    """
+    max_tokens = max_tokens or TASK_OUTPUT_TOKENS
+    data = extract_json(text)
+    if data is None:
+        return clip(text.strip(), max_tokens)
+
+    compact = dumps_compact(data)
+    max_chars, max_items = 2000, 50
+    while estimate_tokens(compact) > max_tokens and max_chars > 40:
+        max_chars, max_items = max_chars // 2, max(max_items // 2, 3)
+        compact = dumps_compact(_shrink(data, max_chars, max_items))
+    return clip(compact, max_tokens)
+
+
+def output_guardrail(max_tokens: Optional[int] = None) -> Callable[[Any], Tuple[bool, Any]]:
+    """Task guardrail that always passes and replaces the output with compact_output()."""
+    def guardrail(output: Any) -> Tuple[bool, Any]:
+        return True, compact_output(output.raw or "", max_tokens)
+
+    return guardrail
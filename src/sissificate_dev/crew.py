@@ -5,24 +5,47 @@ Autonomous agents for implementing DEV-TASKs from GitHub Projects
 """
 
 from crewai import Agent, Crew, Process, Task
+from crewai.llms.base_llm import BaseLLM
 from crewai.tools import tool
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional
 import os
-import subprocess
 import json
-import requests
+import re
+
+from sissificate_dev.cassette import Cassette, RecordingLLM, ReplayLLM, recorded
+from sissificate_dev.code_index import CodeIndex
+from sissificate_dev.command_runner import DEFAULT_IDLE_TIMEOUT, read_log, run_streaming
+from sissificate_dev.context_budget import budgeted, dumps_compact, output_guardrail, slim_github
+from sissificate_dev.crew_config import ConfigError, load_config, required_tasks
+from sissificate_dev.dag_executor import DagExecutor
+from sissificate_dev.file_editor import EditError, apply_edits, atomic_write, parse_unified_diff
+from sissificate_dev.file_reader import forget_reads, read_file_range, scoped_reads
+from sissificate_dev.github_client import get_client
+from sissificate_dev.issue_sync import IssueSyncError, open_mirror
+from sissificate_dev.llm import FallbackLLM, RateLimitedLLM, default_model, provider_llm
+from sissificate_dev.llm_cache import CachedLLM, LLMCache, bypass_from_env, llm_cache_enabled
+from sissificate_dev.model_router import record, resolve
+from sissificate_dev.settings import workspace_path
+from sissificate_dev.task_lease import LeaseManager
+from sissificate_dev.tracing import trace_context, traced
+from sissificate_dev.validation import STEPS, ValidationError, validate
 
 
 # Custom Tools for Sissificate Development
 @tool
-def read_file(file_path: str) -> str:
-    """Read a file from the Sissificate project."""
-    project_path = os.environ.get("SISSIFICATE_PROJECT_PATH", "/Users/roberto/Documents/projects/sissificate")
+@traced
+@recorded
+def read_file(file_path: str, start_line: int = 0, end_line: int = 0, byte_offset: int = 0,
+              byte_length: int = 0, force: bool = False) -> str:
+    """Read a file from the Sissificate project. Optionally pass start_line/end_line (1-based, inclusive)
+    or byte_offset/byte_length to read part of it. Very large files return a summary instead, and
+    long ranges are cut with a note saying where to continue.
+    Re-reading an unchanged file returns a short note unless force=True."""
+    project_path = workspace_path()
     full_path = os.path.join(project_path, file_path)
     
     try:
-        with open(full_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return read_file_range(full_path, start_line, end_line, byte_offset, byte_length, force)
     except FileNotFoundError:
         return f"Error: File not found at {full_path}"
     except Exception as e:
@@ -30,49 +53,148 @@ def read_file(file_path: str) -> str:
 
 
 @tool
+@traced
+@recorded
 def write_file(file_path: str, content: str) -> str:
-    """Write content to a file in the Sissificate project."""
-    project_path = os.environ.get("SISSIFICATE_PROJECT_PATH", "/Users/roberto/Documents/projects/sissificate")
+    """Write content to a file in the Sissificate project. Prefer edit_file for changes to existing files."""
+    project_path = workspace_path()
     full_path = os.path.join(project_path, file_path)
     
     try:
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if not atomic_write(full_path, content):
+            return f"No changes: {file_path} already has this content"
         return f"Successfully wrote to {file_path}"
     except Exception as e:
         return f"Error writing file: {str(e)}"
 
 
 @tool
-def run_command(command: str) -> str:
-    """Run a shell command in the Sissificate project directory."""
-    project_path = os.environ.get("SISSIFICATE_PROJECT_PATH", "/Users/roberto/Documents/projects/sissificate")
+@traced
+@recorded
+def edit_file(file_path: str, search: str = "", replace: str = "", edits: str = "", diff: str = "") -> str:
+    """Edit an existing file in the Sissificate project without resending it. Use ONE of:
+    - search + replace: replace one block of text (search must match exactly one place)
+    - edits: JSON list of {"search": "...", "replace": "..."} objects, applied in order
+    - diff: a unified diff with @@ hunks (context lines must match exactly one place)
+    All hunks are validated before anything is written."""
+    project_path = workspace_path()
+    full_path = os.path.join(project_path, file_path)
     
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        if diff:
+            hunks = parse_unified_diff(diff)
+        elif edits:
+            hunks = [(edit["search"], edit.get("replace", "")) for edit in json.loads(edits)]
+        else:
+            hunks = [(search, replace)]
         
-        output = f"Exit code: {result.returncode}\n"
-        if result.stdout:
-            output += f"STDOUT:\n{result.stdout}\n"
-        if result.stderr:
-            output += f"STDERR:\n{result.stderr}\n"
-        
-        return output
-    except subprocess.TimeoutExpired:
-        return "Error: Command timed out after 120 seconds"
+        if not apply_edits(full_path, hunks):
+            return f"No changes: {file_path} already matches the edits"
+        return f"Successfully applied {len(hunks)} edit(s) to {file_path}"
+    except FileNotFoundError:
+        return f"Error: File not found at {full_path} (use write_file to create new files)"
+    except EditError as e:
+        return f"Error: {str(e)} in {file_path}; nothing was written"
+    except Exception as e:
+        return f"Error editing file: {str(e)}"
+
+
+@tool
+@traced
+@recorded
+def search_code(query: str, regex: bool = False, path_glob: str = "", max_results: int = 50) -> str:
+    """Search the Sissificate codebase (respects .gitignore, skips node_modules) and return ranked
+    file:line hits. query is a case-insensitive literal unless regex=True. path_glob narrows the
+    files, e.g. "components/**/*.tsx". Much faster than grep/find through run_command."""
+    try:
+        hits = CodeIndex().search(query, regex=regex, path_glob=path_glob, max_results=max_results)
+    except re.error as e:
+        return f"Error: Invalid regex: {str(e)}"
+    except Exception as e:
+        return f"Error searching code: {str(e)}"
+    
+    if not hits:
+        return f"No matches for {query!r}"
+    return "\n".join(f"{path}:{line}: {text}" for path, line, text in hits)
+
+
+@tool
+@traced
+@recorded
+def run_command(command: str, timeout: int = 0, idle_timeout: int = 0) -> str:
+    """Run a shell command in the Sissificate project directory. Output is saved to a log;
+    only the head and tail are returned (page through the rest with read_command_log).
+    timeout is the total limit and idle_timeout the limit without output, in seconds (0 = defaults)."""
+    project_path = workspace_path()
+    
+    try:
+        result = run_streaming(command, cwd=project_path, timeout=timeout or None, idle_timeout=idle_timeout or None)
     except Exception as e:
         return f"Error running command: {str(e)}"
+    
+    output = f"Exit code: {result['exit_code']}\n"
+    if result["timed_out"] == "total":
+        output += f"Error: Command timed out after {result['duration']} seconds\n"
+    elif result["timed_out"] == "idle":
+        output += f"Error: Command killed after producing no output for {idle_timeout or DEFAULT_IDLE_TIMEOUT} seconds\n"
+    output += f"Run ID: {result['run_id']} ({result['total_bytes']} bytes of output, {result['duration']}s)\n"
+    
+    if result["tail"]:
+        output += f"OUTPUT (head):\n{result['head']}\n"
+        if result["omitted_bytes"] > 0:
+            output += f"... {result['omitted_bytes']} bytes omitted, use read_command_log to page through them ...\n"
+        output += f"OUTPUT (tail):\n{result['tail']}\n"
+    elif result["head"]:
+        output += f"OUTPUT:\n{result['head']}\n"
+    
+    return output
 
 
 @tool
+@traced
+@recorded
+def validate_changes(base: str = "", steps: str = "", force: bool = False) -> str:
+    """Lint, build and test only what changed since the base branch (default: SISSIFICATE_BASE_BRANCH).
+    steps is a comma-separated subset of lint,build,test (empty = all). Returns a JSON pass/fail report
+    per step with the first error lines; full logs are under each step's run_id (read_command_log).
+    An unchanged tree returns its cached verdict; force=True runs again."""
+    wanted = [step.strip() for step in steps.split(",") if step.strip()]
+    unknown = [step for step in wanted if step not in STEPS]
+    if unknown:
+        return f"Error: Unknown validation steps {', '.join(unknown)} (use {', '.join(STEPS)})"
+    
+    try:
+        report = validate(base=base or None, steps=wanted or None, force=force)
+    except ValidationError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error validating changes: {str(e)}"
+    
+    return dumps_compact(report)
+
+
+@tool
+@traced
+@recorded
+def read_command_log(run_id: str, offset: int = 0, limit: int = 8000) -> str:
+    """Read part of a saved run_command log, or the rest of a tool result that was cut short
+    (its run ID is in the note). Use a negative offset to read from the end."""
+    try:
+        window = read_log(run_id, offset=offset, limit=limit)
+    except FileNotFoundError:
+        return f"Error: No log found for run {run_id}"
+    except Exception as e:
+        return f"Error reading command log: {str(e)}"
+    
+    return (
+        f"Run ID: {run_id} (bytes {window['offset']}-{window['next_offset']} of {window['size']})\n"
+        f"{window['text']}"
+    )
+
+
+@tool
+@traced
+@recorded
 def github_rest_request(method: str, endpoint: str, data: str = "{}") -> str:
     """Make a GitHub REST API request. Data should be JSON string."""
     token = os.environ.get("GITHUB_TOKEN")
@@ -80,154 +202,307 @@ def github_rest_request(method: str, endpoint: str, data: str = "{}") -> str:
     if not token:
         return "Error: GITHUB_TOKEN not set"
     
-    url = f"https://api.github.com{endpoint}"
-    
     try:
-        import json as json_lib
-        json_data = json_lib.loads(data) if data else None
+        json_data = json.loads(data) if data else None
+        if method.upper() == "GET" and not json_data:
+            json_data = None
         
-        response = requests.request(
-            method=method,
-            url=url,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            },
-            json=json_data,
-            timeout=30
-        )
+        response = get_client(token).request(method, endpoint, json_data=json_data)
         
-        return json_lib.dumps({
+        return dumps_compact({
             "status_code": response.status_code,
-            "data": response.json() if response.text else None
-        }, indent=2)
+            "data": slim_github(response.json()) if response.text else None
+        })
     except Exception as e:
         return f"Error making GitHub request: {str(e)}"
 
 
-class SissificateDevCrew:
-    """Sissificate Development Crew"""
+@tool
+@traced
+@recorded
+def github_graphql_query(query: str, variables: str = "{}") -> str:
+    """Run a GitHub GraphQL query (use aliases to batch several issues in one request). Variables should be JSON string."""
+    token = os.environ.get("GITHUB_TOKEN")
     
-    def __init__(self):
-        self.agents = self._create_agents()
-        self.tasks = []
+    if not token:
+        return "Error: GITHUB_TOKEN not set"
     
-    def _create_agents(self) -> List[Agent]:
-        """Create all agents"""
-        
-        devops_coordinator = Agent(
-            role="DevOps Coordinator",
-            goal="Coordinate task execution, manage GitHub issues, and prevent conflicts between agents",
-            backstory="""You are a DevOps coordinator who manages the workflow between multiple agents. 
-            You query GitHub Projects for available tasks, assign them to appropriate agents, and ensure 
-            no conflicts occur. You update GitHub issues with progress and completion status.""",
-            tools=[read_file, write_file, run_command, github_rest_request],
-            verbose=True,
-            allow_delegation=True
-        )
-        
-        frontend_engineer = Agent(
-            role="Senior Frontend Engineer",
-            goal="Implement UI components, pages, and user-facing features with React, Next.js, and Tailwind CSS",
-            backstory="""You are a senior frontend engineer with 10+ years of experience in React, Next.js App Router, 
-            TypeScript, and Tailwind CSS. You follow mobile-first design principles, implement proper a11y 
-            attributes, and write clean, maintainable code. You always read existing files before modifying them.""",
-            tools=[read_file, write_file, run_command],
-            verbose=True,
-            allow_delegation=False
-        )
-        
-        backend_engineer = Agent(
-            role="Senior Backend Engineer",
-            goal="Implement API routes, database schemas, and server-side logic with Supabase/InsForge",
-            backstory="""You are a senior backend engineer specializing in Next.js API routes, PostgreSQL with Supabase,
-            Row Level Security (RLS), and RESTful API design. You ensure data integrity, proper validation,
-            and secure implementations.""",
-            tools=[read_file, write_file, run_command],
-            verbose=True,
-            allow_delegation=False
-        )
-        
-        qa_engineer = Agent(
-            role="QA Engineer",
-            goal="Write tests, verify implementations, and ensure quality standards are met",
-            backstory="""You are a QA engineer who ensures code quality through Playwright E2E tests, 
-            accessibility audits, and manual verification. You verify that implementations match specifications and meet acceptance criteria.""",
-            tools=[read_file, write_file, run_command],
-            verbose=True,
-            allow_delegation=False
-        )
+    try:
+        response = get_client(token).request("POST", "/graphql", json_data={
+            "query": query,
+            "variables": json.loads(variables) if variables else {}
+        })
         
-        return [devops_coordinator, frontend_engineer, backend_engineer, qa_engineer]
+        return dumps_compact({
+            "status_code": response.status_code,
+            "data": slim_github(response.json()) if response.text else None
+        })
+    except Exception as e:
+        return f"Error making GitHub GraphQL request: {str(e)}"
+
+
+@tool
+@traced
+@recorded
+def create_lock_file(task_id: str) -> str:
+    """Atomically lock a DEV-TASK (.lock.DEV-XXXX) for this agent. Fails if another agent holds a live lock."""
+    manager = LeaseManager()
+    lease = manager.acquire(task_id)
+    if not lease:
+        holder = manager.read(task_id) or {}
+        return f"Error: {task_id} is already locked by {holder.get('owner', 'another agent')}"
+    return f"Lock acquired for {task_id} by {lease['owner']} (expires in {int(lease['expires_at'] - lease['acquired_at'])}s)"
+
+
+@tool
+@traced
+@recorded
+def remove_lock_file(task_id: str) -> str:
+    """Release this agent's lock on a DEV-TASK."""
+    manager = LeaseManager()
+    lease = manager.read(task_id)
+    if not lease:
+        return f"No lock exists for {task_id}"
+    if lease.get("owner") != manager.owner:
+        return f"Error: {task_id} is locked by {lease.get('owner')}, not {manager.owner}"
+    manager.release(task_id, force=True)
+    return f"Lock released for {task_id}"
+
+
+@tool
+@traced
+@recorded
+def check_lock_exists(task_id: str) -> str:
+    """Check whether a DEV-TASK is locked, and by whom."""
+    manager = LeaseManager()
+    lease = manager.read(task_id)
+    if not lease or manager.is_expired(lease):
+        return f"No active lock for {task_id}"
+    return json.dumps({key: lease[key] for key in ("task_id", "owner", "host", "pid", "expires_at")})
+
+
+@tool
+@traced
+@recorded
+def list_backlog_issues(epic: str = "", task_id: str = "", unassigned_only: bool = True) -> str:
+    """List open DEV- issues from the local backlog mirror (synced incrementally from GitHub)."""
+    mirror = open_mirror()
+    try:
+        mirror.sync()
+    except IssueSyncError as e:
+        # Serve the last mirrored state rather than failing the whole step
+        print(f"⚠️ Backlog sync failed, using local mirror: {e}")
+    except Exception as e:
+        return f"Error syncing backlog: {str(e)}"
     
-    def create_task(self, task_id: str = None, epic: str = None) -> List[Task]:
-        """Create tasks for the crew"""
-        
-        tasks = []
+    issues = mirror.query(
+        prefix="DEV-",
+        epic=epic or None,
+        task_id=task_id or None,
+        unassigned=unassigned_only
+    )
+    
+    return json.dumps([
+        {
+            "task_id": issue["title"].split(":")[0].strip(),
+            "title": issue["title"],
+            "issue_number": issue["number"],
+            "labels": [l.get("name", "") for l in issue.get("labels", [])],
+            "assignee": (issue.get("assignee") or {}).get("login")
+        }
+        for issue in issues
+    ])
+
+
+# Every tool an agent can list under `tools:` in agents.yaml
+TOOLS = {
+    t.name: t for t in (
+        read_file, write_file, edit_file, search_code, run_command, read_command_log, validate_changes,
+        github_rest_request, github_graphql_query, list_backlog_issues,
+        create_lock_file, remove_lock_file, check_lock_exists
+    )
+}
+
+
+class SissificateDevCrew:
+    """Sissificate Development Crew, built from config/agents.yaml and config/tasks.yaml"""
+    
+    def __init__(self, llm_cache: Optional[bool] = None, cache_bypass: Iterable[str] = (),
+                 cassette: Optional[Cassette] = None, llm: Optional[BaseLLM] = None,
+                 max_rpm: Optional[Dict[str, int]] = None, config: Optional[Dict[str, Any]] = None,
+                 targets: Optional[List[str]] = None, max_concurrent_tasks: Optional[int] = None):
+        """
+        Args:
+            llm_cache: Serve repeated prompts from the on-disk LLM cache
+                (default: SISSIFICATE_LLM_CACHE)
+            cache_bypass: Task names that always call the model, on top of
+                SISSIFICATE_LLM_CACHE_BYPASS
+            cassette: Record LLM responses to, or replay them from, a cassette
+                (tool calls are routed through it with cassette.use_cassette)
+            llm: Model client for every agent instead of the configured provider
+                (e.g. a scripted LLM in benchmarks)
+            max_rpm: LLM requests per minute by agent role, enforced host-wide
+                (default: max_rpm in agents.yaml; {} turns the limit off)
+            config: Compiled crew config (default: crew_config.load_config())
+            targets: Task ids to run, with everything they need through
+                `context:` (default: `targets` in tasks.yaml)
+            max_concurrent_tasks: How many independent tasks kickoff runs at
+                once (default: SISSIFICATE_MAX_CONCURRENT_TASKS, then
+                max_concurrent_tasks under `crew:` in agents.yaml; 1 = sequential)
         
-        # Task 1: Fetch available task from GitHub
-        fetch_task = Task(
-            description=f"""Query GitHub for available DEV-TASKs with status "Ready".
-            
-            Use github_rest_request to GET /repos/rrios-dev/sissificate/issues with:
-            - state: open
-            - labels: (empty to get all)
-            
-            Find issues starting with "DEV-" that have no assignee.
-            Target task: {task_id or "Any available"}
-            Target epic: {epic or "Any"}
-            
-            Return the task ID, title, and issue number for the first available task matching criteria.
-            """,
-            expected_output="JSON object with task_id, title, epic, issue_number, status",
-            agent=self.agents[0]  # devops_coordinator
+        Agents and tasks are only built when a run needs them; agents are
+        kept, so a daemon worker reuses them (and their LLM clients) across runs.
+        """
+        self.config = config or load_config()
+        self.targets = targets or self.config["targets"]
+        self.cassette = cassette
+        self.base_llm = llm
+        self.llm_cache = llm_cache_enabled() if llm_cache is None else llm_cache
+        self.cache_bypass = set(cache_bypass) | bypass_from_env()
+        if max_rpm is None:
+            max_rpm = {a["role"]: a["max_rpm"] for a in self.config["agents"].values() if a["max_rpm"]}
+        self.max_rpm = max_rpm
+        self.max_concurrent_tasks = int(
+            max_concurrent_tasks or os.environ.get("SISSIFICATE_MAX_CONCURRENT_TASKS")
+            or self.config["crew"].get("max_concurrent_tasks") or 1
         )
-        tasks.append(fetch_task)
+        self._llms: Dict[str, BaseLLM] = {}
+        self._agents: Dict[str, Agent] = {}
+    
+    def _model_llm(self, model: str) -> BaseLLM:
+        """Provider LLM for one model behind the rate limit and the cache"""
+        llm = self.base_llm or provider_llm(model)
+        if self.max_rpm:
+            # Innermost, so cache hits do not count against the budget
+            llm = RateLimitedLLM(llm, max_rpm=self.max_rpm)
+        if self.llm_cache:
+            llm = CachedLLM(llm, cache=LLMCache(), bypass_tasks=self.cache_bypass)
+        return llm
+    
+    def _create_llm(self, route: Dict[str, Any]) -> BaseLLM:
+        """LLM stack for a route (model_router.resolve), shared by everything routed the same way"""
+        models = route["models"] or [default_model()]
+        # Keyed by the configured chain, so replay finds the route a recording used
+        key = ",".join(models)
+        if self.base_llm:
+            # One scripted client answers for every model; there is nothing to fall back to
+            models = models[:1]
+        if key in self._llms:
+            return self._llms[key]
         
-        # Task 2: Implement the task
-        implement_task = Task(
-            description="""Based on the task fetched, implement the code changes:
-            
-            1. Read the DEV-TASK specification from docs/workboard/development/tasks/DEV-XXXX.md
-            2. Read any existing related files
-            3. Implement the required changes following the specification
-            4. Write tests if required
-            5. Run validation commands (lint, build, test)
-            
-            Follow all project conventions and patterns found in existing code.
-            """,
-            expected_output="Summary of files created/modified and validation results",
-            agent=self.agents[1]  # frontend_engineer (will delegate to backend if needed)
-        )
-        tasks.append(implement_task)
+        if self.cassette and self.cassette.replaying:
+            # One replay client per route, under the model that route was recorded with
+            llm = ReplayLLM(self.cassette, route=key)
+        else:
+            chain = [self._model_llm(model) for model in models]
+            llm = chain[0]
+            if len(chain) > 1:
+                llm = FallbackLLM(chain[0], fallbacks=chain[1:], tier=route["tier"])
+            if self.cassette:
+                llm = RecordingLLM(llm, cassette=self.cassette, route=key)
+                self.cassette.update_route(
+                    key,
+                    model=llm.model,
+                    supports_stop_words=llm.supports_stop_words(),
+                    supports_function_calling=llm.supports_function_calling(),
+                    context_window_size=llm.get_context_window_size()
+                )
+        self._llms[key] = llm
+        return llm
+    
+    def agent(self, agent_id: str, task_id: Optional[str] = None) -> Agent:
+        """
+        The agent with this id in agents.yaml, built on first use. A task
+        routed to other models than its agent's (its own `llm:`) gets a
+        separate instance of the agent on those models.
+        """
+        route = resolve(self.config, agent_id, task_id, default=default_model())
+        key = f"{agent_id}:{','.join(route['models'])}"
+        if key not in self._agents:
+            spec = self.config["agents"][agent_id]
+            unknown = [name for name in spec["tools"] if name not in TOOLS]
+            if unknown:
+                raise ConfigError(f"agents.yaml: {agent_id}: unknown tools {', '.join(unknown)}")
+            self._agents[key] = Agent(
+                role=spec["role"],
+                goal=spec["goal"],
+                backstory=spec["backstory"],
+                # Each agent gets its own copies, clipped to its tool output budget
+                tools=[budgeted(TOOLS[name], spec["tool_output_tokens"]) for name in spec["tools"]],
+                llm=self._create_llm(route),
+                verbose=spec["verbose"],
+                allow_delegation=spec["allow_delegation"],
+                max_iter=spec["max_iter"]
+            )
+        return self._agents[key]
+    
+    @property
+    def agents(self) -> List[Agent]:
+        """Agents built so far"""
+        return list(self._agents.values())
+    
+    def _task_tools(self, agent: Agent, task_id: str) -> List[Any]:
+        """
+        The agent's tools for one task. read_file only skips content this task
+        already received in this run: other agents and tasks never saw it.
+        """
+        def scope() -> str:
+            return f"{trace_context().get('run_id', '')}:{task_id}:{agent.role}"
         
-        # Task 3: Validate and report
-        validate_task = Task(
-            description="""Validate the implementation:
-            
-            1. Run: bun run lint
-            2. Run: bun run build
-            3. Run: bun run test:a11y
-            4. Verify acceptance criteria from the DEV-TASK
-            
-            Report pass/fail for each criterion.
-            """,
-            expected_output="Validation report with pass/fail status for each criterion",
-            agent=self.agents[3]  # qa_engineer
-        )
-        tasks.append(validate_task)
+        return [scoped_reads(tool, scope) if tool.name == "read_file" else tool for tool in agent.tools]
+    
+    def create_task(self, targets: Optional[List[str]] = None) -> List[Task]:
+        """
+        Create the tasks for a run, dependencies first.
         
-        return tasks
+        The DEV-TASK itself is picked beforehand by task_selector.select_task and
+        passed in as kickoff inputs ({task_id}, {title}, {epic}, {issue_number}).
+        """
+        tasks: Dict[str, Task] = {}
+        for task_id in required_tasks(self.config, targets or self.targets):
+            spec = self.config["tasks"][task_id]
+            route = resolve(self.config, spec["agent"], task_id, default=default_model())
+            record("route", task=task_id, agent=spec["agent"], **route)
+            agent = self.agent(spec["agent"], task_id)
+            tasks[task_id] = Task(
+                name=task_id,
+                description=spec["description"],
+                expected_output=spec["expected_output"],
+                agent=agent,
+                tools=self._task_tools(agent, task_id),
+                context=[tasks[dependency] for dependency in spec["context"]] or None,
+                # Later tasks only see the compact JSON of this one
+                guardrail=output_guardrail(spec["output_tokens"])
+            )
+        return list(tasks.values())
     
-    def crew(self, task_id: str = None, epic: str = None) -> Crew:
+    def crew(self, targets: Optional[List[str]] = None) -> Crew:
         """Creates the Sissificate Development crew"""
         
-        tasks = self.create_task(task_id, epic)
+        tasks = self.create_task(targets)
+        agents = []
+        for task in tasks:
+            if task.agent not in agents:
+                agents.append(task.agent)
         
         return Crew(
-            agents=self.agents,
+            agents=agents,
             tasks=tasks,
             process=Process.sequential,
             verbose=True
-        )
\ No newline at end of file
+        )
+    
+    def kickoff(self, inputs: Dict[str, Any], targets: Optional[List[str]] = None) -> Any:
+        """
+        Run the crew for one DEV-TASK.
+        
+        With max_concurrent_tasks > 1, tasks whose `context:` is done run side
+        by side (DagExecutor); otherwise the crew runs them one after another.
+        """
+        try:
+            if self.max_concurrent_tasks <= 1:
+                return self.crew(targets).kickoff(inputs=inputs)
+            return DagExecutor(self.create_task(targets), max_concurrency=self.max_concurrent_tasks).kickoff(inputs)
+        finally:
+            # A daemon worker's next DEV-TASK starts without "unchanged since last read" notes
+            forget_reads()
@@ -0,0 +1,249 @@
+"""
+Crew configuration
+Loads and validates config/agents.yaml and config/tasks.yaml without importing
+crewai. The validated config is compiled to JSON in the cache dir, keyed by
+the files' hash, so worker startup skips YAML parsing and validation
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import yaml
+
+from sissificate_dev.settings import cache_dir
+
+CONFIG_DIR = Path(__file__).resolve().parent / "config"
+# Bump when the compiled layout changes so stale artifacts are ignored
+COMPILED_VERSION = 3
+
+AGENT_FIELDS = {
+    "id": str, "role": str, "goal": str, "backstory": str, "verbose": bool,
+    "allow_delegation": bool, "max_iter": int, "max_rpm": int, "llm": str, "tools": list,
+    "tool_output_tokens": int,
+}
+AGENT_REQUIRED = ("id", "role", "goal", "backstory")
+AGENT_DEFAULTS = {"verbose": True, "allow_delegation": False, "max_iter": 15, "max_rpm": None,
+                  "llm": None, "tools": [], "tool_output_tokens": None}
+
+TASK_FIELDS = {"id": str, "description": str, "expected_output": str, "agent": str, "context": list,
+               "output_tokens": int, "llm": str}
+TASK_REQUIRED = ("id", "description", "expected_output", "agent")
+TASK_DEFAULTS = {"context": [], "output_tokens": None, "llm": None}
+
+_compiled: Dict[str, Dict[str, Any]] = {}
+_compiled_lock = threading.Lock()
+
+
+class ConfigError(ValueError):
+    """agents.yaml or tasks.yaml does not describe a valid crew."""
+
+
+def _check_fields(where: str, entry: Any, fields: Dict[str, type], required: tuple) -> List[str]:
+    if not isinstance(entry, dict):
+        return [f"{where}: expected a mapping"]
+    problems = [f"{where}: unknown key '{key}'" for key in entry if key not in fields]
+    problems += [f"{where}: missing '{key}'" for key in required if entry.get(key) in (None, "")]
+    for key, expected in fields.items():
+        value = entry.get(key)
+        # bool is an int subclass; max_iter: true is a typo, not a number
+        if value is not None and (not isinstance(value, expected) or (expected is int and isinstance(value, bool))):
+            problems.append(f"{where}: '{key}' must be {expected.__name__}, got {type(value).__name__}")
+    return problems
+
+
+def validate(agents_doc: Any, tasks_doc: Any) -> Dict[str, Any]:
+    """
+    Check both documents and return the compiled config.
+
+    Returns:
+        {"crew": {...}, "models": {tier: [model, ...]}, "agents": {id: agent},
+         "tasks": {id: task}, "targets": [...]}
+        with defaults filled in and tasks in file order
+
+    Raises:
+        ConfigError listing every problem found
+    """
+    problems: List[str] = []
+    models: Dict[str, List[str]] = {}
+    agents: Dict[str, Dict[str, Any]] = {}
+    tasks: Dict[str, Dict[str, Any]] = {}
+
+    tiers = (agents_doc or {}).get("models") if isinstance(agents_doc, dict) else None
+    if tiers is not None and not isinstance(tiers, dict):
+        problems.append("agents.yaml: 'models' must map tier names to model lists")
+        tiers = {}
+    for tier, chain in (tiers or {}).items():
+        # A single model is a chain without fallbacks
+        chain = [chain] if isinstance(chain, str) else chain
+        if not isinstance(chain, list) or not chain or not all(isinstance(m, str) and m for m in chain):
+            problems.append(f"agents.yaml: models.{tier} must be a model name or a non-empty list of them")
+            continue
+        models[str(tier)] = chain
+
+    agent_entries = (agents_doc or {}).get("agents") if isinstance(agents_doc, dict) else None
+    if not isinstance(agent_entries, list) or not agent_entries:
+        problems.append("agents.yaml: 'agents' must be a non-empty list")
+        agent_entries = []
+    for index, entry in enumerate(agent_entries):
+        where = f"agents.yaml: agents[{index}]" + (f" ({entry.get('id')})" if isinstance(entry, dict) else "")
+        found = _check_fields(where, entry, AGENT_FIELDS, AGENT_REQUIRED)
+        problems += found
+        if found:
+            continue
+        if entry["id"] in agents:
+            problems.append(f"{where}: duplicate id")
+        for key in ("max_iter", "max_rpm", "tool_output_tokens"):
+            if entry.get(key) is not None and entry[key] <= 0:
+                problems.append(f"{where}: '{key}' must be positive")
+        if not all(isinstance(name, str) for name in entry.get("tools") or []):
+            problems.append(f"{where}: 'tools' must be a list of tool names")
+        agents[entry["id"]] = {**AGENT_DEFAULTS, **entry}
+
+    task_entries = (tasks_doc or {}).get("tasks") if isinstance(tasks_doc, dict) else None
+    if not isinstance(task_entries, list) or not task_entries:
+        problems.append("tasks.yaml: 'tasks' must be a non-empty list")
+        task_entries = []
+    for index, entry in enumerate(task_entries):
+        where = f"tasks.yaml: tasks[{index}]" + (f" ({entry.get('id')})" if isinstance(entry, dict) else "")
+        found = _check_fields(where, entry, TASK_FIELDS, TASK_REQUIRED)
+        problems += found
+        if found:
+            continue
+        if entry["id"] in tasks:
+            problems.append(f"{where}: duplicate id")
+        if entry["agent"] not in agents:
+            problems.append(f"{where}: unknown agent '{entry['agent']}'")
+        if entry.get("output_tokens") is not None and entry["output_tokens"] <= 0:
+            problems.append(f"{where}: 'output_tokens' must be positive")
+        tasks[entry["id"]] = {**TASK_DEFAULTS, **entry}
+
+    for task_id, task in tasks.items():
+        for dependency in task["context"]:
+            if dependency not in tasks:
+                problems.append(f"tasks.yaml: {task_id}: context references unknown task '{dependency}'")
+    problems += _find_cycles(tasks)
+
+    targets = (tasks_doc or {}).get("targets") if isinstance(tasks_doc, dict) else None
+    if targets is None:
+        # Default to the tasks nothing else depends on
+        used = {dependency for task in tasks.values() for dependency in task["context"]}
+        targets = [task_id for task_id in tasks if task_id not in used]
+    elif not isinstance(targets, list):
+        problems.append("tasks.yaml: 'targets' must be a list of task ids")
+        targets = []
+    for target in targets:
+        if target not in tasks:
+            problems.append(f"tasks.yaml: targets references unknown task '{target}'")
+
+    crew = (agents_doc or {}).get("crew") if isinstance(agents_doc, dict) else None
+    if crew is not None and not isinstance(crew, dict):
+        problems.append("agents.yaml: 'crew' must be a mapping")
+        crew = {}
+    concurrency = (crew or {}).get("max_concurrent_tasks")
+    if concurrency is not None and (isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1):
+        problems.append("agents.yaml: crew.max_concurrent_tasks must be a positive int")
+
+    if problems:
+        raise ConfigError("Invalid crew config:\n  " + "\n  ".join(problems))
+    return {
+        "crew": crew or {},
+        "models": models,
+        "agents": agents,
+        "tasks": tasks,
+        "targets": targets,
+    }
+
+
+def _find_cycles(tasks: Dict[str, Dict[str, Any]]) -> List[str]:
+    problems = []
+    state: Dict[str, int] = {}  # 1 = on the current path, 2 = done
+
+    def visit(task_id: str, path: List[str]):
+        state[task_id] = 1
+        for dependency in tasks[task_id]["context"]:
+            if dependency not in tasks:
+                continue
+            if state.get(dependency) == 1:
+                cycle = path[path.index(dependency):] + [dependency]
+                problems.append(f"tasks.yaml: context cycle {' -> '.join(cycle)}")
+            elif dependency not in state:
+                visit(dependency, path + [dependency])
+        state[task_id] = 2
+
+    for task_id in tasks:
+        if task_id not in state:
+            visit(task_id, [task_id])
+    return problems
+
+
+def required_tasks(config: Dict[str, Any], targets: Optional[List[str]] = None) -> List[str]:
+    """Target tasks plus everything they need through `context:`, dependencies first."""
+    ordered: List[str] = []
+    seen: Set[str] = set()
+
+    def visit(task_id: str):
+        if task_id not in config["tasks"]:
+            raise ConfigError(f"Unknown task '{task_id}'")
+        if task_id in seen:
+            return
+        seen.add(task_id)
+        for dependency in config["tasks"][task_id]["context"]:
+            visit(dependency)
+        ordered.append(task_id)
+
+    wanted = set(targets if targets is not None else config["targets"])
+    # Walk in file order so independent tasks keep the order they are written in
+    for task_id in [t for t in config["tasks"] if t in wanted] + [t for t in wanted if t not in config["tasks"]]:
+        visit(task_id)
+    return ordered
+
+
+def _compiled_path(digest: str) -> Path:
+    path = cache_dir() / "config"
+    path.mkdir(parents=True, exist_ok=True)
+    return path / f"crew-{digest[:16]}.json"
+
+
+def load_config(config_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Validated crew config, from the compiled artifact when the YAML is unchanged.
+
+    Raises:
+        ConfigError if either file is missing, unparsable or invalid
+    """
+    config_dir = Path(config_dir or os.environ.get("SISSIFICATE_CONFIG_DIR") or CONFIG_DIR)
+    try:
+        agents_bytes = (config_dir / "agents.yaml").read_bytes()
+        tasks_bytes = (config_dir / "tasks.yaml").read_bytes()
+    except OSError as e:
+        raise ConfigError(f"Cannot read crew config: {e}") from e
+    digest = hashlib.sha256(
+        b"\0".join([str(COMPILED_VERSION).encode(), agents_bytes, tasks_bytes])
+    ).hexdigest()
+
+    with _compiled_lock:
+        if digest in _compiled:
+            return _compiled[digest]
+
+    path = _compiled_path(digest)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        try:
+            config = validate(yaml.safe_load(agents_bytes), yaml.safe_load(tasks_bytes))
+        except yaml.YAMLError as e:
+            raise ConfigError(f"Cannot parse crew config: {e}") from e
+        # Temp file and rename, as with the HTTP cache, so workers never read a torn artifact
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        os.replace(tmp_path, path)
+
+    with _compiled_lock:
+        _compiled[digest] = config
+    return config
@@ -0,0 +1,287 @@
+"""
+Multi-worker daemon mode
+A supervisor keeps N long-lived worker processes fed from a shared queue. Each
+worker builds its crew once and reuses the agents and LLM clients for every task
+"""
+
+import multiprocessing as mp
+import os
+import queue
+import signal
+import socket
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Any, Dict, Optional, Set
+
+from sissificate_dev.issue_sync import open_mirror
+from sissificate_dev.task_lease import GitHubClaim, LeaseManager, claim_task
+from sissificate_dev.task_selector import select_task
+from sissificate_dev import tracing
+
+# A worker that dies before it is ready crashed at startup: restarting it right away would spin,
+# so the wait starts here and doubles with every crash in a row, up to MAX_RESTART_DELAY
+MIN_RESTART_INTERVAL = 5.0
+MAX_RESTART_DELAY = 300.0
+# Startup crashes in a row after which the worker is not restarted again
+MAX_STARTUP_CRASHES = 6
+
+
+def worker_agent_name(agent_prefix: str, worker_id: int) -> str:
+    return f"agent-{agent_prefix}-{worker_id}"
+
+
+def worker_main(worker_id: int, agent_prefix: str, task_queue: mp.Queue, events: Connection):
+    """Worker loop: build the crew once, then claim and run tasks until told to stop."""
+    os.environ["AGENT_ID"] = f"{agent_prefix}-{worker_id}"
+    os.environ["AGENT_NAME"] = worker_agent_name(agent_prefix, worker_id)
+    # The supervisor handles Ctrl+C and shuts workers down through the queue
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    metrics_port = os.environ.get("SISSIFICATE_TRACE_PROMETHEUS_PORT")
+    if metrics_port:
+        # One metrics endpoint per worker: base port + worker id
+        os.environ["SISSIFICATE_TRACE_PROMETHEUS_PORT"] = str(int(metrics_port) + worker_id)
+    tracing.configure_from_env()
+
+    # Deferred so the supervisor never pays the crewai import
+    from sissificate_dev.crew import SissificateDevCrew
+    from sissificate_dev.main import execute_task
+
+    crew_instance = SissificateDevCrew()
+    leases = LeaseManager()
+    github_claim = GitHubClaim()
+    # Pipe sends are synchronous, so the supervisor knows our task even if we crash right after
+    events.send(("idle", worker_id, None, None))
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+
+        # Sent before claiming, so the supervisor can release the claim if we die halfway
+        events.send(("claiming", worker_id, task["task_id"], task["issue_number"]))
+        if not claim_task(task, leases=leases, github=github_claim):
+            events.send(("skipped", worker_id, task["task_id"], None))
+            events.send(("idle", worker_id, None, None))
+            continue
+
+        events.send(("started", worker_id, task["task_id"], task["issue_number"]))
+        try:
+            execute_task(crew_instance, task, leases, github_claim)
+            events.send(("done", worker_id, task["task_id"], True))
+        except Exception:
+            events.send(("done", worker_id, task["task_id"], False))
+        events.send(("idle", worker_id, None, None))
+
+
+class Supervisor:
+    """Keeps N workers alive and hands them tasks as they become idle."""
+
+    def __init__(self, workers: int, epic: Optional[str] = None, poll_interval: float = 30.0,
+                 agent_prefix: Optional[str] = None):
+        self.worker_count = workers
+        self.epic = epic
+        self.poll_interval = poll_interval
+        self.agent_prefix = agent_prefix or os.environ.get("AGENT_ID", "1")
+        self.task_queue: mp.Queue = mp.Queue()
+        self.events: Dict[int, Connection] = {}
+        self.processes: Dict[int, mp.Process] = {}
+        self.idle: Set[int] = set()
+        # Workers that reported idle since they were spawned, i.e. got through startup
+        self.ready: Set[int] = set()
+        self.startup_crashes: Dict[int, int] = {}
+        # Worker id -> when to restart it; checked every loop, never slept on
+        self.restart_at: Dict[int, float] = {}
+        # Task each worker is claiming or running, so a dead worker's claim can be released
+        self.running: Dict[int, Dict[str, Any]] = {}
+        self.queued: Set[str] = set()
+        self.skipped: Set[str] = set()
+        self.stopping = False
+        self.next_poll = 0.0
+        self.mirror = open_mirror()
+        self.mirror_version = self.mirror.version()
+        self.completed = 0
+        self.failed = 0
+
+    def _spawn(self, worker_id: int):
+        reader, writer = mp.Pipe(duplex=False)
+        process = mp.Process(
+            target=worker_main,
+            args=(worker_id, self.agent_prefix, self.task_queue, writer),
+            name=f"sissificate-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        writer.close()
+        self.events[worker_id] = reader
+        self.processes[worker_id] = process
+        self.ready.discard(worker_id)
+        print(f"👷 Worker {worker_id} started (pid {process.pid})")
+
+    def _handle_event(self, event):
+        kind, worker_id, task_id, detail = event
+        if kind == "idle":
+            self.idle.add(worker_id)
+            self.ready.add(worker_id)
+            self.startup_crashes.pop(worker_id, None)
+            self.running.pop(worker_id, None)
+            # Hand the freed worker a task right away instead of waiting for the next poll
+            self.next_poll = 0.0
+        elif kind == "claiming":
+            self.idle.discard(worker_id)
+            self.running[worker_id] = {"task_id": task_id, "issue_number": detail, "started": False}
+            self.queued.discard(task_id)
+        elif kind == "started":
+            self.running[worker_id] = {"task_id": task_id, "issue_number": detail, "started": True}
+            print(f"🚀 Worker {worker_id} started {task_id}")
+        elif kind == "skipped":
+            self.running.pop(worker_id, None)
+            self.skipped.add(task_id)
+        elif kind == "done":
+            if detail:
+                self.completed += 1
+                print(f"✅ Worker {worker_id} finished {task_id}")
+            else:
+                self.failed += 1
+                print(f"❌ Worker {worker_id} failed {task_id}")
+
+    def _check_workers(self):
+        for worker_id, process in list(self.processes.items()):
+            if process.is_alive() or self.stopping:
+                continue
+            print(f"💥 Worker {worker_id} exited with code {process.exitcode}")
+            reader = self.events.pop(worker_id, None)
+            try:
+                # Whatever it sent before dying, e.g. the task it was claiming
+                while reader is not None and reader.poll():
+                    self._handle_event(reader.recv())
+            except (EOFError, OSError):
+                pass
+            self.idle.discard(worker_id)
+            # It may have taken any queued task off the queue before dying; let them be dispatched
+            # again (a duplicate only costs the second worker a lost claim)
+            self.queued.clear()
+            crashed = self.running.pop(worker_id, None)
+            if crashed:
+                self._release_crashed(worker_id, process.pid, crashed)
+            del self.processes[worker_id]
+            self._schedule_restart(worker_id)
+        for worker_id, at in list(self.restart_at.items()):
+            if time.time() >= at and not self.stopping:
+                del self.restart_at[worker_id]
+                self._spawn(worker_id)
+
+    def _schedule_restart(self, worker_id: int):
+        if worker_id in self.ready:
+            # It got through startup, so the crash was the task's doing: restart right away
+            self.restart_at[worker_id] = time.time()
+            return
+        crashes = self.startup_crashes[worker_id] = self.startup_crashes.get(worker_id, 0) + 1
+        if crashes >= MAX_STARTUP_CRASHES:
+            print(f"🛑 Worker {worker_id} crashed at startup {crashes} times in a row; not restarting it")
+            if not self.processes and not self.restart_at:
+                print("🛑 No workers left")
+                self.stopping = True
+            return
+        delay = min(MIN_RESTART_INTERVAL * 2 ** (crashes - 1), MAX_RESTART_DELAY)
+        print(f"⏳ Worker {worker_id} crashed at startup; restarting in {delay:.0f}s")
+        self.restart_at[worker_id] = time.time() + delay
+
+    def _release_crashed(self, worker_id: int, pid: int, crashed: Dict[str, Any]):
+        """Hand back the task a dead worker was claiming or running."""
+        leases = LeaseManager()
+        lease = leases.read(crashed["task_id"])
+        # Mid-claim, the lease may not exist yet or may belong to the agent that won the task
+        if not lease or lease.get("pid") != pid or lease.get("host") != socket.gethostname():
+            return
+        if crashed["started"]:
+            self.failed += 1
+        leases.release(crashed["task_id"], force=True)
+        try:
+            GitHubClaim().unclaim(crashed["issue_number"], failed=crashed["started"],
+                                  agent=worker_agent_name(self.agent_prefix, worker_id))
+        except Exception as e:
+            print(f"⚠️ Could not unclaim {crashed['task_id']}: {e}")
+
+    def _dispatch(self):
+        # Only queue as many tasks as there are idle workers, so nothing waits behind a long run
+        first = True
+        while len(self.idle) > len(self.queued):
+            busy = {r["task_id"] for r in self.running.values()}
+            # One mirror sync per dispatch; the following picks read the same snapshot
+            task = select_task(epic=self.epic, exclude=busy | self.queued | self.skipped, sync=first)
+            first = False
+            if not task:
+                return
+            self.queued.add(task["task_id"])
+            self.task_queue.put(task)
+
+    def _request_stop(self, signum, frame):
+        print("\n🛑 Stopping after current tasks...")
+        self.stopping = True
+
+    def run(self):
+        """Run until SIGINT/SIGTERM, then let workers finish their current task."""
+        signal.signal(signal.SIGINT, self._request_stop)
+        signal.signal(signal.SIGTERM, self._request_stop)
+
+        for worker_id in range(1, self.worker_count + 1):
+            self._spawn(worker_id)
+
+        while not self.stopping:
+            if self.events:
+                ready = wait(list(self.events.values()), timeout=1.0)
+            else:
+                # Every worker is waiting to be restarted
+                time.sleep(1.0)
+                ready = []
+            for reader in ready:
+                try:
+                    self._handle_event(reader.recv())
+                except EOFError:
+                    # Worker is gone; _check_workers restarts it
+                    self.events = {w: r for w, r in self.events.items() if r is not reader}
+            self._check_workers()
+            # Webhook deliveries land in the mirror; idle workers get a task within a second
+            version = self.mirror.version()
+            if version != self.mirror_version:
+                self.mirror_version = version
+                if self.idle:
+                    self.next_poll = 0.0
+            if time.time() >= self.next_poll:
+                self.next_poll = time.time() + self.poll_interval
+                try:
+                    self._dispatch()
+                except Exception as e:
+                    print(f"⚠️ Dispatch failed: {e}")
+                # Tasks another agent won get another chance on the next poll
+                self.skipped.clear()
+
+        # Drop tasks nobody started yet, then tell every worker to exit after its current one
+        while True:
+            try:
+                self.task_queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in self.processes:
+            self.task_queue.put(None)
+        for process in self.processes.values():
+            process.join()
+
+        print(f"Daemon stopped: {self.completed} completed, {self.failed} failed")
+
+
+def run_daemon(workers: int, epic: Optional[str] = None, poll_interval: float = 30.0):
+    """Start the supervisor in the foreground."""
+    # Workers import main anyway; the supervisor only needs the credential check
+    from sissificate_dev.main import require_credentials
+
+    require_credentials()
+    print("=" * 60)
+    print("🚀 Sissificate Development Crew - Daemon")
+    print("=" * 60)
+    print(f"Workers: {workers}")
+    print(f"Epic: {epic or 'Any'}")
+    print(f"Poll Interval: {poll_interval}s")
+    print("=" * 60)
+    print()
+    Supervisor(workers, epic=epic, poll_interval=poll_interval).run()
@@ -0,0 +1,114 @@
+"""
+Concurrent task execution
+Runs a crew's tasks as the dependency graph their `context:` declares: each
+task starts as soon as the tasks it needs are done, up to a fixed number at once
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from crewai import Crew, Process, Task
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.crews.crew_output import CrewOutput
+from crewai.types.usage_metrics import UsageMetrics
+
+
+class DagExecutor:
+    """
+    Executes tasks (dependencies first, as SissificateDevCrew.create_task
+    returns them) with one single-task crew per task, kicked off with
+    kickoff_async. Each crew runs a copy of its task, so the tasks passed in
+    are left as they are; context outputs reach a task exactly as in a
+    sequential crew, through Task.context.
+    """
+
+    def __init__(self, tasks: List[Task], max_concurrency: int = 2, verbose: bool = True):
+        self.tasks = tasks
+        self.max_concurrency = max(1, max_concurrency)
+        self.verbose = verbose
+        names = [task.name for task in tasks]
+        if len(set(names)) != len(names):
+            raise ValueError("DagExecutor needs uniquely named tasks")
+        # Task name -> (started, finished) offsets from kickoff, in seconds
+        self.timings: Dict[str, tuple] = {}
+
+    def _dependencies(self, task: Task) -> List[Task]:
+        context = task.context if isinstance(task.context, list) else []
+        return [dependency for dependency in context if dependency in self.tasks]
+
+    @staticmethod
+    def _fresh(agent: BaseAgent) -> BaseAgent:
+        # An agent keeps per-execution state, so concurrent work needs its own copy;
+        # the LLM stack is shared as before (copy() would clone it)
+        llm = agent.llm
+        agent = agent.copy()
+        agent.llm = llm
+        return agent
+
+    def critical_path(self) -> float:
+        """Longest chain of task durations from the last run: the best wall time concurrency can reach."""
+        finish: Dict[str, float] = {}
+        for task in self.tasks:
+            started, finished = self.timings.get(task.name, (0.0, 0.0))
+            finish[task.name] = (finished - started) + max(
+                (finish[d.name] for d in self._dependencies(task)), default=0.0
+            )
+        return max(finish.values(), default=0.0)
+
+    async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = None) -> CrewOutput:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        busy_agents = set()
+        kickoff_at = time.perf_counter()
+        self.timings = {}
+        agents = list({id(task.agent): task.agent for task in self.tasks if task.agent}.values())
+        copies: Dict[str, Task] = {}
+
+        async def run(task: Task, dependencies: List[asyncio.Task]):
+            await asyncio.gather(*dependencies)
+            async with semaphore:
+                agent = task.agent
+                if id(agent) in busy_agents:
+                    agent = self._fresh(agent)
+                # A delegating agent gets the same coworkers a sequential crew would give it,
+                # each a copy since the originals may be busy with tasks of their own
+                coworkers = [self._fresh(other) for other in agents if other.role != agent.role] \
+                    if agent.allow_delegation else []
+                # Run a copy so the caller's tasks keep their agents; context points at the
+                # copies that already ran, whose outputs the sequential crew would pass on
+                context = task.context if isinstance(task.context, list) else []
+                node = task.copy([agent], {dependency.key: copies.get(dependency.key, dependency)
+                                           for dependency in context})
+                copies[task.key] = node
+                busy_agents.add(id(agent))
+                started = time.perf_counter() - kickoff_at
+                try:
+                    crew = Crew(agents=[agent, *coworkers], tasks=[node], process=Process.sequential,
+                                verbose=self.verbose)
+                    await crew.kickoff_async(inputs=inputs or {})
+                finally:
+                    busy_agents.discard(id(agent))
+                    self.timings[task.name] = (started, time.perf_counter() - kickoff_at)
+            return node.output
+
+        jobs: Dict[str, asyncio.Task] = {}
+        for task in self.tasks:
+            dependencies = [jobs[dependency.name] for dependency in self._dependencies(task)]
+            jobs[task.name] = asyncio.create_task(run(task, dependencies))
+        try:
+            outputs = await asyncio.gather(*jobs.values())
+        except BaseException:
+            for job in jobs.values():
+                job.cancel()
+            raise
+
+        usage = UsageMetrics()
+        # Agents configured with the same model share one LLM; count each once
+        for llm in {id(task.agent.llm): task.agent.llm for task in self.tasks}.values():
+            usage.add_usage_metrics(llm.get_token_usage_summary())
+        final = outputs[-1]
+        return CrewOutput(raw=final.raw, pydantic=final.pydantic, json_dict=final.json_dict,
+                          tasks_output=outputs, token_usage=usage)
+
+    def kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> CrewOutput:
+        return asyncio.run(self.kickoff_async(inputs))
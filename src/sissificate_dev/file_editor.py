@@ -0,0 +1,175 @@
+"""
+Patch-based, atomic file edits
+Applies search/replace hunks or unified diffs with unique-anchor validation,
+and writes through temp file + rename under a per-path lock
+"""
+
+import fcntl
+import hashlib
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from sissificate_dev.settings import cache_dir
+
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+class EditError(Exception):
+    """Raised when an edit cannot be applied unambiguously."""
+
+
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+@contextmanager
+def path_lock(path: str) -> Iterator[None]:
+    """Exclusive lock on a path across threads and processes (lock files live in the cache dir)."""
+    real_path = os.path.realpath(path)
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(real_path, threading.Lock())
+
+    lock_dir = cache_dir() / "locks"
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    lock_file = lock_dir / f"{hashlib.sha1(real_path.encode()).hexdigest()}.lock"
+
+    with thread_lock, open(lock_file, "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read(path: str) -> str:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _write_atomic(path: str, content: str):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def atomic_write(path: str, content: str) -> bool:
+    """Write a file atomically. Returns False (and skips the write) if nothing changed."""
+    with path_lock(path):
+        if os.path.exists(path) and _read(path) == content:
+            return False
+        _write_atomic(path, content)
+        return True
+
+
+def apply_search_replace(content: str, hunks: List[Tuple[str, str]]) -> str:
+    """Replace each search block, which must occur exactly once in the current content."""
+    for index, (search, replace) in enumerate(hunks, start=1):
+        if not search:
+            raise EditError(f"Hunk {index}: empty search text")
+        count = content.count(search)
+        if count == 0:
+            raise EditError(f"Hunk {index}: search text not found")
+        if count > 1:
+            raise EditError(f"Hunk {index}: search text matches {count} places; include more surrounding lines")
+        content = content.replace(search, replace, 1)
+    return content
+
+
+def _diff_path(header: str) -> str:
+    """File named by a `--- ` or `+++ ` line, without the a/ b/ prefix and timestamp."""
+    path = header[4:].rstrip("\r\n").split("\t")[0].strip()
+    return path[2:] if path[:2] in ("a/", "b/") else path
+
+
+def parse_unified_diff(diff: str) -> List[Tuple[str, str]]:
+    """
+    Turn a unified diff into (old block, new block) pairs, one per @@ hunk.
+
+    `--- `/`+++ ` lines are file headers only when they come as a pair right
+    before an @@ line; inside a hunk, `--- x` removes the line `-- x`. A diff
+    naming more than one file is rejected.
+    """
+    hunks: List[Tuple[str, str]] = []
+    old_lines: List[str] = []
+    new_lines: List[str] = []
+    last_targets: List[List[str]] = []
+    paths: List[str] = []
+    in_hunk = False
+
+    lines = diff.splitlines(keepends=True)
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        index += 1
+        if (line.startswith("--- ") and index + 1 < len(lines) and lines[index].startswith("+++ ")
+                and HUNK_HEADER.match(lines[index + 1])):
+            # A file header; the new path names the file unless it is being deleted
+            old_path, new_path = _diff_path(line), _diff_path(lines[index])
+            path = old_path if new_path == "/dev/null" else new_path
+            if path not in paths:
+                paths.append(path)
+            index += 1
+            continue
+        if HUNK_HEADER.match(line):
+            if old_lines or new_lines:
+                hunks.append(("".join(old_lines), "".join(new_lines)))
+            old_lines, new_lines = [], []
+            in_hunk = True
+        elif not in_hunk:
+            continue
+        elif line.startswith("\\"):
+            # "\ No newline at end of file" applies to the line just before it
+            for target in last_targets:
+                target[-1] = target[-1].rstrip("\n")
+        elif line.startswith("-"):
+            old_lines.append(line[1:])
+            last_targets = [old_lines]
+        elif line.startswith("+"):
+            new_lines.append(line[1:])
+            last_targets = [new_lines]
+        else:
+            text = line[1:] if line.startswith(" ") else line
+            old_lines.append(text)
+            new_lines.append(text)
+            last_targets = [old_lines, new_lines]
+    if old_lines or new_lines:
+        hunks.append(("".join(old_lines), "".join(new_lines)))
+
+    if len(paths) > 1:
+        raise EditError(f"Diff touches {len(paths)} files ({', '.join(paths)}); send one diff per file")
+    if not hunks:
+        raise EditError("No @@ hunks found in diff")
+    return hunks
+
+
+def apply_edits(path: str, hunks: List[Tuple[str, str]]) -> bool:
+    """
+    Apply search/replace hunks to a file under its lock.
+
+    Every hunk is validated before anything is written, so a failed edit
+    leaves the file untouched.
+
+    Returns:
+        True if the file changed, False if the edits were a no-op
+    """
+    with path_lock(path):
+        original = _read(path)
+        updated = apply_search_replace(original, hunks)
+        if updated == original:
+            return False
+        _write_atomic(path, updated)
+        return True
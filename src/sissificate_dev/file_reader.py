@@ -0,0 +1,263 @@
+"""
+Ranged, cached file reads
+Line and byte ranges (mmap-backed for large files), a size guard that returns
+a summary instead of huge files and cuts long ranges with a continuation
+offset, and a process-wide cache keyed by
+path + mtime + size so repeated reads never hit the disk. Content is only
+withheld as unchanged from the crew task that already received it
+"""
+
+import functools
+import json
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple
+
+MAX_READ_BYTES = int(os.environ.get("SISSIFICATE_READ_MAX_BYTES", "200000"))
+MMAP_THRESHOLD = 1024 * 1024
+CACHE_CAPACITY = 64 * 1024 * 1024
+# Most "already returned" records kept across all scopes
+SERVED_CAPACITY = 4096
+SUMMARY_LINES = 40
+# Larger .json files are summarized without parsing them
+JSON_SUMMARY_MAX_BYTES = 10 * 1024 * 1024
+
+FileKey = Tuple[str, int, int]
+ServedKey = Tuple[str, str, Tuple[int, int, int, int]]
+
+_local = threading.local()
+
+
+class ReadCache:
+    """LRU of decoded file contents, bounded by total characters."""
+
+    def __init__(self, capacity: int = CACHE_CAPACITY):
+        self.capacity = capacity
+        self.size = 0
+        self.entries: "OrderedDict[FileKey, str]" = OrderedDict()
+        # (scope, path, range) -> (file key, time) of the last read whose content was returned
+        self.served: "OrderedDict[ServedKey, Tuple[FileKey, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: FileKey) -> Optional[str]:
+        with self.lock:
+            content = self.entries.get(key)
+            if content is not None:
+                self.entries.move_to_end(key)
+            return content
+
+    def put(self, key: FileKey, content: str):
+        if len(content) > self.capacity:
+            return
+        with self.lock:
+            if key in self.entries:
+                return
+            self.entries[key] = content
+            self.size += len(content)
+            while self.size > self.capacity:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def last_served(self, key: ServedKey) -> Optional[Tuple[FileKey, float]]:
+        with self.lock:
+            return self.served.get(key)
+
+    def mark_served(self, key: ServedKey, file: FileKey):
+        with self.lock:
+            self.served[key] = (file, time.time())
+            self.served.move_to_end(key)
+            while len(self.served) > SERVED_CAPACITY:
+                self.served.popitem(last=False)
+
+    def forget_served(self):
+        with self.lock:
+            self.served.clear()
+
+
+_cache = ReadCache()
+
+
+@contextmanager
+def read_scope(scope: Optional[str]) -> Iterator[None]:
+    """Reads in this block only skip content already returned within the same scope."""
+    previous = getattr(_local, "scope", None)
+    _local.scope = scope
+    try:
+        yield
+    finally:
+        _local.scope = previous
+
+
+def scoped_reads(tool: Any, scope: Any) -> Any:
+    """
+    Copy of a crewai tool whose calls run in read_scope(scope()). scope is
+    called per call, so it can include the current run ID.
+    """
+    func = tool.func
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with read_scope(scope()):
+            return func(*args, **kwargs)
+
+    return tool.model_copy(update={"func": wrapper})
+
+
+def forget_reads():
+    """Drop every "already returned" record, e.g. when a crew run ends."""
+    _cache.forget_served()
+
+
+def file_key(path: str) -> FileKey:
+    stat = os.stat(path)
+    return (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_text(path: str, key: FileKey) -> str:
+    content = _cache.get(key)
+    if content is None:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        _cache.put(key, content)
+    return content
+
+
+def _line_range_mmap(path: str, start_line: int, end_line: int) -> Tuple[str, int, Optional[str]]:
+    """
+    Lines [start_line, end_line] (1-based) of a large file without loading all
+    of it, cut at MAX_READ_BYTES. Returns the content, its last line and where
+    to continue if it was cut ("start_line=N" or "byte_offset=N").
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = 0
+        line = 1
+        while line < start_line and pos != -1:
+            pos = mm.find(b"\n", pos)
+            if pos != -1:
+                pos += 1
+            line += 1
+        if pos == -1:
+            return "", line - 1, None
+        end = pos
+        while line <= end_line and end < len(mm):
+            next_end = mm.find(b"\n", end)
+            next_end = len(mm) if next_end == -1 else next_end + 1
+            if next_end - pos > MAX_READ_BYTES:
+                if end == pos:
+                    # A single line over the limit: return its start, the rest by byte range
+                    cut = pos + MAX_READ_BYTES
+                    return mm[pos:cut].decode("utf-8", errors="replace"), line, f"byte_offset={cut}"
+                return mm[pos:end].decode("utf-8", errors="replace"), line - 1, f"start_line={line}"
+            end = next_end
+            line += 1
+        return mm[pos:end].decode("utf-8", errors="replace"), line - 1, None
+
+
+def _line_range_text(content: str, start_line: int, end_line: int) -> Tuple[str, int, Optional[str]]:
+    """_line_range_mmap for a file already decoded (and cached)."""
+    lines = content.splitlines(keepends=True)
+    taken, total = [], 0
+    for number, line in enumerate(lines[start_line - 1:end_line], start=start_line):
+        if total + len(line.encode("utf-8")) > MAX_READ_BYTES:
+            if taken:
+                return "".join(taken), number - 1, f"start_line={number}"
+            cut = line.encode("utf-8")[:MAX_READ_BYTES]
+            offset = len("".join(lines[:start_line - 1]).encode("utf-8")) + len(cut)
+            return cut.decode("utf-8", errors="ignore"), number, f"byte_offset={offset}"
+        taken.append(line)
+        total += len(line.encode("utf-8"))
+    return "".join(taken), min(end_line, len(lines)), None
+
+
+def _byte_range(path: str, offset: int, length: int, size: int) -> str:
+    if size >= MMAP_THRESHOLD:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[offset:offset + length].decode("utf-8", errors="replace")
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(length).decode("utf-8", errors="replace")
+
+
+def summarize(path: str, size: int) -> str:
+    """Short description of a file too large to return whole."""
+    with open(path, "rb") as f:
+        head = b"".join(f.readline() for _ in range(SUMMARY_LINES)).decode("utf-8", errors="replace")
+        f.seek(0)
+        line_count = 0
+        chunk = b""
+        for chunk in iter(lambda: f.read(MMAP_THRESHOLD), b""):
+            line_count += chunk.count(b"\n")
+        if chunk and not chunk.endswith(b"\n"):
+            line_count += 1
+
+    summary = f"File is {size} bytes / {line_count} lines (limit {MAX_READ_BYTES} bytes).\n"
+    if path.endswith(".json") and size <= JSON_SUMMARY_MAX_BYTES:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                summary += f"Top-level keys: {', '.join(list(data)[:50])}\n"
+        except ValueError:
+            pass
+    summary += "Read it in parts with start_line/end_line or byte_offset/byte_length.\n"
+    summary += f"First {SUMMARY_LINES} lines:\n{head}"
+    return summary
+
+
+def read_file_range(path: str, start_line: int = 0, end_line: int = 0, byte_offset: int = 0,
+                    byte_length: int = 0, force: bool = False) -> str:
+    """
+    Read a file or part of it.
+
+    Args:
+        path: Absolute path of the file
+        start_line: First line to return, 1-based (0 = from the start)
+        end_line: Last line to return, inclusive (0 = to the end)
+        byte_offset: Start of a byte range (used with byte_length)
+        byte_length: Length of a byte range; takes precedence over line ranges
+        force: Return the content even if it was already returned unchanged
+
+    Returns:
+        The requested content (ranges are cut at MAX_READ_BYTES, with a note
+        saying where to continue), a summary for oversized files, or an
+        "unchanged since last read" note (only inside a read_scope that
+        already received this content)
+    """
+    key = file_key(path)
+    size = key[2]
+    scope = getattr(_local, "scope", None)
+    served_key = (scope, key[0], (start_line, end_line, byte_offset, byte_length))
+
+    previous = _cache.last_served(served_key) if scope else None
+    if previous and previous[0] == key and not force:
+        read_at = time.strftime("%H:%M:%S", time.localtime(previous[1]))
+        return f"Unchanged since last read at {read_at} ({size} bytes). Pass force=True to get the content again."
+
+    if byte_length:
+        length = min(byte_length, MAX_READ_BYTES)
+        content = _byte_range(path, byte_offset, length, size)
+        if length < byte_length and byte_offset + length < size:
+            content += (f"\n[cut at {MAX_READ_BYTES} bytes; continue with "
+                        f"byte_offset={byte_offset + length}]")
+    elif start_line or end_line:
+        start = max(start_line, 1)
+        end = end_line or 2 ** 31
+        if size >= MMAP_THRESHOLD:
+            content, last, resume = _line_range_mmap(path, start, end)
+        else:
+            content, last, resume = _line_range_text(_read_text(path, key), start, end)
+        content = f"[lines {start}-{last}]\n{content}"
+        if resume:
+            content += f"\n[cut at {MAX_READ_BYTES} bytes; continue with {resume}]"
+    elif size > MAX_READ_BYTES:
+        return summarize(path, size)
+    else:
+        content = _read_text(path, key)
+
+    if scope:
+        _cache.mark_served(served_key, key)
+    return content
@@ -0,0 +1,258 @@
+"""
+Shared GitHub REST client
+Keep-alive connection pool plus an on-disk ETag/Last-Modified cache, so repeated
+reads of unchanged resources come back as 304s that do not count against the rate limit.
+Every request first draws from the host-wide rate-limit governor
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import parse_header_links
+
+from sissificate_dev.rate_limit import PRIORITY_NORMAL, get_governor, header_number
+from sissificate_dev.settings import cache_dir
+from sissificate_dev.tracing import annotate
+
+GITHUB_API_URL = "https://api.github.com"
+API_VERSION = "2022-11-28"
+
+# Response headers worth keeping alongside a cached body (pagination, rate limit info)
+CACHED_HEADERS = ("Link", "Content-Type")
+
+# Primary budget per resource until GitHub reports the real one (authenticated token)
+DEFAULT_HOURLY_LIMITS = {"core": 5000, "graphql": 5000, "search": 30 * 60}
+# Secondary limit: 900 points a minute, GETs cost 1 and mutations 5
+# https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
+SECONDARY_POINTS_PER_MINUTE = 900
+MUTATION_POINTS = 5
+# Rate-limited responses retried after waiting out Retry-After / the reset
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class GitHubResponse:
+    """Minimal response wrapper shared by live and cache-served responses."""
+
+    def __init__(self, status_code: int, text: str, headers: Dict[str, str], from_cache: bool = False):
+        self.status_code = status_code
+        self.text = text
+        self.headers = CaseInsensitiveDict(headers)
+        self.from_cache = from_cache
+
+    def json(self) -> Any:
+        return json.loads(self.text) if self.text else None
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 400
+
+    @property
+    def links(self) -> Dict[str, str]:
+        """Link header relations, e.g. {"next": "https://api.github.com/...&page=2"}."""
+        header = self.headers.get("Link")
+        if not header:
+            return {}
+        return {link["rel"]: link["url"] for link in parse_header_links(header) if "rel" in link}
+
+
+class ConditionalCache:
+    """On-disk store of validators (ETag/Last-Modified) and bodies for GET requests."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        # Write to a temp file and rename so concurrent agents never read a torn entry
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+
+class GitHubClient:
+    """Pooled GitHub REST client with conditional-request caching."""
+
+    def __init__(self, token: Optional[str] = None, base_url: Optional[str] = None,
+                 cache: Optional[ConditionalCache] = None, timeout: int = 30):
+        self.token = token if token is not None else os.environ.get("GITHUB_TOKEN", "")
+        self.base_url = (base_url or os.environ.get("GITHUB_API_URL") or GITHUB_API_URL).rstrip("/")
+        self.cache = cache or ConditionalCache(cache_dir() / "http")
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": API_VERSION
+        })
+        if self.token:
+            self.session.headers["Authorization"] = f"Bearer {self.token}"
+
+    def _url(self, endpoint: str) -> str:
+        if endpoint.startswith("http://") or endpoint.startswith("https://"):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    @property
+    def identity(self) -> str:
+        return hashlib.sha256(self.token.encode()).hexdigest()
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        # Cached bodies are scoped to the token so different identities never share entries
+        prepared = requests.Request("GET", url, params=params).prepare()
+        return hashlib.sha256(f"{self.identity}|{prepared.url}".encode()).hexdigest()
+
+    def _bucket(self, resource: str) -> str:
+        # Rate limits belong to the token, so every process using it shares the bucket
+        return f"github:{self.identity[:12]}:{resource}"
+
+    def _throttle(self, method: str, url: str, priority: str) -> str:
+        """Wait for budget in the primary and secondary buckets; returns the primary bucket's resource."""
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        resource = "graphql" if path.startswith("/graphql") else "search" if path.startswith("/search/") else "core"
+        hourly = DEFAULT_HOURLY_LIMITS[resource]
+        governor = get_governor()
+        waited = governor.acquire(self._bucket(resource), priority=priority, capacity=hourly, rate=hourly / 3600)
+        waited += governor.acquire(
+            self._bucket("points"),
+            cost=1 if method in ("GET", "HEAD") else MUTATION_POINTS,
+            priority=priority,
+            capacity=SECONDARY_POINTS_PER_MINUTE,
+            rate=SECONDARY_POINTS_PER_MINUTE / 60
+        )
+        if waited > 0.05:
+            annotate(rate_limit_wait_ms=round(waited * 1000, 1))
+        return resource
+
+    def _learn(self, response: requests.Response, resource: str) -> Optional[float]:
+        """
+        Feed the rate-limit headers back to the governor.
+
+        Returns:
+            Seconds to wait before retrying if the response was rate limited, else None
+        """
+        headers = response.headers
+        governor = get_governor()
+        remaining = header_number(headers, "X-RateLimit-Remaining")
+        if remaining is not None:
+            governor.learn(
+                self._bucket(headers.get("X-RateLimit-Resource") or resource),
+                remaining=remaining,
+                limit=header_number(headers, "X-RateLimit-Limit"),
+                reset_at=header_number(headers, "X-RateLimit-Reset")
+            )
+
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = header_number(headers, "Retry-After")
+        if retry_after is None and remaining == 0:
+            # Primary budget spent: the bucket learned above already waits for the reset
+            reset_at = header_number(headers, "X-RateLimit-Reset") or time.time() + 60
+            return max(1.0, reset_at - time.time())
+        if retry_after is None:
+            if response.status_code != 429 and "rate limit" not in response.text.lower():
+                return None  # A plain permission error
+            # Secondary limit without Retry-After: GitHub asks for at least a minute
+            retry_after = 60.0
+        governor.learn(self._bucket("points"), retry_after=retry_after,
+                       capacity=SECONDARY_POINTS_PER_MINUTE, rate=SECONDARY_POINTS_PER_MINUTE / 60)
+        return retry_after
+
+    def request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                json_data: Any = None, headers: Optional[Dict[str, str]] = None,
+                priority: str = PRIORITY_NORMAL) -> GitHubResponse:
+        """
+        Send a request; GETs are revalidated against the on-disk cache.
+
+        Waits for the shared rate-limit budget first (claims pass
+        PRIORITY_HIGH, bulk reads PRIORITY_LOW) and retries rate-limited
+        responses once the governor says the wait is over.
+        """
+        method = method.upper()
+        url = self._url(endpoint)
+        request_headers = dict(headers or {})
+
+        key = None
+        cached = None
+        if method == "GET":
+            key = self._cache_key(url, params)
+            cached = self.cache.get(key)
+            if cached:
+                if cached.get("etag"):
+                    request_headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            resource = self._throttle(method, url, priority)
+            response = self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json_data,
+                headers=request_headers,
+                timeout=self.timeout
+            )
+            if self._learn(response, resource) is None:
+                break
+        annotate(http_status=response.status_code, http_method=method, attempts=attempt + 1)
+
+        if response.status_code == 304 and cached:
+            merged = dict(cached.get("headers", {}))
+            merged.update(response.headers)
+            return GitHubResponse(cached["status_code"], cached["body"], merged, from_cache=True)
+
+        if key and response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.cache.put(key, {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "status_code": response.status_code,
+                    "headers": {h: response.headers[h] for h in CACHED_HEADERS if h in response.headers},
+                    "body": response.text
+                })
+
+        return GitHubResponse(response.status_code, response.text, dict(response.headers))
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            priority: str = PRIORITY_NORMAL) -> GitHubResponse:
+        return self.request("GET", endpoint, params=params, priority=priority)
+
+
+_clients: Dict[str, GitHubClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(token: Optional[str] = None) -> GitHubClient:
+    """Process-wide client per token, so every caller shares one connection pool."""
+    token = token if token is not None else os.environ.get("GITHUB_TOKEN", "")
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = GitHubClient(token=token)
+            _clients[token] = client
+        return client
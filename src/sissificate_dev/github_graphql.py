@@ -0,0 +1,225 @@
+"""
+GitHub GraphQL client
+Batches many issues into one aliased query, follows cursor pagination and
+reads/writes the Projects v2 "Status" field the workflow depends on
+"""
+
+import os
+from typing import Any, Dict, Iterable, Iterator, Literal, Optional, Sequence
+
+from sissificate_dev.github_client import GitHubClient, get_client
+
+ProjectStatus = Literal["Todo", "Ready", "In Progress", "In QA", "Done"]
+PROJECT_STATUSES = ("Todo", "Ready", "In Progress", "In QA", "Done")
+
+PROJECT_ITEM_FIELDS = """
+fragment ProjectItemFields on ProjectV2Item {
+  id
+  project { id number title }
+  status: fieldValueByName(name: "Status") {
+    ... on ProjectV2ItemFieldSingleSelectValue { name optionId }
+  }
+}
+"""
+
+# Connections are cut at `first:`; fetch_issues follows the rest with the *_PAGE queries
+ISSUE_FIELDS = """
+fragment IssueFields on Issue {
+  id
+  number
+  title
+  state
+  url
+  updatedAt
+  labels(first: 50) { nodes { name } pageInfo { hasNextPage endCursor } }
+  assignees(first: 10) { nodes { login } }
+  projectItems(first: 10) {
+    nodes { ...ProjectItemFields }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+""" + PROJECT_ITEM_FIELDS
+
+LABELS_PAGE = """
+query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $number) {
+      labels(first: 100, after: $cursor) { nodes { name } pageInfo { hasNextPage endCursor } }
+    }
+  }
+}
+"""
+
+PROJECT_ITEMS_PAGE = """
+query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $number) {
+      projectItems(first: 50, after: $cursor) {
+        nodes { ...ProjectItemFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + PROJECT_ITEM_FIELDS
+
+PROJECT_STATUS_FIELD = """
+query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $number) {
+      projectItems(first: 50, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          project {
+            id
+            number
+            field(name: "Status") {
+              ... on ProjectV2SingleSelectField { id options { id name } }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+UPDATE_STATUS = """
+mutation($project: ID!, $item: ID!, $field: ID!, $option: String!) {
+  updateProjectV2ItemFieldValue(input: {
+    projectId: $project, itemId: $item, fieldId: $field,
+    value: { singleSelectOptionId: $option }
+  }) { projectV2Item { id } }
+}
+"""
+
+
+class GraphQLError(Exception):
+    """Raised when GitHub answers a GraphQL request with errors and no data."""
+
+
+def project_number() -> Optional[int]:
+    """Projects v2 board holding the DEV- workflow (GITHUB_PROJECT_NUMBER)."""
+    value = os.environ.get("GITHUB_PROJECT_NUMBER")
+    return int(value) if value else None
+
+
+class GitHubGraphQL:
+    """Thin GraphQL layer on top of the shared pooled client."""
+
+    def __init__(self, client: Optional[GitHubClient] = None):
+        self.client = client or get_client()
+
+    def execute(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a query and return its `data`; partial results are kept when some fields fail."""
+        response = self.client.request("POST", "/graphql", json_data={
+            "query": query,
+            "variables": variables or {}
+        })
+        payload = response.json() or {}
+        if response.status_code != 200 or (payload.get("errors") and not payload.get("data")):
+            raise GraphQLError(f"GraphQL request failed ({response.status_code}): {payload.get('errors') or response.text[:200]}")
+        return payload["data"]
+
+    def paginate(self, query: str, variables: Dict[str, Any], path: Sequence[str],
+                 cursor: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every node of a connection, following `pageInfo.endCursor`.
+
+        The query must take a `$cursor: String` variable and select
+        `pageInfo { hasNextPage endCursor }` and `nodes` on the connection at `path`.
+        Pass `cursor` to continue a connection whose first page is already in hand.
+        A missing object on the path (e.g. an unknown issue) yields nothing.
+        """
+        while True:
+            connection = self.execute(query, {**variables, "cursor": cursor})
+            for key in path:
+                connection = (connection or {}).get(key)
+            if not connection:
+                return
+            yield from connection["nodes"]
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            cursor = page_info["endCursor"]
+
+    def _complete(self, owner: str, repo: str, issue: Dict[str, Any]):
+        """Append the label and project item pages the batched query cut off."""
+        for key, query in (("labels", LABELS_PAGE), ("projectItems", PROJECT_ITEMS_PAGE)):
+            connection = issue.get(key) or {}
+            page_info = connection.get("pageInfo") or {}
+            if page_info.get("hasNextPage"):
+                connection["nodes"] = connection.get("nodes", []) + list(self.paginate(
+                    query, {"owner": owner, "repo": repo, "number": issue["number"]},
+                    ("repository", "issue", key), cursor=page_info["endCursor"]
+                ))
+                connection["pageInfo"] = {"hasNextPage": False, "endCursor": None}
+
+    def fetch_issues(self, owner: str, repo: str, numbers: Sequence[int],
+                     batch_size: int = 50) -> Dict[int, Dict[str, Any]]:
+        """Issues with labels, assignees and project items, `batch_size` issues per round trip."""
+        issues: Dict[int, Dict[str, Any]] = {}
+        numbers = list(dict.fromkeys(int(n) for n in numbers))
+        for start in range(0, len(numbers), batch_size):
+            batch = numbers[start:start + batch_size]
+            aliases = "\n".join(f"i{n}: issue(number: {n}) {{ ...IssueFields }}" for n in batch)
+            query = f"""
+            query($owner: String!, $repo: String!) {{
+              repository(owner: $owner, name: $repo) {{
+                {aliases}
+              }}
+            }}
+            {ISSUE_FIELDS}
+            """
+            repository = self.execute(query, {"owner": owner, "repo": repo}).get("repository") or {}
+            for n in batch:
+                issue = repository.get(f"i{n}")
+                if issue:
+                    self._complete(owner, repo, issue)
+                    issues[n] = issue
+        return issues
+
+    def get_project_statuses(self, owner: str, repo: str, numbers: Sequence[int]) -> Dict[int, Optional[str]]:
+        """Projects v2 "Status" per issue number (None when the issue is not on the board)."""
+        return {
+            number: project_status(issue)
+            for number, issue in self.fetch_issues(owner, repo, numbers).items()
+        }
+
+    def set_project_status(self, owner: str, repo: str, number: int, status: ProjectStatus) -> bool:
+        """Move an issue's project item to `status`. Returns False if it is not on the board."""
+        if status not in PROJECT_STATUSES:
+            raise ValueError(f"Unknown project status: {status}")
+
+        items = self.paginate(PROJECT_STATUS_FIELD, {"owner": owner, "repo": repo, "number": number},
+                              ("repository", "issue", "projectItems"))
+        for item in _board_items(items):
+            field = item["project"].get("field") or {}
+            option = next((o for o in field.get("options", []) if o["name"] == status), None)
+            if not option:
+                continue
+            self.execute(UPDATE_STATUS, {
+                "project": item["project"]["id"],
+                "item": item["id"],
+                "field": field["id"],
+                "option": option["id"]
+            })
+            return True
+        return False
+
+
+def _board_items(items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    # Restrict to the configured board when GITHUB_PROJECT_NUMBER is set; lazy, so a match stops paging
+    number = project_number()
+    return (item for item in items if number is None or (item.get("project") or {}).get("number") == number)
+
+
+def project_status(issue: Dict[str, Any]) -> Optional[str]:
+    """Status field value from an issue fetched with the IssueFields fragment."""
+    items = (issue.get("projectItems") or {}).get("nodes", [])
+    for item in _board_items(items):
+        status = item.get("status") or {}
+        if status.get("name"):
+            return status["name"]
+    return None
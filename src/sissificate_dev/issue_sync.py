@@ -0,0 +1,327 @@
+"""
+Incremental issue sync for the DEV- backlog
+Mirrors GitHub issues into a local SQLite database: one paginated full pull,
+then `since` deltas, so the panel and the crew query locally instead of GitHub
+"""
+
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from sissificate_dev.github_client import GitHubClient, get_client
+from sissificate_dev.rate_limit import PRIORITY_LOW
+from sissificate_dev.settings import cache_dir, github_repository
+
+EPIC_PATTERN = re.compile(r"\bPEPIC-\d+\b")
+# Change log rows kept for subscribers that fell behind
+CHANGE_LOG_SIZE = 10000
+# A webhook receiver counts as live this long after its last verified delivery
+WEBHOOK_MAX_AGE = float(os.environ.get("SISSIFICATE_WEBHOOK_MAX_AGE", "900"))
+# Even while webhooks are live, sync this often to pick up deliveries that never arrived
+RECONCILE_INTERVAL = float(os.environ.get("SISSIFICATE_RECONCILE_INTERVAL", "300"))
+# Columns added after the first release of the mirror, in order; never edit or reorder
+MIGRATIONS = ["ALTER TABLE issues ADD COLUMN project_status TEXT"]
+# PRAGMA user_version of an up-to-date mirror: the base schema plus every migration
+SCHEMA_VERSION = 1 + len(MIGRATIONS)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    number INTEGER PRIMARY KEY,
+    node_id TEXT,
+    task_id TEXT,
+    title TEXT NOT NULL,
+    state TEXT NOT NULL,
+    assignee TEXT,
+    epic TEXT,
+    labels TEXT NOT NULL DEFAULT '[]',
+    html_url TEXT,
+    updated_at TEXT NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (number, name)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS changes (
+    version INTEGER PRIMARY KEY AUTOINCREMENT,
+    number INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    changed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_title ON issues (state, title);
+CREATE INDEX IF NOT EXISTS idx_issues_task_id ON issues (task_id);
+CREATE INDEX IF NOT EXISTS idx_issues_assignee ON issues (assignee);
+CREATE INDEX IF NOT EXISTS idx_issues_epic ON issues (epic);
+CREATE INDEX IF NOT EXISTS idx_issue_labels_name ON issue_labels (name, number);
+"""
+
+
+class IssueSyncError(Exception):
+    """Raised when GitHub refuses a sync request."""
+
+
+def parse_task_id(title: str) -> Optional[str]:
+    """'DEV-0101: Build login page' -> 'DEV-0101'."""
+    prefix = title.split(":")[0].strip()
+    return prefix if re.fullmatch(r"[A-Z]+-\d+", prefix) else None
+
+
+def parse_epic(issue: Dict[str, Any]) -> Optional[str]:
+    """Epic from a PEPIC-XXX label, falling back to a mention in the issue body."""
+    for label in issue.get("labels", []):
+        match = EPIC_PATTERN.search(label.get("name", ""))
+        if match:
+            return match.group(0)
+    match = EPIC_PATTERN.search(issue.get("body") or "")
+    return match.group(0) if match else None
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    # Turns a prefix match into an index-friendly range: title >= 'DEV-' AND title < 'DEV.'
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class IssueMirror:
+    """Local SQLite mirror of one repository's issues."""
+
+    def __init__(self, owner: str, repo: str, db_path: Optional[Path] = None):
+        self.owner = owner
+        self.repo = repo
+        self.db_path = Path(db_path) if db_path else cache_dir() / f"issues-{owner}-{repo}.sqlite3"
+        with self._connect() as conn:
+            # Opened every second by the panel; only a new or outdated database runs the schema
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                conn.executescript(SCHEMA)
+                for statement in MIGRATIONS[max(version - 1, 0):]:
+                    try:
+                        conn.execute(statement)
+                    except sqlite3.OperationalError:
+                        pass  # a mirror from before user_version already has it
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_state(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+            return row["value"] if row else None
+
+    def set_state(self, key: str, value: str):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def upsert(self, issues: List[Dict[str, Any]]) -> int:
+        """Insert or update issues as returned by the REST API. Pull requests and stale copies are skipped."""
+        count = 0
+        with self._connect() as conn:
+            for issue in issues:
+                if "pull_request" in issue:
+                    continue
+                labels = [l.get("name", "") for l in issue.get("labels", [])]
+                assignee = (issue.get("assignee") or {}).get("login")
+                # Keeps project_status, skips unchanged rows (`since` is inclusive), and never
+                # lets a late webhook delivery roll an issue back
+                written = conn.execute(
+                    """INSERT INTO issues
+                       (number, node_id, task_id, title, state, assignee, epic, labels, html_url, updated_at, raw)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(number) DO UPDATE SET
+                           node_id = excluded.node_id, task_id = excluded.task_id, title = excluded.title,
+                           state = excluded.state, assignee = excluded.assignee, epic = excluded.epic,
+                           labels = excluded.labels, html_url = excluded.html_url,
+                           updated_at = excluded.updated_at, raw = excluded.raw
+                       WHERE excluded.updated_at > issues.updated_at
+                          OR (excluded.updated_at = issues.updated_at AND excluded.raw != issues.raw)""",
+                    (
+                        issue["number"],
+                        issue.get("node_id"),
+                        parse_task_id(issue.get("title", "")),
+                        issue.get("title", ""),
+                        issue.get("state", "open"),
+                        assignee,
+                        parse_epic(issue),
+                        json.dumps(labels),
+                        issue.get("html_url"),
+                        issue.get("updated_at", ""),
+                        json.dumps(issue)
+                    )
+                ).rowcount
+                if not written:
+                    continue
+                conn.execute("DELETE FROM issue_labels WHERE number = ?", (issue["number"],))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO issue_labels (number, name) VALUES (?, ?)",
+                    [(issue["number"], name) for name in labels]
+                )
+                self._log_change(conn, issue["number"], "issue")
+                count += 1
+            if count:
+                conn.execute("DELETE FROM changes WHERE version <= (SELECT MAX(version) FROM changes) - ?",
+                             (CHANGE_LOG_SIZE,))
+        return count
+
+    def _log_change(self, conn: sqlite3.Connection, number: int, kind: str):
+        conn.execute("INSERT INTO changes (number, kind, changed_at) VALUES (?, ?, ?)", (number, kind, time.time()))
+
+    def delete(self, number: int):
+        """Drop an issue that was deleted or transferred away."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM issues WHERE number = ?", (number,))
+            conn.execute("DELETE FROM issue_labels WHERE number = ?", (number,))
+            self._log_change(conn, number, "deleted")
+
+    def set_project_status(self, node_id: str, status: Optional[str]) -> Optional[int]:
+        """Record an issue's Projects v2 Status by node ID; returns its number if it is mirrored."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT number FROM issues WHERE node_id = ?", (node_id,)).fetchone()
+            if not row:
+                return None
+            conn.execute("UPDATE issues SET project_status = ? WHERE number = ?", (status, row["number"]))
+            self._log_change(conn, row["number"], "project_status")
+            return row["number"]
+
+    def project_statuses(self) -> Dict[int, Optional[str]]:
+        """Projects v2 Status per issue number, as far as webhooks have reported it."""
+        with self._connect() as conn:
+            return {row["number"]: row["project_status"] for row in
+                    conn.execute("SELECT number, project_status FROM issues WHERE project_status IS NOT NULL")}
+
+    def version(self) -> int:
+        """Monotonic counter bumped by every change to the mirror, from any process."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(MAX(version), 0) FROM changes").fetchone()[0]
+
+    def changes_since(self, version: int) -> List[Dict[str, Any]]:
+        """Change log rows (version, number, kind, changed_at) after `version`, oldest first."""
+        with self._connect() as conn:
+            return [dict(row) for row in
+                    conn.execute("SELECT * FROM changes WHERE version > ? ORDER BY version", (version,))]
+
+    def wait_for_change(self, version: int, timeout: float, interval: float = 0.2) -> int:
+        """Block until the mirror moves past `version` (or the timeout passes); returns the new version."""
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self.version()
+            if current > version or time.monotonic() >= deadline:
+                return current
+            time.sleep(interval)
+
+    def webhook_live(self, max_age: float = WEBHOOK_MAX_AGE) -> bool:
+        """
+        True while GitHub is delivering webhooks into a mirror that has had its
+        first full sync. Webhooks only carry changes, so until then the mirror
+        is missing every issue that did not change since the receiver started.
+        """
+        heartbeat = self.get_state("webhook_heartbeat")
+        if not heartbeat or time.time() - float(heartbeat) >= max_age:
+            return False
+        return self.get_state("since") is not None
+
+    def needs_sync(self, interval: float = RECONCILE_INTERVAL) -> bool:
+        """
+        Whether a reader should sync() first: always without live webhooks,
+        otherwise once per `interval`, to catch deliveries GitHub dropped.
+        """
+        if not self.webhook_live():
+            return True
+        synced_at = self.get_state("synced_at")
+        return not synced_at or time.time() - float(synced_at) >= interval
+
+    def query(self, prefix: str = "DEV-", state: str = "open", label: Optional[str] = None,
+              epic: Optional[str] = None, assignee: Optional[str] = None,
+              unassigned: bool = False, task_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Issues matching the filters, as REST API dicts, ordered by task ID."""
+        sql = "SELECT issues.raw FROM issues WHERE state = ?"
+        params: List[Any] = [state]
+        if prefix:
+            sql += " AND title >= ? AND title < ?"
+            params += [prefix, _prefix_upper_bound(prefix)]
+        if task_id:
+            sql += " AND task_id = ?"
+            params.append(task_id)
+        if epic:
+            sql += " AND epic = ?"
+            params.append(epic)
+        if assignee:
+            sql += " AND assignee = ?"
+            params.append(assignee)
+        if unassigned:
+            sql += " AND assignee IS NULL"
+        if label:
+            sql += " AND number IN (SELECT number FROM issue_labels WHERE name = ?)"
+            params.append(label)
+        sql += " ORDER BY task_id, number"
+
+        with self._connect() as conn:
+            return [json.loads(row["raw"]) for row in conn.execute(sql, params)]
+
+    def sync(self, client: Optional[GitHubClient] = None) -> int:
+        """
+        Bring the mirror up to date with GitHub.
+
+        The first run pages through every open issue; later runs only ask for
+        issues updated since the last sync (including ones that were closed).
+
+        Returns:
+            Number of issues written to the mirror
+        """
+        client = client or get_client()
+        since = self.get_state("since")
+        params: Optional[Dict[str, Any]] = {
+            "state": "all" if since else "open",
+            "per_page": 100,
+            "sort": "updated",
+            "direction": "asc"
+        }
+        if since:
+            params["since"] = since
+
+        url: Optional[str] = f"/repos/{self.owner}/{self.repo}/issues"
+        newest = since or ""
+        total = 0
+        while url:
+            response = client.get(url, params=params, priority=PRIORITY_LOW)
+            if response.status_code != 200:
+                raise IssueSyncError(f"GitHub returned {response.status_code} for {url}: {response.text[:200]}")
+            page = response.json() or []
+            total += self.upsert(page)
+            for issue in page:
+                newest = max(newest, issue.get("updated_at") or "")
+            # The next link already carries every query parameter
+            url = response.links.get("next")
+            params = None
+
+        self.set_state("since", newest or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+        self.set_state("synced_at", str(time.time()))
+        return total
+
+
+def open_mirror(owner: Optional[str] = None, repo: Optional[str] = None) -> IssueMirror:
+    """Mirror for the configured repository (GITHUB_OWNER / GITHUB_REPO)."""
+    default_owner, default_repo = github_repository()
+    return IssueMirror(owner or default_owner, repo or default_repo)
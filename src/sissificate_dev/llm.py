@@ -0,0 +1,124 @@
+"""
+LLM wrappers for the crew
+A delegating BaseLLM that layers behaviour (caching, recording, rate limiting,
+model fallback)
+over the provider LLM crewai would otherwise build for each agent
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from crewai.utilities.agent_utils import is_context_length_exceeded
+from pydantic import Field
+
+from sissificate_dev.model_router import record
+from sissificate_dev.rate_limit import PRIORITY_HIGH, get_governor
+
+
+def default_model() -> str:
+    """Model the agents use when none is configured explicitly."""
+    return os.environ.get("OPENAI_MODEL_NAME") or os.environ.get("MODEL") or "gpt-4o"
+
+
+class DelegatingLLM(BaseLLM):
+    """Forwards every call to an inner LLM; subclasses override `call` to add behaviour."""
+
+    inner: Any = Field(exclude=True)
+
+    def __init__(self, inner: BaseLLM, **kwargs: Any):
+        super().__init__(model=inner.model, inner=inner, stop=list(inner.stop), **kwargs)
+
+    def delegate(self, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+                 callbacks: Optional[List[Any]] = None,
+                 available_functions: Optional[Dict[str, Any]] = None,
+                 from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        """Call the inner LLM with the stop words the executor set on this wrapper."""
+        with call_stop_override(self.inner, self.stop_sequences):
+            return self.inner.call(
+                messages, tools=tools, callbacks=callbacks, available_functions=available_functions,
+                from_task=from_task, from_agent=from_agent, response_model=response_model
+            )
+
+    def call(self, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+             callbacks: Optional[List[Any]] = None, available_functions: Optional[Dict[str, Any]] = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        return self.delegate(messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+
+    # The inner LLM already retries on rate limits; don't let crewai nest a second retry loop
+    call._crewai_rate_limit_wrapped = True
+
+    def supports_function_calling(self) -> bool:
+        return bool(getattr(self.inner, "supports_function_calling", lambda: False)())
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words()
+
+    def supports_multimodal(self) -> bool:
+        return self.inner.supports_multimodal()
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        return self.inner.get_token_usage_summary()
+
+
+def provider_llm(model: Optional[str] = None) -> BaseLLM:
+    """The plain provider LLM for a model name."""
+    return LLM(model=model or default_model())
+
+
+class RateLimitedLLM(DelegatingLLM):
+    """
+    Holds each agent role to its requests-per-minute budget (max_rpm in
+    agents.yaml) through the host-wide governor, so the limit covers every
+    agent process rather than each one separately.
+    """
+
+    max_rpm: Dict[str, int] = Field(default_factory=dict)
+
+    def call(self, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+             callbacks: Optional[List[Any]] = None, available_functions: Optional[Dict[str, Any]] = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        role = getattr(from_agent, "role", None)
+        rpm = self.max_rpm.get(role or "")
+        if rpm:
+            # Bursts of up to a tenth of the minute's budget, then a steady rpm/60 per second
+            get_governor().acquire(f"llm:{role}", priority=PRIORITY_HIGH, capacity=max(1.0, rpm / 10), rate=rpm / 60)
+        return self.delegate(messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+
+    call._crewai_rate_limit_wrapped = True
+
+
+class FallbackLLM(DelegatingLLM):
+    """
+    Tries each model of a routing chain in turn: when a call fails, the same
+    request goes to the next one. Context-window errors are raised right away
+    so crewai can summarize instead. Fallbacks are logged to routing.jsonl.
+    """
+
+    fallbacks: List[Any] = Field(default_factory=list, exclude=True)
+    tier: Optional[str] = None
+
+    def call(self, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+             callbacks: Optional[List[Any]] = None, available_functions: Optional[Dict[str, Any]] = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        chain = [self.inner] + list(self.fallbacks)
+        for attempt, llm in enumerate(chain):
+            try:
+                with call_stop_override(llm, self.stop_sequences):
+                    return llm.call(
+                        messages, tools=tools, callbacks=callbacks, available_functions=available_functions,
+                        from_task=from_task, from_agent=from_agent, response_model=response_model
+                    )
+            except Exception as e:
+                if attempt == len(chain) - 1 or is_context_length_exceeded(e):
+                    raise
+                next_model = chain[attempt + 1].model
+                print(f"⚠️ {llm.model} failed ({type(e).__name__}), falling back to {next_model}")
+                record("fallback", task=getattr(from_task, "name", None), agent=getattr(from_agent, "role", None),
+                       tier=self.tier, model=llm.model, fallback=next_model, error=f"{type(e).__name__}: {e}"[:300])
+
+    call._crewai_rate_limit_wrapped = True
@@ -0,0 +1,180 @@
+"""
+Content-addressed LLM response cache
+Responses are stored on disk keyed by a hash of model + messages + tool schemas,
+so re-running a task replays identical reasoning steps instead of paying for them
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from sissificate_dev.llm import DelegatingLLM
+from sissificate_dev.settings import cache_dir
+
+DEFAULT_MAX_BYTES = int(os.environ.get("SISSIFICATE_LLM_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+DEFAULT_MAX_AGE = float(os.environ.get("SISSIFICATE_LLM_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+# Eviction scans the table; only run it every this many writes
+EVICT_EVERY = 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_used ON responses (used_at);
+CREATE INDEX IF NOT EXISTS idx_responses_created ON responses (created_at);
+"""
+
+
+def llm_cache_enabled() -> bool:
+    """The cache is opt-in: SISSIFICATE_LLM_CACHE=1."""
+    return os.environ.get("SISSIFICATE_LLM_CACHE", "").lower() in ("1", "true", "yes", "on")
+
+
+def bypass_from_env() -> Set[str]:
+    """Task names listed in SISSIFICATE_LLM_CACHE_BYPASS (comma-separated) always call the model."""
+    return {name.strip() for name in os.environ.get("SISSIFICATE_LLM_CACHE_BYPASS", "").split(",") if name.strip()}
+
+
+def _schema_of(response_model: Any) -> Any:
+    if response_model is None:
+        return None
+    if hasattr(response_model, "model_json_schema"):
+        return response_model.model_json_schema()
+    return getattr(response_model, "__name__", str(response_model))
+
+
+def cache_key(model: str, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+              stop: Iterable[str] = (), response_model: Any = None) -> str:
+    """Stable hash of everything that determines the model's answer."""
+    tools_hash = hashlib.sha256(
+        json.dumps(tools or [], sort_keys=True, default=str).encode()
+    ).hexdigest()
+    payload = json.dumps({
+        "model": model,
+        "messages": messages,
+        "tools": tools_hash,
+        "stop": sorted(stop),
+        "response_model": _schema_of(response_model)
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """SQLite store of LLM responses with size- and age-based eviction."""
+
+    def __init__(self, db_path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age: float = DEFAULT_MAX_AGE):
+        self.db_path = Path(db_path) if db_path else cache_dir() / "llm-cache.sqlite3"
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.writes = 0
+        self.lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+        self.evict()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.max_age)
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE responses SET used_at = ?, hits = hits + 1 WHERE key = ?", (time.time(), key))
+                conn.commit()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, response: str):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now)
+            )
+            conn.commit()
+        with self.lock:
+            self.writes += 1
+            due = self.writes % EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        with self._connect() as conn:
+            removed = conn.execute("DELETE FROM responses WHERE created_at < ?",
+                                   (time.time() - self.max_age,)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                doomed = []
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY used_at"):
+                    doomed.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+                removed += len(doomed)
+            conn.commit()
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            entries, size, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM responses"
+            ).fetchone()
+        return {"entries": entries, "bytes": size, "hits": hits}
+
+
+class CachedLLM(DelegatingLLM):
+    """
+    Serves repeated prompts from an LLMCache.
+
+    Only plain-text answers are cached. Native tool calls and calls where the
+    LLM runs the tools itself (available_functions) always go to the model, so
+    tools still execute and their side effects are never skipped.
+    """
+
+    cache: Any = None
+    bypass_tasks: Set[str] = set()
+
+    def call(self, messages: Any, tools: Optional[List[Dict[str, Any]]] = None,
+             callbacks: Optional[List[Any]] = None, available_functions: Optional[Dict[str, Any]] = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        task_name = getattr(from_task, "name", None)
+        if available_functions or (task_name and task_name in self.bypass_tasks):
+            return self.delegate(messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+
+        key = cache_key(self.model, messages, tools, self.stop_sequences, response_model)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.delegate(messages, tools, callbacks, available_functions, from_task, from_agent, response_model)
+        if isinstance(response, str) and response:
+            self.cache.put(key, self.model, response)
+        return response
+
+    call._crewai_rate_limit_wrapped = True
@@ -5,26 +5,33 @@ Run autonomous development agents from GitHub Projects
 """
 
 import os
+import signal
 import sys
+import time
+import uuid
 import argparse
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-from sissificate_dev.crew import SissificateDevCrew
+# crewai takes seconds to import: crew and cassette are only imported once a crew is built,
+# so --help, --check, config errors and "nothing to do" exit right away
+from sissificate_dev.task_lease import GitHubClaim, LeaseManager, claim_task
+from sissificate_dev.task_selector import select_task
+from sissificate_dev.worktrees import task_worktree
+from sissificate_dev import tracing
 
+if TYPE_CHECKING:
+    from sissificate_dev.crew import SissificateDevCrew
 
-def run(task_id: str = None, epic: str = None, dry_run: bool = False):
-    """
-    Run the Sissificate Development Crew.
-    
-    Args:
-        task_id: Specific DEV-TASK to work on (e.g., DEV-0101)
-        epic: Preferred epic to work on (e.g., PEPIC-002)
-        dry_run: If True, only show what would be done without executing
-    """
-    # Validate environment
+# How many candidates to try when other agents win the race for a task
+MAX_CLAIM_ATTEMPTS = 5
+
+
+def require_credentials():
+    """Exit with setup instructions unless the OpenAI and GitHub credentials are set."""
     if not os.environ.get("OPENAI_API_KEY"):
         print("❌ Error: OPENAI_API_KEY not set")
         print("   Get your API key from: https://platform.openai.com/api-keys")
@@ -36,10 +43,26 @@ def run(task_id: str = None, epic: str = None, dry_run: bool = False):
         print("   Create a token at: https://github.com/settings/tokens")
         print("   Scopes required: repo, project")
         sys.exit(1)
+
+
+def run(task_id: str = None, epic: str = None, dry_run: bool = False, record: str = None):
+    """
+    Run the Sissificate Development Crew.
+    
+    Args:
+        task_id: Specific DEV-TASK to work on (e.g., DEV-0101)
+        epic: Preferred epic to work on (e.g., PEPIC-002)
+        dry_run: If True, only show what would be done without executing
+        record: Cassette file to record LLM exchanges and tool calls to
+    """
+    require_credentials()
     
     # Set agent name
     agent_id = os.environ.get("AGENT_ID", "1")
     os.environ["AGENT_NAME"] = f"agent-{agent_id}"
+    tracing.configure_from_env()
+    # A stop from the panel arrives as SIGTERM; exit through the finally blocks so the claim is released
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
     
     print("=" * 60)
     print("🚀 Sissificate Development Crew")
@@ -49,18 +72,142 @@ def run(task_id: str = None, epic: str = None, dry_run: bool = False):
     print(f"Epic: {epic or 'Any'}")
     print(f"Dry Run: {dry_run}")
     print(f"Project Path: {os.environ.get('SISSIFICATE_PROJECT_PATH')}")
+    if record:
+        print(f"Recording: {record}")
     print("=" * 60)
     print()
     
     if dry_run:
         print("📋 DRY RUN MODE - No changes will be made")
         print()
+        # Selection only: no lease, no GitHub claim, no crew
+        candidate = select_task(task_id=task_id, epic=epic)
+        if not candidate:
+            print("📭 No available DEV-TASK matches the criteria")
+            return None
+        print(f"🎯 Would claim: {candidate['task_id']} - {candidate['title']} (#{candidate['issue_number']})")
+        print(f"   Epic: {candidate['epic'] or 'None'}")
+        return candidate
+    
+    # Select and claim the task in plain Python; the crew only starts once there is work to do
+    leases = LeaseManager()
+    github_claim = GitHubClaim()
+    selected = claim_next_task(task_id=task_id, epic=epic, leases=leases, github_claim=github_claim)
+    if not selected:
+        print("📭 No available DEV-TASK matches the criteria")
+        return None
     
+    from sissificate_dev.crew import SissificateDevCrew
+    
+    if not record:
+        return execute_task(SissificateDevCrew(), selected, leases, github_claim)
+    
+    from sissificate_dev.cassette import Cassette, use_cassette
+    
+    cassette = Cassette.record(record, selected)
+    use_cassette(cassette)
     try:
-        # Create and run crew
-        crew_instance = SissificateDevCrew()
-        crew = crew_instance.crew(task_id=task_id, epic=epic)
-        result = crew.kickoff()
+        return execute_task(SissificateDevCrew(cassette=cassette), selected, leases, github_claim)
+    finally:
+        use_cassette(None)
+        print(f"📼 Cassette saved to {record}")
+
+
+def replay(path: str):
+    """
+    Re-run a recorded crew execution from its cassette.
+    
+    LLM responses and tool results come from the file, so no API keys,
+    network access, task claims or subprocesses are needed.
+    """
+    # crewai telemetry would otherwise reach out to the network
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+    os.environ.setdefault("CREWAI_TRACING_ENABLED", "false")
+    os.environ.setdefault("OPENAI_API_KEY", "replay")
+    
+    from sissificate_dev.cassette import Cassette, use_cassette
+    from sissificate_dev.crew import SissificateDevCrew
+    
+    cassette = Cassette.load(path)
+    inputs = cassette.inputs
+    
+    print("=" * 60)
+    print("📼 Sissificate Development Crew - Replay")
+    print("=" * 60)
+    print(f"Cassette: {path}")
+    print(f"Task: {inputs.get('task_id')} - {inputs.get('title')}")
+    print("=" * 60)
+    print()
+    
+    tracing.configure_from_env()
+    tracing.set_trace_context(run_id=f"replay-{uuid.uuid4().hex[:8]}", task_id=inputs.get("task_id"),
+                              agent_id=os.environ.get("AGENT_NAME", "replay"))
+    use_cassette(cassette)
+    started = time.perf_counter()
+    try:
+        result = SissificateDevCrew(llm_cache=False, cassette=cassette).kickoff(inputs)
+    finally:
+        use_cassette(None)
+    
+    print()
+    print("=" * 60)
+    print(f"✅ Replay complete in {time.perf_counter() - started:.2f}s")
+    print(f"LLM calls: {cassette.stats['llm_calls']} ({cassette.stats['llm_misses']} out of order)")
+    print(f"Tool calls: {cassette.stats['tool_calls']} ({cassette.stats['tool_misses']} not recorded)")
+    print("=" * 60)
+    print(result)
+    return result
+
+
+def check() -> bool:
+    """Validate env, config and GitHub access without importing crewai; True when nothing failed."""
+    from sissificate_dev.preflight import run_checks
+    
+    icons = {"ok": "✅", "warn": "⚠️ ", "fail": "❌"}
+    started = time.perf_counter()
+    results = run_checks()
+    for result in results:
+        print(f"{icons[result.status]} {result.name}: {result.detail}")
+    failed = sum(1 for r in results if r.status == "fail")
+    print()
+    print(f"{'❌' if failed else '✅'} Preflight {'failed' if failed else 'passed'} "
+          f"({failed} failed, {sum(1 for r in results if r.status == 'warn')} warnings) "
+          f"in {time.perf_counter() - started:.2f}s")
+    return not failed
+
+
+def claim_next_task(task_id: str = None, epic: str = None, leases: LeaseManager = None,
+                    github_claim: GitHubClaim = None, exclude=()) -> dict:
+    """Select the next DEV-TASK and claim it, skipping tasks other agents win first."""
+    skipped = set(exclude)
+    for attempt in range(MAX_CLAIM_ATTEMPTS):
+        candidate = select_task(task_id=task_id, epic=epic, exclude=skipped, sync=attempt == 0)
+        if not candidate:
+            return None
+        if claim_task(candidate, leases=leases, github=github_claim):
+            print(f"🎯 Claimed: {candidate['task_id']} - {candidate['title']} (#{candidate['issue_number']})")
+            print()
+            return candidate
+        print(f"⏭️  {candidate['task_id']} was claimed by another agent")
+        skipped.add(candidate["task_id"])
+    return None
+
+
+def execute_task(crew_instance: "SissificateDevCrew", selected: dict, leases: LeaseManager,
+                 github_claim: GitHubClaim):
+    """Run the crew on a claimed task and release the claim afterwards."""
+    tracing.set_trace_context(
+        run_id=uuid.uuid4().hex[:12],
+        task_id=selected["task_id"],
+        issue_number=selected["issue_number"],
+        agent_id=os.environ.get("AGENT_NAME")
+    )
+    try:
+        # Each task works in its own worktree so parallel agents never share files or branches
+        with task_worktree(selected["task_id"]) as workspace:
+            print(f"🌳 Workspace: {workspace}")
+            result = crew_instance.kickoff(selected)
         
         print()
         print("=" * 60)
@@ -70,13 +217,22 @@ def run(task_id: str = None, epic: str = None, dry_run: bool = False):
         
         return result
         
+    except (KeyboardInterrupt, SystemExit):
+        print()
+        print("🛑 Crew execution stopped")
+        github_claim.unclaim(selected["issue_number"])
+        raise
     except Exception as e:
         print()
         print("=" * 60)
         print("❌ Crew Execution Failed")
         print("=" * 60)
         print(f"Error: {str(e)}")
+        github_claim.unclaim(selected["issue_number"], failed=True)
         raise
+    finally:
+        leases.release(selected["task_id"])
+        tracing.set_trace_context(run_id=None, task_id=None, issue_number=None)
 
 
 if __name__ == "__main__":
@@ -85,10 +241,34 @@ if __name__ == "__main__":
     parser.add_argument("--epic", "-e", help="Preferred epic to work on (e.g., PEPIC-002)")
     parser.add_argument("--dry-run", "-d", action="store_true", help="Dry run mode")
     parser.add_argument("--agent-id", "-a", default="1", help="Agent ID (default: 1)")
+    parser.add_argument("--daemon", action="store_true", help="Keep worker processes running and pull tasks continuously")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1, help="Worker processes in daemon mode (default: CPU count)")
+    parser.add_argument("--poll-interval", type=float, default=30.0, help="Seconds between backlog polls in daemon mode (default: 30)")
+    parser.add_argument("--llm-cache", action="store_true", help="Answer repeated prompts from the on-disk LLM cache")
+    parser.add_argument("--record", metavar="CASSETTE", help="Record LLM exchanges and tool calls to a cassette file")
+    parser.add_argument("--replay", metavar="CASSETTE", help="Replay a recorded cassette offline (no API keys or network)")
+    parser.add_argument("--trace", action="store_true", help="Record a span for every tool call (JSONL in the cache dir)")
+    parser.add_argument("--metrics-port", type=int, help="With --trace, serve Prometheus tool metrics on this port")
+    parser.add_argument("--check", action="store_true", help="Check env, config and GitHub access, then exit")
     
     args = parser.parse_args()
     
     # Set agent ID
     os.environ["AGENT_ID"] = args.agent_id
+    if args.llm_cache:
+        # Through the environment so daemon workers pick it up too
+        os.environ["SISSIFICATE_LLM_CACHE"] = "1"
+    if args.trace:
+        os.environ["SISSIFICATE_TRACE"] = "1"
+    if args.metrics_port:
+        os.environ["SISSIFICATE_TRACE_PROMETHEUS_PORT"] = str(args.metrics_port)
     
-    run(task_id=args.task, epic=args.epic, dry_run=args.dry_run)
\ No newline at end of file
+    if args.check:
+        sys.exit(0 if check() else 1)
+    elif args.replay:
+        replay(args.replay)
+    elif args.daemon:
+        from sissificate_dev.daemon import run_daemon
+        run_daemon(workers=args.workers, epic=args.epic, poll_interval=args.poll_interval)
+    else:
+        run(task_id=args.task, epic=args.epic, dry_run=args.dry_run, record=args.record)
\ No newline at end of file
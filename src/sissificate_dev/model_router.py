@@ -0,0 +1,75 @@
+"""
+Model routing
+Decides which models a task runs on: the task's `llm:`, else its agent's, else
+the default model. Tier names from the `models:` section of agents.yaml expand
+into fallback chains. Every decision and fallback is appended to routing.jsonl,
+which is rotated to routing.jsonl.1 once it reaches ROUTING_LOG_MAX_BYTES
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sissificate_dev.settings import cache_dir
+from sissificate_dev.tracing import trace_context
+
+# Every task of every run adds a route line; past this size the log starts over, keeping one old file
+ROUTING_LOG_MAX_BYTES = int(os.environ.get("SISSIFICATE_ROUTING_LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+
+_log_lock = threading.Lock()
+
+
+def routing_log_path() -> Path:
+    return Path(os.environ.get("SISSIFICATE_ROUTING_LOG") or cache_dir() / "routing.jsonl")
+
+
+def record(event: str, **fields: Any):
+    """Append one routing event, tagged with the current run's trace context."""
+    line = json.dumps({"event": event, "time": time.time(), **trace_context(), **fields}, default=str)
+    path = routing_log_path()
+    with _log_lock:
+        try:
+            if path.stat().st_size >= ROUTING_LOG_MAX_BYTES:
+                os.replace(path, path.with_name(path.name + ".1"))
+        except FileNotFoundError:
+            # Not written yet, or another agent process just rotated it
+            pass
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def tier_models(config: Dict[str, Any], tier: str) -> Optional[List[str]]:
+    """
+    Fallback chain of a tier, or None if `tier` is a plain model name.
+    SISSIFICATE_MODELS_<TIER> (comma-separated) replaces the chain from agents.yaml.
+    """
+    override = os.environ.get(f"SISSIFICATE_MODELS_{tier.upper()}")
+    if override:
+        return [model.strip() for model in override.split(",") if model.strip()]
+    return config.get("models", {}).get(tier)
+
+
+def resolve(config: Dict[str, Any], agent_id: str, task_id: Optional[str] = None,
+            default: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Route for an agent, or for one of its tasks.
+
+    Returns:
+        {"tier": tier name or None, "models": [first choice, fallbacks...],
+         "source": "task" | "agent" | "default"}
+    """
+    choice, source = None, "default"
+    if task_id and config["tasks"][task_id].get("llm"):
+        choice, source = config["tasks"][task_id]["llm"], "task"
+    elif config["agents"][agent_id].get("llm"):
+        choice, source = config["agents"][agent_id]["llm"], "agent"
+
+    if choice is None:
+        return {"tier": None, "models": [default] if default else [], "source": source}
+    models = tier_models(config, choice)
+    if models is None:
+        return {"tier": None, "models": [choice], "source": source}
+    return {"tier": choice, "models": models, "source": source}
@@ -0,0 +1,120 @@
+"""
+Preflight checks for `main.py --check`
+Validates the environment, the crew config and GitHub access without
+importing crewai, so a broken setup is reported in well under a second
+"""
+
+import importlib.util
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, List, NamedTuple
+
+from sissificate_dev.crew_config import ConfigError, load_config
+from sissificate_dev.github_client import get_client
+from sissificate_dev.settings import cache_dir, github_repository, project_path
+from sissificate_dev.worktrees import WORKTREES_ENABLED, is_git_checkout, worktrees_dir
+
+class Check(NamedTuple):
+    name: str
+    status: str  # "ok", "warn" or "fail"
+    detail: str
+
+
+def check_env() -> List[Check]:
+    checks = []
+    for name, hint in (("OPENAI_API_KEY", "https://platform.openai.com/api-keys"),
+                       ("GITHUB_TOKEN", "https://github.com/settings/tokens (scopes: repo, project)")):
+        if os.environ.get(name):
+            checks.append(Check(name, "ok", "set"))
+        else:
+            checks.append(Check(name, "fail", f"not set; get one at {hint}"))
+
+    root = Path(project_path())
+    if not root.is_dir():
+        checks.append(Check("SISSIFICATE_PROJECT_PATH", "fail", f"{root} is not a directory"))
+    elif not (root / "docs" / "workboard" / "development" / "tasks").is_dir():
+        checks.append(Check("SISSIFICATE_PROJECT_PATH", "warn", f"{root} has no docs/workboard/development/tasks"))
+    else:
+        checks.append(Check("SISSIFICATE_PROJECT_PATH", "ok", str(root)))
+
+    if not WORKTREES_ENABLED:
+        checks.append(Check("worktrees", "warn", "off; parallel agents share one working tree"))
+    elif root.is_dir() and not is_git_checkout(str(root)):
+        checks.append(Check("worktrees", "warn", f"{root} is not a git checkout; parallel agents share it"))
+    elif root.is_dir():
+        checks.append(Check("worktrees", "ok", str(worktrees_dir(str(root)))))
+
+    try:
+        probe = cache_dir() / f".preflight-{os.getpid()}"
+        probe.write_text("ok")
+        probe.unlink()
+        checks.append(Check("cache dir", "ok", str(cache_dir())))
+    except OSError as e:
+        checks.append(Check("cache dir", "fail", f"not writable: {e}"))
+    return checks
+
+
+def check_tools() -> List[Check]:
+    checks = []
+    # find_spec locates the package without paying for its import
+    if importlib.util.find_spec("crewai") is None:
+        checks.append(Check("crewai", "fail", "not installed; run pip install -e ."))
+    else:
+        checks.append(Check("crewai", "ok", "installed"))
+    for binary, needed_for in (("git", "diffs and commits"), ("bun", "lint, build and test commands")):
+        path = shutil.which(binary)
+        checks.append(Check(binary, "ok", path) if path else Check(binary, "warn", f"not on PATH ({needed_for})"))
+    return checks
+
+
+def check_config() -> List[Check]:
+    try:
+        config = load_config()
+    except ConfigError as e:
+        return [Check("crew config", "fail", str(e).replace("\n  ", "; "))]
+    return [Check("crew config", "ok", f"{len(config['agents'])} agents, {len(config['tasks'])} tasks, "
+                                       f"targets: {', '.join(config['targets'])}")]
+
+
+def check_github() -> List[Check]:
+    if not os.environ.get("GITHUB_TOKEN"):
+        return [Check("GitHub", "fail", "skipped, GITHUB_TOKEN not set")]
+
+    client = get_client()
+    owner, repo = github_repository()
+    try:
+        # /rate_limit does not count against the rate limit
+        limits = client.get("/rate_limit")
+        if limits.status_code == 401:
+            return [Check("GitHub", "fail", "token rejected (401)")]
+        checks = []
+        if limits.status_code == 200:
+            core = (limits.json() or {}).get("resources", {}).get("core", {})
+            checks.append(Check("GitHub", "ok", f"{client.base_url}, {core.get('remaining', '?')}/{core.get('limit', '?')} "
+                                                "requests left this hour"))
+        else:
+            checks.append(Check("GitHub", "warn", f"/rate_limit returned {limits.status_code}"))
+
+        response = client.get(f"/repos/{owner}/{repo}")
+        if response.status_code == 200:
+            permissions = (response.json() or {}).get("permissions", {})
+            if permissions and not permissions.get("push"):
+                checks.append(Check(f"{owner}/{repo}", "warn", "token cannot push (assigning and labelling will fail)"))
+            else:
+                checks.append(Check(f"{owner}/{repo}", "ok", "reachable"))
+        else:
+            checks.append(Check(f"{owner}/{repo}", "fail", f"returned {response.status_code}"))
+        return checks
+    except OSError as e:
+        return [Check("GitHub", "fail", f"unreachable: {e}")]
+
+
+CHECKS: List[Callable[[], List[Check]]] = [check_env, check_tools, check_config, check_github]
+
+
+def run_checks() -> List[Check]:
+    results = []
+    for check in CHECKS:
+        results.extend(check())
+    return results
@@ -0,0 +1,178 @@
+"""
+Host-wide rate-limit governor
+Token buckets in a shared SQLite database that every agent process and the
+panel draw from before calling GitHub or the LLM. GitHub buckets learn their
+budget from X-RateLimit-* and Retry-After headers; claims may use the whole
+budget while bulk reads leave a reserve
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from sissificate_dev.settings import cache_dir
+
+PRIORITY_HIGH = "high"
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+# Share of a bucket each priority must leave untouched for the ones above it
+RESERVES = {PRIORITY_HIGH: 0.0, PRIORITY_NORMAL: 0.1, PRIORITY_LOW: 0.3}
+
+# Longest a call waits for its bucket before giving up
+MAX_WAIT = float(os.environ.get("SISSIFICATE_RATE_LIMIT_MAX_WAIT", "900"))
+# Re-read the shared state at least this often while waiting
+POLL_INTERVAL = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    capacity REAL NOT NULL,
+    rate REAL NOT NULL,
+    reset_at REAL NOT NULL DEFAULT 0,
+    blocked_until REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class RateLimitExceeded(OSError):
+    """A bucket stays empty for longer than the caller is willing to wait."""
+
+
+class Governor:
+    """
+    Shared token buckets.
+
+    A bucket refills continuously at `rate` tokens per second up to
+    `capacity`, or all at once at `reset_at` for budgets that reset on a
+    fixed window (GitHub's hourly limit). `blocked_until` holds everyone
+    off after a Retry-After.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or str(cache_dir() / "rate-limits.sqlite3")
+        # One connection per thread: every GitHub request goes through here
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Losing the last few bucket updates in a power cut is harmless; an fsync per request is not
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        yield conn
+
+    @contextmanager
+    def _bucket(self, conn: sqlite3.Connection, name: str, capacity: float, rate: float) -> Iterator[Dict[str, Any]]:
+        """Lock, refill and yield a bucket; changes to the dict are written back."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute("SELECT * FROM buckets WHERE name = ?", (name,)).fetchone()
+            bucket = dict(row) if row else {
+                "name": name, "tokens": capacity, "capacity": capacity, "rate": rate,
+                "reset_at": 0.0, "blocked_until": 0.0, "updated_at": now
+            }
+            if bucket["reset_at"] and now >= bucket["reset_at"]:
+                bucket["tokens"] = bucket["capacity"]
+                bucket["reset_at"] = 0.0
+            elapsed = max(0.0, now - bucket["updated_at"])
+            bucket["tokens"] = min(bucket["capacity"], bucket["tokens"] + elapsed * bucket["rate"])
+            bucket["updated_at"] = now
+            yield bucket
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, tokens, capacity, rate, reset_at, blocked_until, updated_at) "
+                "VALUES (:name, :tokens, :capacity, :rate, :reset_at, :blocked_until, :updated_at)",
+                bucket
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def acquire(self, name: str, cost: float = 1.0, priority: str = PRIORITY_NORMAL,
+                capacity: float = 60.0, rate: float = 1.0, max_wait: float = MAX_WAIT) -> float:
+        """
+        Take `cost` tokens, waiting until the bucket can spare them.
+
+        Args:
+            capacity, rate: Bucket shape used when the bucket does not exist yet
+            max_wait: Raise RateLimitExceeded instead of waiting longer than this
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        with self._connect() as conn:
+            while True:
+                with self._bucket(conn, name, capacity, rate) as bucket:
+                    now = bucket["updated_at"]
+                    # Never ask for more than a full bucket, or the call could wait forever
+                    needed = min(cost + bucket["capacity"] * RESERVES.get(priority, 0.0),
+                                 max(cost, bucket["capacity"]))
+                    if bucket["blocked_until"] > now:
+                        wait = bucket["blocked_until"] - now
+                    elif bucket["tokens"] >= needed:
+                        bucket["tokens"] -= cost
+                        return time.monotonic() - started
+                    elif bucket["rate"] > 0:
+                        wait = (needed - bucket["tokens"]) / bucket["rate"]
+                    elif bucket["reset_at"]:
+                        wait = bucket["reset_at"] - now
+                    else:
+                        wait = POLL_INTERVAL
+
+                waited = time.monotonic() - started
+                if waited + wait > max_wait:
+                    raise RateLimitExceeded(f"{name}: no budget for another {wait:.0f}s")
+                time.sleep(min(wait, POLL_INTERVAL))
+
+    def learn(self, name: str, remaining: Optional[float] = None, limit: Optional[float] = None,
+              reset_at: Optional[float] = None, retry_after: Optional[float] = None,
+              capacity: float = 60.0, rate: float = 1.0):
+        """Align a bucket with what the server reported (capacity and rate as in acquire)."""
+        with self._connect() as conn:
+            with self._bucket(conn, name, capacity, rate) as bucket:
+                if limit:
+                    bucket["capacity"] = float(limit)
+                    # The window resets in one go; trickling tokens back in would overshoot
+                    bucket["rate"] = 0.0
+                if remaining is not None:
+                    bucket["tokens"] = float(remaining)
+                if reset_at:
+                    bucket["reset_at"] = reset_at
+                if retry_after is not None:
+                    bucket["blocked_until"] = max(bucket["blocked_until"], bucket["updated_at"] + retry_after)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._connect() as conn:
+            return {row["name"]: dict(row) for row in conn.execute("SELECT * FROM buckets ORDER BY name")}
+
+
+_governor: Optional[Governor] = None
+
+
+def get_governor() -> Governor:
+    """Process-wide governor on the shared cache directory."""
+    global _governor
+    if _governor is None:
+        _governor = Governor()
+    return _governor
+
+
+def header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,43 @@
+"""
+Shared settings for Sissificate Development Crew
+Environment-driven paths used by the tools, the panel and the local caches
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+DEFAULT_PROJECT_PATH = "/Users/roberto/Documents/projects/sissificate"
+
+_workspace: Optional[str] = None
+
+
+def project_path() -> str:
+    """Root of the shared Sissificate checkout: backlog docs, task locks, worktrees."""
+    return os.environ.get("SISSIFICATE_PROJECT_PATH", DEFAULT_PROJECT_PATH)
+
+
+def use_workspace(path: Optional[str]):
+    """Point the file and command tools at another tree, e.g. a task's worktree (None to reset)."""
+    global _workspace
+    _workspace = path
+
+
+def workspace_path() -> str:
+    """Tree the file and command tools of the current task work in."""
+    return _workspace or project_path()
+
+
+def github_repository() -> Tuple[str, str]:
+    """Owner and name of the repository holding the DEV- backlog."""
+    return (
+        os.environ.get("GITHUB_OWNER", "rrios-dev"),
+        os.environ.get("GITHUB_REPO", "sissificate")
+    )
+
+
+def cache_dir() -> Path:
+    """Host-wide cache directory shared by every agent process and the panel."""
+    path = Path(os.environ.get("SISSIFICATE_CACHE_DIR") or Path.home() / ".cache" / "sissificate_dev")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
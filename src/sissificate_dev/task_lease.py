@@ -0,0 +1,360 @@
+"""
+Task leases for concurrent agents
+Claims DEV-TASKs atomically with O_EXCL lock files (.lock.DEV-XXXX) that carry
+an owner, a TTL and a heartbeat, reclaims expired leases and confirms the claim
+on GitHub with a per-agent claim comment, the assignee, the in-progress label
+and the Projects v2 Status
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sissificate_dev.github_client import GitHubClient, GitHubResponse, get_client
+from sissificate_dev.github_graphql import GitHubGraphQL
+from sissificate_dev.rate_limit import PRIORITY_HIGH
+from sissificate_dev.settings import github_repository, project_path
+
+DEFAULT_TTL = 15 * 60
+# A reclaim guard older than this belongs to a process that died mid-reclaim
+RECLAIM_GUARD_TTL = 60
+IN_PROGRESS_LABEL = "in-progress"
+FAILED_LABEL = "failed"
+# First line of a claim comment; every agent shares one GitHub login, so the comment says who holds the issue
+CLAIM_MARKER = "<!-- sissificate-claim -->"
+# Claim comments this much older than ours are leftovers of crashed agents, not a race in progress
+CLAIM_RACE_WINDOW = 10 * 60
+
+
+class ClaimError(RuntimeError):
+    """GitHub refused one of the writes that make up a claim."""
+
+
+class LeaseManager:
+    """Expiring, owner-checked leases stored as lock files in the project root."""
+
+    def __init__(self, directory: Optional[str] = None, owner: Optional[str] = None, ttl: int = DEFAULT_TTL):
+        self.directory = Path(directory or project_path())
+        self.owner = owner or os.environ.get("AGENT_NAME") or f"agent-{os.environ.get('AGENT_ID', '1')}"
+        self.ttl = ttl
+        self._tokens: Dict[str, str] = {}
+        self._heartbeats: Dict[str, threading.Event] = {}
+
+    def _path(self, task_id: str) -> Path:
+        return self.directory / f".lock.{task_id}"
+
+    def _new_lease(self, task_id: str) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "task_id": task_id,
+            "owner": self.owner,
+            "token": uuid.uuid4().hex,
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "acquired_at": now,
+            "heartbeat_at": now,
+            "expires_at": now + self.ttl
+        }
+
+    def read(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Current lease for a task, or None if there is no (readable) lock file."""
+        try:
+            with open(self._path(task_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def is_expired(self, lease: Dict[str, Any]) -> bool:
+        return time.time() >= lease.get("expires_at", 0)
+
+    def is_locked(self, task_id: str) -> bool:
+        lease = self.read(task_id)
+        return lease is not None and not self.is_expired(lease)
+
+    def _create(self, task_id: str) -> Optional[Dict[str, Any]]:
+        lease = self._new_lease(task_id)
+        try:
+            fd = os.open(self._path(task_id), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return None
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(lease, f)
+            f.flush()
+            os.fsync(f.fileno())
+        self._tokens[task_id] = lease["token"]
+        return lease
+
+    def _write(self, task_id: str, lease: Dict[str, Any]):
+        path = self._path(task_id)
+        tmp_path = path.with_name(f"{path.name}.{lease['token']}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(lease, f)
+        os.replace(tmp_path, path)
+
+    def _reclaim(self, task_id: str) -> Optional[Dict[str, Any]]:
+        # Only one process may reclaim at a time, otherwise two racers could
+        # both judge the old lease expired and one would delete the other's new lease
+        guard = self._path(task_id).with_name(f".lock.{task_id}.reclaim")
+        try:
+            fd = os.open(guard, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            try:
+                if time.time() - guard.stat().st_mtime > RECLAIM_GUARD_TTL:
+                    guard.unlink()
+            except FileNotFoundError:
+                pass
+            return None
+        os.close(fd)
+        try:
+            path = self._path(task_id)
+            lease = self.read(task_id)
+            if lease is None:
+                # Unreadable lock file: only stale once nobody has touched it for a full TTL
+                if time.time() - path.stat().st_mtime > self.ttl:
+                    path.unlink()
+            elif self.is_expired(lease):
+                path.unlink()
+            return self._create(task_id)
+        except FileNotFoundError:
+            return self._create(task_id)
+        finally:
+            guard.unlink()
+
+    def acquire(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Atomically take the lease. Returns None if another live owner holds it."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lease = self._create(task_id)
+        if lease:
+            return lease
+        existing = self.read(task_id)
+        if existing is not None and not self.is_expired(existing):
+            return None
+        return self._reclaim(task_id)
+
+    def heartbeat(self, task_id: str) -> bool:
+        """Extend our lease by one TTL. Returns False if we no longer hold it."""
+        lease = self.read(task_id)
+        if not lease or lease.get("token") != self._tokens.get(task_id):
+            return False
+        now = time.time()
+        lease["heartbeat_at"] = now
+        lease["expires_at"] = now + self.ttl
+        self._write(task_id, lease)
+        return True
+
+    def start_heartbeat(self, task_id: str, interval: Optional[float] = None):
+        """Renew the lease in a background thread until release()."""
+        stop = threading.Event()
+        self._heartbeats[task_id] = stop
+        interval = interval or self.ttl / 3
+
+        def beat():
+            while not stop.wait(interval):
+                if not self.heartbeat(task_id):
+                    print(f"⚠️ Lost lease on {task_id}")
+                    return
+
+        threading.Thread(target=beat, name=f"lease-{task_id}", daemon=True).start()
+
+    def release(self, task_id: str, force: bool = False) -> bool:
+        """Drop our lease (or any lease with force=True). Returns False if it was not ours."""
+        stop = self._heartbeats.pop(task_id, None)
+        if stop:
+            stop.set()
+        lease = self.read(task_id)
+        if lease is None:
+            return False
+        if not force and lease.get("token") != self._tokens.get(task_id):
+            return False
+        try:
+            self._path(task_id).unlink()
+        except FileNotFoundError:
+            return False
+        self._tokens.pop(task_id, None)
+        return True
+
+
+class GitHubClaim:
+    """
+    Confirms a lease on GitHub. Agents usually share one GitHub login, so the
+    assignee alone cannot tell them apart: each claim first posts a comment
+    naming the agent and host, and of the claim comments racing for an issue
+    the oldest wins. The winner then takes the assignee, the in-progress label
+    and moves the board Status to In Progress.
+    """
+
+    def __init__(self, client: Optional[GitHubClient] = None, owner: Optional[str] = None, repo: Optional[str] = None,
+                 agent: Optional[str] = None):
+        self.client = client or get_client()
+        default_owner, default_repo = github_repository()
+        self.owner = owner or default_owner
+        self.repo = repo or default_repo
+        self.agent = agent_identity(agent)
+        self._login: Optional[str] = os.environ.get("GITHUB_ASSIGNEE")
+
+    @property
+    def login(self) -> str:
+        if not self._login:
+            response = self._get("/user")
+            if response.status_code != 200:
+                raise RuntimeError(f"Cannot resolve GitHub user ({response.status_code})")
+            self._login = response.json()["login"]
+        return self._login
+
+    def _issue(self, number: int) -> str:
+        return f"/repos/{self.owner}/{self.repo}/issues/{number}"
+
+    # Claims go ahead of bulk reads in the shared rate-limit budget
+    def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> GitHubResponse:
+        return self.client.get(endpoint, params=params, priority=PRIORITY_HIGH)
+
+    def _send(self, method: str, endpoint: str, body: Any = None) -> GitHubResponse:
+        return self.client.request(method, endpoint, json_data=body, priority=PRIORITY_HIGH)
+
+    def _write(self, method: str, endpoint: str, body: Any = None) -> GitHubResponse:
+        """_send that raises ClaimError unless GitHub answers 2xx."""
+        response = self._send(method, endpoint, body)
+        if not 200 <= response.status_code < 300:
+            raise ClaimError(f"{method} {endpoint} returned {response.status_code}: {response.text[:200]}")
+        return response
+
+    def _claim_comments(self, number: int, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Claim comments on an issue (updated at or after `since`), oldest first."""
+        params: Optional[Dict[str, Any]] = {"per_page": 100}
+        if since is not None:
+            params["since"] = datetime.fromtimestamp(since, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        url: Optional[str] = f"{self._issue(number)}/comments"
+        comments = []
+        while url:
+            response = self._get(url, params=params)
+            if response.status_code != 200:
+                raise ClaimError(f"Cannot read comments of #{number} ({response.status_code})")
+            comments += [c for c in response.json() or [] if (c.get("body") or "").startswith(CLAIM_MARKER)]
+            # The next link already carries every query parameter
+            url, params = response.links.get("next"), None
+        return comments
+
+    def _won(self, number: int, ours: Dict[str, Any]) -> bool:
+        """Whether our claim comment is the oldest live one on the issue."""
+        ours_at = _timestamp(ours.get("created_at"))
+        since = ours_at - CLAIM_RACE_WINDOW if ours_at is not None else None
+        rivals = [c["id"] for c in self._claim_comments(number, since=since)]
+        return min(rivals + [ours["id"]]) == ours["id"]
+
+    def _delete_comment(self, comment_id: int):
+        self._send("DELETE", f"/repos/{self.owner}/{self.repo}/issues/comments/{comment_id}")
+
+    def _set_status(self, number: int, status: str):
+        try:
+            GitHubGraphQL(self.client).set_project_status(self.owner, self.repo, number, status)
+        except Exception as e:
+            raise ClaimError(f"Cannot move #{number} to {status}: {e}") from e
+
+    def claim(self, number: int) -> bool:
+        """
+        Take the issue unless another account or agent already holds it.
+
+        Raises:
+            ClaimError if a write fails; whatever was written is rolled back
+        """
+        response = self._get(self._issue(number))
+        if response.status_code != 200:
+            raise ClaimError(f"Cannot read #{number} ({response.status_code})")
+        issue = response.json() or {}
+        others = [a["login"] for a in issue.get("assignees", []) if a["login"] != self.login]
+        labels = [label.get("name") for label in issue.get("labels", [])]
+        if others or IN_PROGRESS_LABEL in labels:
+            return False
+
+        comment = self._write("POST", f"{self._issue(number)}/comments", {
+            "body": f"{CLAIM_MARKER}\n🔒 Claimed by `{self.agent}`"
+        }).json()
+        try:
+            # Another agent may have commented in the same instant; the oldest claim wins
+            won = self._won(number, comment)
+        except Exception:
+            self._delete_comment(comment["id"])
+            raise
+        if not won:
+            # The assignee and label belong to the winner, even if it shares our login
+            self._delete_comment(comment["id"])
+            return False
+
+        try:
+            self._write("POST", f"{self._issue(number)}/assignees", {"assignees": [self.login]})
+            self._write("POST", f"{self._issue(number)}/labels", {"labels": [IN_PROGRESS_LABEL]})
+            self._set_status(number, "In Progress")
+        except Exception:
+            self.unclaim(number)
+            raise
+        return True
+
+    def unclaim(self, number: int, failed: bool = False, agent: Optional[str] = None):
+        """
+        Hand the issue back to the Ready column; failed runs are also labelled
+        `failed`, which keeps the selector off them until someone removes it.
+        `agent` releases another agent's claim, e.g. one of a crashed daemon worker.
+        Best effort: problems are reported, not raised.
+        """
+        agent = agent_identity(agent) if agent else self.agent
+        problems = []
+        try:
+            for comment in self._claim_comments(number):
+                if f"`{agent}`" in comment.get("body", ""):
+                    self._delete_comment(comment["id"])
+        except ClaimError as e:
+            problems.append(str(e))
+        for method, endpoint, body in (
+            ("DELETE", f"{self._issue(number)}/assignees", {"assignees": [self.login]}),
+            ("DELETE", f"{self._issue(number)}/labels/{IN_PROGRESS_LABEL}", None),
+        ) + ((("POST", f"{self._issue(number)}/labels", {"labels": [FAILED_LABEL]}),) if failed else ()):
+            response = self._send(method, endpoint, body)
+            # 404: the label was already gone
+            if not 200 <= response.status_code < 300 and response.status_code != 404:
+                problems.append(f"{method} {endpoint} returned {response.status_code}")
+        # A failed run must not stay "In Progress" on the board either
+        try:
+            self._set_status(number, "Ready")
+        except ClaimError as e:
+            problems.append(str(e))
+        if problems:
+            print(f"⚠️ Unclaiming #{number} was incomplete: {'; '.join(problems)}")
+
+
+def agent_identity(agent: Optional[str] = None) -> str:
+    """Name of this agent in claim comments: AGENT_NAME plus the host."""
+    name = agent or os.environ.get("AGENT_NAME") or f"agent-{os.environ.get('AGENT_ID', '1')}"
+    return name if "@" in name else f"{name}@{socket.gethostname()}"
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+def claim_task(task: Dict[str, Any], leases: Optional[LeaseManager] = None,
+               github: Optional[GitHubClaim] = None) -> bool:
+    """Take the local lease and confirm it on GitHub; on any refusal nothing is left held."""
+    leases = leases or LeaseManager()
+    if not leases.acquire(task["task_id"]):
+        return False
+    try:
+        confirmed = (github or GitHubClaim()).claim(task["issue_number"])
+    except ClaimError as e:
+        print(f"⚠️ Could not claim {task['task_id']} on GitHub: {e}")
+        confirmed = False
+    except Exception:
+        leases.release(task["task_id"])
+        raise
+    if not confirmed:
+        leases.release(task["task_id"])
+        return False
+    leases.start_heartbeat(task["task_id"])
+    return True
@@ -0,0 +1,168 @@
+"""
+Deterministic task selection
+Applies the fetch_available_task rules from tasks.yaml in plain Python,
+so picking the next DEV-TASK costs no LLM round trips
+"""
+
+import os
+import re
+from typing import Any, Collection, Dict, List, Optional
+
+from sissificate_dev.github_graphql import GitHubGraphQL, GraphQLError
+from sissificate_dev.issue_sync import IssueMirror, IssueSyncError, open_mirror, parse_epic
+from sissificate_dev.settings import project_path
+from sissificate_dev.task_lease import LeaseManager
+
+PTASK_PATTERN = re.compile(r"\bPTASK-\d+\b")
+# The PTASK's status field: "status: x" in front matter, or a "Status: x" / "**Status:** x" line
+PTASK_STATUS = re.compile(r"^[ \t]*(?:[-*][ \t]+)?\**status\**[ \t]*:[ \t]*\**[ \t]*(.*?)[ \t]*$",
+                          re.IGNORECASE | re.MULTILINE)
+
+# Labels that take an issue out of the "Ready" column (same buckets as the panel board)
+STATUS_LABELS = {
+    "in-progress": "In Progress",
+    "in-qa": "In QA",
+    "done": "Done",
+    "completed": "Done",
+    "failed": "Failed",
+    "blocked": "Blocked",
+}
+
+
+def issue_labels(issue: Dict[str, Any]) -> List[str]:
+    return [l.get("name", "") for l in issue.get("labels", [])]
+
+
+def issue_status(issue: Dict[str, Any]) -> str:
+    """Workflow status derived from labels; issues without a status label are Ready."""
+    for label in issue_labels(issue):
+        if label in STATUS_LABELS:
+            return STATUS_LABELS[label]
+    return "Ready"
+
+
+def ptask_status(text: str) -> Optional[str]:
+    """Value of a PTASK spec's first status field, lowercased, or None if it has none."""
+    match = PTASK_STATUS.search(text)
+    if not match:
+        return None
+    return match.group(1).strip("*`'\" ").lower() or None
+
+
+def upstream_dev_ready(issue: Dict[str, Any], root: Optional[str] = None) -> bool:
+    """
+    Check that the upstream PTASK is marked dev_ready.
+
+    A `dev_ready` label on the issue wins; otherwise every PTASK referenced in
+    the issue body must have its status field set to `dev_ready` in its spec
+    file. Issues without an upstream PTASK have nothing to wait for.
+    """
+    if "dev_ready" in issue_labels(issue):
+        return True
+
+    ptasks = set(PTASK_PATTERN.findall(issue.get("body") or ""))
+    root = root or project_path()
+    for ptask in ptasks:
+        spec_path = os.path.join(root, "docs", "workboard", "product", "tasks", f"{ptask}.md")
+        try:
+            with open(spec_path, "r", encoding="utf-8") as f:
+                if ptask_status(f.read()) != "dev_ready":
+                    return False
+        except OSError:
+            return False
+    return True
+
+
+def to_task_inputs(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an issue like the fetch_available_task expected_output (crew kickoff inputs)."""
+    title = issue["title"]
+    return {
+        "task_id": title.split(":")[0].strip(),
+        "title": title.split(":", 1)[1].strip() if ":" in title else title,
+        "epic": parse_epic(issue) or "",
+        "issue_number": issue["number"],
+        "status": issue_status(issue),
+        "html_url": issue.get("html_url", ""),
+    }
+
+
+def find_available_tasks(mirror: IssueMirror, task_id: Optional[str] = None,
+                         epic: Optional[str] = None, exclude: Collection[str] = (),
+                         leases: Optional[LeaseManager] = None) -> List[Dict[str, Any]]:
+    """All issues passing the label-based selection rules and not locked locally, in task ID order."""
+    leases = leases or LeaseManager()
+    candidates = mirror.query(prefix="DEV-", task_id=task_id, epic=epic, unassigned=True)
+    available = []
+    for issue in candidates:
+        issue_task_id = issue["title"].split(":")[0].strip()
+        if issue_task_id in exclude or issue_status(issue) != "Ready":
+            continue
+        if leases.is_locked(issue_task_id) or not upstream_dev_ready(issue):
+            continue
+        available.append(issue)
+    return available
+
+
+def first_ready_on_board(mirror: IssueMirror, candidates: List[Dict[str, Any]],
+                         batch_size: int = 50) -> Optional[Dict[str, Any]]:
+    """
+    First candidate whose Projects v2 Status is "Ready".
+
+    Candidates are checked in batches of one GraphQL query each, so a Ready
+    task near the top of the backlog costs a single round trip. Issues that
+    are not on the board, or have no Status there, are not picked. While a
+    webhook receiver is live, statuses it has already reported are not asked again.
+    """
+    graphql = GitHubGraphQL()
+    known = mirror.project_statuses() if mirror.webhook_live() else {}
+    for start in range(0, len(candidates), batch_size):
+        batch = candidates[start:start + batch_size]
+        unknown = [i["number"] for i in batch if i["number"] not in known]
+        statuses = dict(known)
+        if unknown:
+            statuses.update(graphql.get_project_statuses(mirror.owner, mirror.repo, unknown))
+        for issue in batch:
+            if statuses.get(issue["number"]) == "Ready":
+                return issue
+    return None
+
+
+def select_task(task_id: Optional[str] = None, epic: Optional[str] = None,
+                mirror: Optional[IssueMirror] = None, sync: bool = True,
+                use_project_status: bool = True, exclude: Collection[str] = ()) -> Optional[Dict[str, Any]]:
+    """
+    Pick the next available DEV-TASK.
+
+    Args:
+        task_id: Only consider this DEV-TASK (e.g., DEV-0101)
+        epic: Only consider tasks in this epic (e.g., PEPIC-002)
+        mirror: Issue mirror to read from (defaults to the configured repository)
+        sync: Pull the latest delta from GitHub before selecting (only every
+            few minutes while webhooks keep the mirror current)
+        use_project_status: Confirm the Projects v2 Status is "Ready" over GraphQL
+        exclude: Task IDs to skip (e.g. ones another agent just won)
+
+    Returns:
+        Crew inputs for the selected task, or None if nothing is available
+    """
+    mirror = mirror or open_mirror()
+    if sync and mirror.needs_sync():
+        try:
+            mirror.sync()
+        except (IssueSyncError, OSError) as e:
+            print(f"⚠️ Backlog sync failed, selecting from local mirror: {e}")
+
+    available = find_available_tasks(mirror, task_id=task_id, epic=epic, exclude=exclude)
+    if not available:
+        return None
+
+    issue = available[0]
+    if use_project_status:
+        try:
+            issue = first_ready_on_board(mirror, available)
+        except (GraphQLError, OSError) as e:
+            print(f"⚠️ Project status lookup failed, using labels only: {e}")
+        if issue is None:
+            return None
+
+    return to_task_inputs(issue)
@@ -3,13 +3,16 @@ Custom tools for Sissificate Development Crew
 """
 
 # Re-export tools from crew.py for convenience
-from .crew import (
+from ..crew import (
     read_file,
     write_file,
     edit_file,
+    search_code,
     run_command,
+    read_command_log,
     github_graphql_query,
     github_rest_request,
+    list_backlog_issues,
     create_lock_file,
     remove_lock_file,
     check_lock_exists
@@ -19,9 +22,12 @@ __all__ = [
     "read_file",
     "write_file",
     "edit_file",
+    "search_code",
     "run_command",
+    "read_command_log",
     "github_graphql_query",
     "github_rest_request",
+    "list_backlog_issues",
     "create_lock_file",
     "remove_lock_file",
     "check_lock_exists"
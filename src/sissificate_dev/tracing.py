@@ -0,0 +1,223 @@
+"""
+Tool-call tracing
+Wraps every agent tool in a span (duration, argument and result sizes, exit
+code, HTTP status, run/task/agent IDs) written to a JSONL file, with optional
+Prometheus metrics. When tracing is off a tool call costs one global lookup
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sissificate_dev.settings import cache_dir
+
+# Upper bounds of the duration histogram, in seconds
+DURATION_BUCKETS = (0.005, 0.025, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0)
+
+_enabled = False
+_writer: Optional["SpanWriter"] = None
+_metrics: Optional["ToolMetrics"] = None
+_context: Dict[str, Any] = {}
+_local = threading.local()
+
+
+def tracing_enabled() -> bool:
+    return _enabled
+
+
+def traces_dir() -> Path:
+    path = cache_dir() / "traces"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class SpanWriter:
+    """Appends spans as JSON lines; safe to share between threads."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, span: Dict[str, Any]):
+        line = json.dumps(span, default=str) + "\n"
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class ToolMetrics:
+    """Per-tool counters and a duration histogram in Prometheus text format."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls: Dict[tuple, int] = {}
+        self.result_bytes: Dict[str, int] = {}
+        self.buckets: Dict[str, List[int]] = {}
+        self.duration_sum: Dict[str, float] = {}
+
+    def observe(self, span: Dict[str, Any]):
+        tool = span["name"]
+        seconds = span["duration_ms"] / 1000
+        with self.lock:
+            key = (tool, span["status"])
+            self.calls[key] = self.calls.get(key, 0) + 1
+            self.result_bytes[tool] = self.result_bytes.get(tool, 0) + span["result_bytes"]
+            counts = self.buckets.setdefault(tool, [0] * (len(DURATION_BUCKETS) + 1))
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    counts[index] += 1
+            counts[-1] += 1
+            self.duration_sum[tool] = self.duration_sum.get(tool, 0.0) + seconds
+
+    def render(self) -> str:
+        lines = [
+            "# HELP sissificate_tool_calls_total Tool calls by tool and status.",
+            "# TYPE sissificate_tool_calls_total counter",
+        ]
+        with self.lock:
+            for (tool, status), count in sorted(self.calls.items()):
+                lines.append(f'sissificate_tool_calls_total{{tool="{tool}",status="{status}"}} {count}')
+            lines += [
+                "# HELP sissificate_tool_result_bytes_total Bytes returned to the agents by tool.",
+                "# TYPE sissificate_tool_result_bytes_total counter",
+            ]
+            for tool, total in sorted(self.result_bytes.items()):
+                lines.append(f'sissificate_tool_result_bytes_total{{tool="{tool}"}} {total}')
+            lines += [
+                "# HELP sissificate_tool_duration_seconds Tool call duration.",
+                "# TYPE sissificate_tool_duration_seconds histogram",
+            ]
+            for tool, counts in sorted(self.buckets.items()):
+                for bound, count in zip(DURATION_BUCKETS, counts):
+                    lines.append(f'sissificate_tool_duration_seconds_bucket{{tool="{tool}",le="{bound}"}} {count}')
+                lines.append(f'sissificate_tool_duration_seconds_bucket{{tool="{tool}",le="+Inf"}} {counts[-1]}')
+                lines.append(f'sissificate_tool_duration_seconds_sum{{tool="{tool}"}} {self.duration_sum[tool]:.6f}')
+                lines.append(f'sissificate_tool_duration_seconds_count{{tool="{tool}"}} {counts[-1]}')
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(metrics: ToolMetrics, port: int) -> ThreadingHTTPServer:
+    """Expose /metrics on localhost in a background thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="sissificate-metrics", daemon=True).start()
+    return server
+
+
+def enable_tracing(path: Optional[str] = None, prometheus_port: Optional[int] = None):
+    """
+    Start recording tool spans.
+
+    Args:
+        path: JSONL file for spans (default: traces/spans-YYYYMMDD.jsonl in the cache dir)
+        prometheus_port: Also serve Prometheus metrics on this localhost port
+    """
+    global _enabled, _writer, _metrics
+    _writer = SpanWriter(Path(path) if path else traces_dir() / f"spans-{time.strftime('%Y%m%d')}.jsonl")
+    if prometheus_port:
+        _metrics = ToolMetrics()
+        serve_metrics(_metrics, prometheus_port)
+    _enabled = True
+
+
+def configure_from_env():
+    """Turn tracing on when SISSIFICATE_TRACE is set (SISSIFICATE_TRACE_FILE / _PROMETHEUS_PORT refine it)."""
+    if _enabled or os.environ.get("SISSIFICATE_TRACE", "").lower() not in ("1", "true", "yes", "on"):
+        return
+    port = os.environ.get("SISSIFICATE_TRACE_PROMETHEUS_PORT")
+    enable_tracing(os.environ.get("SISSIFICATE_TRACE_FILE"), int(port) if port else None)
+
+
+def set_trace_context(**context: Any):
+    """Run/task/agent IDs attached to every following span (None removes a key)."""
+    for key, value in context.items():
+        if value is None:
+            _context.pop(key, None)
+        else:
+            _context[key] = value
+
+
+def trace_context() -> Dict[str, Any]:
+    """Copy of the IDs set with set_trace_context."""
+    return dict(_context)
+
+
+def annotate(**fields: Any):
+    """Attach details (exit_code, http_status, ...) to the span of the tool running on this thread."""
+    span = getattr(_local, "span", None)
+    if span is not None:
+        span.update(fields)
+
+
+def traced(func: Callable) -> Callable:
+    """Record a span for each call of a tool function. Goes under @tool."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _enabled:
+            return func(*args, **kwargs)
+
+        span: Dict[str, Any] = {
+            "span_id": uuid.uuid4().hex[:16],
+            "name": name,
+            **_context,
+            "start": time.time(),
+            "arg_bytes": len(json.dumps([args, kwargs], default=str).encode())
+        }
+        parent = getattr(_local, "span", None)
+        if parent is not None:
+            span["parent_span_id"] = parent["span_id"]
+        _local.span = span
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            span["status"] = "exception"
+            span["error"] = f"{type(e).__name__}: {e}"
+            span["result_bytes"] = 0
+            raise
+        else:
+            text = result if isinstance(result, str) else json.dumps(result, default=str)
+            span["result_bytes"] = len(text.encode("utf-8", errors="replace"))
+            # Tools report failures as "Error..." strings rather than raising
+            span["status"] = "error" if text.startswith("Error") else "ok"
+            return result
+        finally:
+            span["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            span["end"] = span["start"] + span["duration_ms"] / 1000
+            _local.span = parent
+            if _writer is not None:
+                _writer.write(span)
+            if _metrics is not None:
+                _metrics.observe(span)
+
+    return wrapper
@@ -0,0 +1,229 @@
+"""
+Change-scoped validation
+Works out what changed since the base branch, lints only those files, runs only
+the specs that cover them, and caches the verdict by the working tree's git
+tree hash so re-validating an unchanged tree is instant
+"""
+
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sissificate_dev.command_runner import run_streaming
+from sissificate_dev.settings import cache_dir, workspace_path
+
+BASE_BRANCH = os.environ.get("SISSIFICATE_BASE_BRANCH", "origin/main")
+# {files} is replaced with the scoped, shell-quoted paths; build has no file scope
+STEP_COMMANDS = {
+    "lint": os.environ.get("SISSIFICATE_VALIDATE_LINT", "bunx eslint {files}"),
+    "build": os.environ.get("SISSIFICATE_VALIDATE_BUILD", "bun run build"),
+    "test": os.environ.get("SISSIFICATE_VALIDATE_TEST", "bunx playwright test {files}"),
+}
+# Full-project commands for when a change can affect everything (config, lockfile)
+FULL_COMMANDS = {
+    "lint": os.environ.get("SISSIFICATE_VALIDATE_LINT_ALL", "bun run lint"),
+    "build": STEP_COMMANDS["build"],
+    "test": os.environ.get("SISSIFICATE_VALIDATE_TEST_ALL", "bun run test:a11y"),
+}
+STEPS = ("lint", "build", "test")
+
+LINT_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+SPEC_PATTERN = re.compile(r"\.(spec|test)\.[cm]?[jt]sx?$")
+# Files whose change can break anything, so the scoped steps run on everything
+GLOBAL_FILES = re.compile(
+    r"(^|/)(package\.json|bun\.lockb?|tsconfig[^/]*\.json|next\.config\.[^/]+|playwright\.config\.[^/]+|"
+    r"(\.)?eslint[^/]*|tailwind\.config\.[^/]+|postcss\.config\.[^/]+)$"
+)
+# Files that cannot affect lint, build or tests
+IGNORED = re.compile(r"\.(md|txt)$|^docs/|(^|/)\.lock\.DEV-")
+# Generic module names say nothing about which specs cover them; use the folder instead
+GENERIC_STEMS = {"index", "page", "layout", "route", "loading", "error", "utils", "types"}
+MAX_ERROR_LINES = 20
+ERROR_LINE = re.compile(r"error|fail|✘|×|expected|received", re.IGNORECASE)
+
+
+class ValidationError(RuntimeError):
+    """The project is not a git checkout or the base branch cannot be resolved."""
+
+
+def _git(root: str, *args: str, env: Optional[Dict[str, str]] = None) -> str:
+    result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise ValidationError(f"git {' '.join(args)}: {result.stderr.strip()}")
+    return result.stdout
+
+
+def merge_base(root: str, base: str) -> str:
+    """Commit the changes are measured from; falls back from origin/<b> to <b>."""
+    candidates = [base] + ([base.split("/", 1)[1]] if base.startswith("origin/") else [])
+    for candidate in candidates:
+        try:
+            return _git(root, "merge-base", "HEAD", candidate).strip()
+        except ValidationError:
+            continue
+    raise ValidationError(f"Cannot find base branch {base}")
+
+
+def tree_hash(root: str) -> str:
+    """
+    Git tree hash of the working tree as it is now, untracked files included
+    and .gitignore honored. Built in a throwaway copy of the index, so the
+    agent's staging area is left alone.
+    """
+    git_dir = Path(_git(root, "rev-parse", "--absolute-git-dir").strip())
+    with tempfile.TemporaryDirectory() as tmp:
+        index = Path(tmp) / "index"
+        if (git_dir / "index").exists():
+            # Starting from the real index lets git reuse its stat cache
+            shutil.copyfile(git_dir / "index", index)
+        env = {**os.environ, "GIT_INDEX_FILE": str(index)}
+        _git(root, "add", "-A", ".", env=env)
+        return _git(root, "write-tree", env=env).strip()
+
+
+def changed_files(root: str, base_commit: str) -> List[str]:
+    """
+    Files added, modified, deleted or renamed since base_commit, committed or
+    not. A rename lists both paths: whatever imported the old one may break.
+    """
+    tracked = []
+    for line in _git(root, "diff", "--name-status", "-M", base_commit).splitlines():
+        # "M\tpath", "D\tpath" or "R087\told\tnew"
+        tracked += line.split("\t")[1:]
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard").splitlines()
+    return sorted({path for path in tracked + untracked if path and not IGNORED.search(path)})
+
+
+def _module_name(path: str) -> str:
+    stem = Path(path).name.split(".")[0]
+    return Path(path).parent.name if stem in GENERIC_STEMS else stem
+
+
+def affected_specs(root: str, changed: List[str]) -> List[str]:
+    """Changed spec files plus the specs that mention a changed module by name."""
+    specs = [path for path in _git(root, "ls-files", "--cached", "--others", "--exclude-standard").splitlines()
+             if SPEC_PATTERN.search(path)]
+    names = {_module_name(path) for path in changed if not SPEC_PATTERN.search(path)}
+    names.discard("")
+    affected = {path for path in changed if SPEC_PATTERN.search(path)}
+    for spec in specs:
+        if spec in affected:
+            continue
+        try:
+            text = (Path(root) / spec).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        if any(re.search(rf"\b{re.escape(name)}\b", text) for name in names):
+            affected.add(spec)
+    return sorted(affected)
+
+
+def plan(root: str, changed: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Command and files per step; a step with nothing to check is skipped."""
+    if any(GLOBAL_FILES.search(path) for path in changed):
+        return {step: {"scope": "full", "files": [], "command": FULL_COMMANDS[step]} for step in STEPS}
+
+    existing = [path for path in changed if (Path(root) / path).exists()]
+    lint_files = [path for path in existing if path.endswith(LINT_EXTENSIONS)]
+    # Deleted modules count too: the specs naming them and the build catch dangling imports
+    specs = [spec for spec in affected_specs(root, changed) if (Path(root) / spec).exists()]
+    sources = [path for path in changed if not SPEC_PATTERN.search(path)]
+    steps = {
+        "lint": {"scope": "changed", "files": lint_files},
+        "build": {"scope": "full" if sources else "none", "files": []},
+        "test": {"scope": "changed", "files": specs},
+    }
+    for step, entry in steps.items():
+        if step == "build":
+            entry["command"] = STEP_COMMANDS["build"] if sources else None
+        elif entry["files"]:
+            entry["command"] = STEP_COMMANDS[step].format(files=" ".join(shlex.quote(f) for f in entry["files"]))
+        else:
+            entry["command"] = None
+    return steps
+
+
+def _error_lines(text: str) -> List[str]:
+    lines = [line.strip() for line in text.splitlines() if line.strip() and ERROR_LINE.search(line)]
+    return lines[:MAX_ERROR_LINES]
+
+
+def _results_path(tree: str, base_commit: str, steps: Dict[str, Dict[str, Any]]) -> Path:
+    # The commands are part of the key: a different lint setup must not reuse a verdict
+    key = hashlib.sha256(json.dumps([tree, base_commit, steps], sort_keys=True).encode()).hexdigest()
+    path = cache_dir() / "validation"
+    path.mkdir(parents=True, exist_ok=True)
+    return path / f"{tree[:12]}-{key[:16]}.json"
+
+
+def validate(root: Optional[str] = None, base: Optional[str] = None, steps: Optional[List[str]] = None,
+             force: bool = False) -> Dict[str, Any]:
+    """
+    Validate the changes in a checkout against its base branch.
+
+    Args:
+        root: Checkout to validate (default: the task's worktree or SISSIFICATE_PROJECT_PATH)
+        base: Branch the changes are compared with (default: SISSIFICATE_BASE_BRANCH)
+        steps: Subset of "lint", "build", "test" (default: all)
+        force: Run again even if this tree already has a verdict
+
+    Returns:
+        {"verdict": "pass" | "fail", "tree": ..., "base": ..., "changed_files": [... deleted too],
+         "cached": bool, "steps": [{"name", "status", "scope", "files", "exit_code",
+         "run_id", "seconds", "errors"}]}
+    """
+    root = root or workspace_path()
+    base = base or BASE_BRANCH
+    base_commit = merge_base(root, base)
+    tree = tree_hash(root)
+    changed = changed_files(root, base_commit)
+    planned = {step: entry for step, entry in plan(root, changed).items() if step in (steps or STEPS)}
+
+    path = _results_path(tree, base_commit, planned)
+    if not force and path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        report["cached"] = True
+        return report
+
+    results = []
+    for step, entry in planned.items():
+        result = {"name": step, "scope": entry["scope"], "files": entry["files"]}
+        if not entry["command"]:
+            results.append({**result, "status": "skipped"})
+            continue
+        started = time.time()
+        run = run_streaming(entry["command"], cwd=root)
+        output = run["head"] + "\n" + run["tail"]
+        passed = run["exit_code"] == 0 and not run["timed_out"]
+        result.update({
+            "status": "pass" if passed else "fail",
+            "exit_code": run["exit_code"],
+            "run_id": run["run_id"],
+            "seconds": round(time.time() - started, 2),
+        })
+        if not passed:
+            result["errors"] = _error_lines(output) or output.strip().splitlines()[-MAX_ERROR_LINES:]
+        results.append(result)
+
+    report = {
+        "verdict": "fail" if any(r["status"] == "fail" for r in results) else "pass",
+        "tree": tree,
+        "base": base,
+        "changed_files": changed,
+        "cached": False,
+        "steps": results,
+    }
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f)
+    os.replace(tmp_path, path)
+    return report
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+"""
+Local GitHub webhook receiver
+Verifies X-Hub-Signature-256, applies issues / issue_comment / projects_v2_item
+events to the shared issue mirror in place, and records a heartbeat on every
+verified delivery so the panel and the agents poll less while GitHub delivers
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sissificate_dev.github_graphql import project_number
+from sissificate_dev.issue_sync import IssueMirror, open_mirror
+from sissificate_dev.settings import cache_dir
+
+DEFAULT_PORT = int(os.environ.get("SISSIFICATE_WEBHOOK_PORT", "8765"))
+MAX_BODY_BYTES = 25 * 1024 * 1024
+
+
+def sign(secret: str, body: bytes) -> str:
+    """X-Hub-Signature-256 value for a body."""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    return bool(signature) and hmac.compare_digest(sign(secret, body), signature)
+
+
+def deliveries_dir() -> Path:
+    path = cache_dir() / "webhooks"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class WebhookProcessor:
+    """Applies webhook payloads to the issue mirror."""
+
+    def __init__(self, mirror: Optional[IssueMirror] = None):
+        self.mirror = mirror or open_mirror()
+        self.repository = f"{self.mirror.owner}/{self.mirror.repo}".lower()
+
+    def handle(self, event: str, payload: Dict[str, Any]) -> str:
+        """Apply one event; returns a short description of what changed."""
+        # Only a delivery (or GitHub's ping) proves the hook works; a running receiver alone does not
+        self.mirror.set_state("webhook_heartbeat", str(time.time()))
+        if event == "ping":
+            return "pong"
+
+        repository = (payload.get("repository") or {}).get("full_name", "")
+        if repository and repository.lower() != self.repository:
+            return f"ignored: event for {repository}"
+
+        if event in ("issues", "issue_comment"):
+            issue = payload.get("issue")
+            if not issue:
+                return "ignored: no issue in payload"
+            if event == "issues" and payload.get("action") in ("deleted", "transferred"):
+                self.mirror.delete(issue["number"])
+                return f"removed #{issue['number']}"
+            # Comment events carry the full issue too, with its new updated_at
+            if not self.mirror.upsert([issue]):
+                return f"skipped #{issue['number']}: mirror already has this or a newer copy"
+            return f"updated #{issue['number']}"
+
+        if event == "projects_v2_item":
+            return self._project_item(payload)
+
+        return f"ignored: {event} events are not handled"
+
+    def _project_item(self, payload: Dict[str, Any]) -> str:
+        item = payload.get("projects_v2_item") or {}
+        if item.get("content_type") not in (None, "Issue") or not item.get("content_node_id"):
+            return "ignored: not an issue"
+
+        action = payload.get("action")
+        if action in ("deleted", "archived"):
+            status = None
+        else:
+            field = (payload.get("changes") or {}).get("field_value") or {}
+            if field.get("field_name") != "Status":
+                return f"ignored: {field.get('field_name') or 'no'} field change"
+            board = project_number()
+            if board is not None and field.get("project_number") not in (None, board):
+                return f"ignored: project {field.get('project_number')}"
+            status = (field.get("to") or {}).get("name")
+            if status is None and action != "edited":
+                return "ignored: no status change"
+
+        number = self.mirror.set_project_status(item["content_node_id"], status)
+        if number is None:
+            return "ignored: issue not mirrored"
+        return f"#{number} status {status or 'cleared'}"
+
+
+def make_handler(processor: WebhookProcessor, secret: str, record: bool):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status: int, message: str):
+            body = json.dumps({"message": message}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                self._reply(413, "payload too large")
+                return
+            body = self.rfile.read(length)
+            if not verify_signature(secret, body, self.headers.get("X-Hub-Signature-256")):
+                self._reply(401, "bad signature")
+                return
+
+            event = self.headers.get("X-GitHub-Event", "")
+            delivery = self.headers.get("X-GitHub-Delivery") or f"local-{time.time_ns()}"
+            try:
+                payload = json.loads(body)
+                result = processor.handle(event, payload)
+            except (ValueError, KeyError) as e:
+                self._reply(400, f"bad payload: {e}")
+                return
+
+            if record:
+                # Arrival time first, so replaying a sorted directory keeps delivery order
+                (deliveries_dir() / f"{time.time_ns()}-{Path(delivery).name}.json").write_text(
+                    json.dumps({"event": event, "delivery": delivery, "payload": payload})
+                )
+            print(f"📬 {event} {payload.get('action', '')}: {result}")
+            self._reply(200, result)
+
+        def do_GET(self):
+            self._reply(200, "ok")
+
+    return Handler
+
+
+def serve(port: int = DEFAULT_PORT, secret: Optional[str] = None, record: bool = False,
+          mirror: Optional[IssueMirror] = None) -> ThreadingHTTPServer:
+    """Start the receiver in background threads; returns the server (call shutdown() to stop)."""
+    secret = secret or os.environ.get("GITHUB_WEBHOOK_SECRET")
+    if not secret:
+        raise ValueError("GITHUB_WEBHOOK_SECRET is required to verify deliveries")
+    processor = WebhookProcessor(mirror)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(processor, secret, record))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="webhook-server", daemon=True).start()
+    return server
+
+
+def replay(paths, mirror: Optional[IssueMirror] = None) -> int:
+    """Apply recorded deliveries ({"event": ..., "payload": ...} JSON files) without a server."""
+    processor = WebhookProcessor(mirror)
+    count = 0
+    for path in sorted(paths):
+        delivery = json.loads(Path(path).read_text())
+        print(f"📬 {Path(path).name}: {processor.handle(delivery['event'], delivery['payload'])}")
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Sissificate GitHub webhook receiver")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port on 127.0.0.1 (default: {DEFAULT_PORT})")
+    parser.add_argument("--record", action="store_true", help="Save every verified delivery for later replay")
+    parser.add_argument("--replay", nargs="+", metavar="DELIVERY", help="Apply saved deliveries and exit")
+    args = parser.parse_args()
+
+    if args.replay:
+        print(f"Replayed {replay(args.replay)} deliveries")
+    else:
+        server = serve(args.port, record=args.record)
+        print(f"🪝 Listening for GitHub webhooks on http://127.0.0.1:{args.port}/")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
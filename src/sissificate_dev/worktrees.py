@@ -0,0 +1,209 @@
+"""
+Per-task git worktrees
+Each claimed DEV-TASK gets its own `git worktree` of the shared checkout, so
+parallel agents never write into the same files, branches or build outputs.
+Worktrees share the checkout's object store and link its node_modules
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from sissificate_dev.code_index import prune_indexes
+from sissificate_dev.settings import cache_dir, project_path, use_workspace
+from sissificate_dev.task_lease import LeaseManager
+from sissificate_dev.validation import BASE_BRANCH
+
+WORKTREES_ENABLED = os.environ.get("SISSIFICATE_WORKTREES", "1").lower() not in ("0", "false", "no")
+# Commit new worktrees start from, resolved in the shared checkout; validation diffs against the same branch
+WORKTREE_BASE = os.environ.get("SISSIFICATE_WORKTREE_BASE") or BASE_BRANCH
+# Untracked paths of the shared checkout every worktree links to instead of rebuilding
+SHARED_PATHS = [
+    path.strip() for path in
+    os.environ.get("SISSIFICATE_WORKTREE_SHARED", "node_modules,.env,.env.local").split(",")
+    if path.strip()
+]
+
+
+class WorktreeError(RuntimeError):
+    """git could not create or remove a worktree."""
+
+
+def _git(root: str, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise WorktreeError(f"git {' '.join(args)}: {result.stderr.strip()}")
+    return result.stdout
+
+
+def is_git_checkout(root: str) -> bool:
+    try:
+        return _git(root, "rev-parse", "--is-inside-work-tree").strip() == "true"
+    except (WorktreeError, OSError):
+        return False
+
+
+def worktrees_dir(root: Optional[str] = None) -> Path:
+    """Where the worktrees of one checkout live (SISSIFICATE_WORKTREE_DIR, else the cache dir)."""
+    root = os.path.realpath(root or project_path())
+    digest = hashlib.sha1(root.encode()).hexdigest()[:12]
+    base = os.environ.get("SISSIFICATE_WORKTREE_DIR")
+    path = Path(base) if base else cache_dir() / "worktrees"
+    path = path / f"{Path(root).name}-{digest}"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _link_shared(root: str, path: Path) -> List[str]:
+    """Symlink SHARED_PATHS from the checkout into a worktree; returns the linked paths."""
+    linked = []
+    for rel_path in SHARED_PATHS:
+        source, target = Path(root) / rel_path, path / rel_path
+        if not source.exists() or target.exists() or target.is_symlink():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.symlink_to(source, target_is_directory=source.is_dir())
+        linked.append(rel_path)
+    if linked:
+        # `node_modules/` in .gitignore does not match a symlink; keep the links out of `git add -A`
+        unignored = [p for p in linked if subprocess.run(
+            ["git", "check-ignore", "-q", p], cwd=path, capture_output=True
+        ).returncode != 0]
+        if unignored:
+            # info/exclude is shared by every worktree of the checkout; add each entry once
+            exclude = Path(_git(str(path), "rev-parse", "--git-path", "info/exclude").strip())
+            if not exclude.is_absolute():
+                exclude = path / exclude
+            exclude.parent.mkdir(parents=True, exist_ok=True)
+            text = exclude.read_text(encoding="utf-8") if exclude.exists() else ""
+            missing = [f"/{p}" for p in unignored if f"/{p}" not in text.splitlines()]
+            if missing:
+                with open(exclude, "a", encoding="utf-8") as f:
+                    f.write(("\n" if text and not text.endswith("\n") else "") + "".join(f"{m}\n" for m in missing))
+    return linked
+
+
+def task_branch(task_id: str) -> str:
+    """Branch a task is committed and pushed on."""
+    return f"dev/{task_id}"
+
+
+def _branch_worktrees(root: str, branch: str) -> List[Path]:
+    """Worktrees of `root` that have `branch` checked out."""
+    paths, current = [], None
+    for line in _git(root, "worktree", "list", "--porcelain").splitlines():
+        if line.startswith("worktree "):
+            current = Path(line[len("worktree "):])
+        elif line == f"branch refs/heads/{branch}" and current:
+            paths.append(current)
+    return paths
+
+
+def resolve_base(root: str, base: str) -> str:
+    """
+    Commit `base` points to, fetched first when it is a remote-tracking branch
+    (origin/main); falls back from origin/<b> to <b> like validation does.
+    """
+    remote, _, remote_branch = base.partition("/")
+    if remote_branch and remote in _git(root, "remote").split():
+        try:
+            _git(root, "fetch", "--quiet", remote, remote_branch)
+        except WorktreeError as e:
+            print(f"⚠️  Could not fetch {base}, using the local copy: {e}")
+    candidates = [base] + ([remote_branch] if remote_branch else [])
+    for candidate in candidates:
+        try:
+            return _git(root, "rev-parse", "--verify", "--quiet", f"{candidate}^{{commit}}").strip()
+        except WorktreeError:
+            continue
+    raise WorktreeError(f"Cannot find base branch {base}")
+
+
+def create_worktree(name: str, root: Optional[str] = None, base: Optional[str] = None,
+                    branch: Optional[str] = None, task_id: Optional[str] = None) -> Path:
+    """
+    Fresh worktree of `root` at `base` (default: the fetched
+    SISSIFICATE_BASE_BRANCH), named after the task, on `branch` (reset to
+    `base`) or detached.
+
+    A leftover worktree of the same name is replaced, and so is another
+    worktree of ours on `branch` unless someone else holds `task_id`'s lease.
+    """
+    root = root or project_path()
+    name = re.sub(r"[^A-Za-z0-9._-]", "-", name)
+    path = worktrees_dir(root) / name
+    _git(root, "worktree", "prune")
+    # Worktrees search the checkout's index; drop indexes left by removed trees
+    prune_indexes()
+    if path.exists():
+        remove_worktree(path, root)
+    if branch:
+        # git refuses to reset a branch another worktree has checked out
+        for stale in _branch_worktrees(root, branch):
+            if stale.resolve().parent != path.resolve().parent:
+                continue
+            if task_id:
+                leases = LeaseManager()
+                lease = leases.read(task_id)
+                if lease and not leases.is_expired(lease) and lease.get("owner") != leases.owner:
+                    raise WorktreeError(f"{branch} is checked out in {stale}, and {lease.get('owner')} "
+                                        f"holds the lease on {task_id}")
+            remove_worktree(stale, root)
+        commit = resolve_base(root, base or WORKTREE_BASE)
+        _git(root, "worktree", "add", "-B", branch, str(path), commit)
+    else:
+        _git(root, "worktree", "add", "--detach", str(path), resolve_base(root, base or WORKTREE_BASE))
+    _link_shared(root, path)
+    return path
+
+
+def remove_worktree(path: Path, root: Optional[str] = None):
+    """Delete a worktree and its registration."""
+    root = root or project_path()
+    path = Path(path)
+    # Unlink shared paths first so nothing below can reach into the checkout's copies
+    for rel_path in SHARED_PATHS:
+        if (path / rel_path).is_symlink():
+            (path / rel_path).unlink()
+    try:
+        _git(root, "worktree", "remove", "--force", str(path))
+    except WorktreeError:
+        shutil.rmtree(path, ignore_errors=True)
+        _git(root, "worktree", "prune")
+
+
+@contextmanager
+def task_worktree(task_id: str, agent_name: Optional[str] = None) -> Iterator[str]:
+    """
+    Scope the file and command tools to a worktree on the task's branch.
+
+    The worktree is removed when the task succeeds and kept for inspection when
+    it fails. Yields the tree the task works in: the shared checkout itself when
+    SISSIFICATE_WORKTREES=0 or the project is not a git checkout.
+    """
+    root = project_path()
+    if not WORKTREES_ENABLED or not is_git_checkout(root):
+        yield root
+        return
+
+    path = create_worktree(f"{task_id}-{agent_name or os.environ.get('AGENT_NAME', 'agent')}", root,
+                           branch=task_branch(task_id), task_id=task_id)
+    use_workspace(str(path))
+    succeeded = False
+    try:
+        yield str(path)
+        succeeded = True
+    finally:
+        use_workspace(None)
+        if not succeeded:
+            print(f"🌳 Keeping worktree of failed task {task_id}: {path}")
+        else:
+            try:
+                remove_worktree(path, root)
+            except WorktreeError as e:
+                print(f"⚠️  Could not remove worktree {path}: {e}")
@@ -0,0 +1,15 @@
+"""
+Shared fixtures
+Every test gets its own cache dir, so compiled configs, indexes and
+validation verdicts never leak between tests or into the user's cache
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("SISSIFICATE_CACHE_DIR", str(path))
+    return path
+
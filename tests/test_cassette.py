@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+from typing import Any
+
+from crewai.llms.base_llm import BaseLLM
+
+from sissificate_dev.cassette import Cassette, RecordingLLM, ReplayLLM
+
+TOOLS = [{"type": "function", "function": {"name": "read_file", "parameters": {}}}]
+
+
+class NativeLLM(BaseLLM):
+    """Calls read_file natively first, then answers in text."""
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(model="native", **kwargs)
+
+    def call(self, messages: Any, tools: Any = None, callbacks: Any = None, available_functions: Any = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        if len(messages) == 1:
+            function = SimpleNamespace(name="read_file", arguments='{"file_path": "a.py"}')
+            return [SimpleNamespace(id="call_1", function=function)]
+        return "done"
+
+    def supports_function_calling(self) -> bool:
+        return True
+
+
+def test_tool_calls_are_recorded_and_replayed(tmp_path):
+    path = tmp_path / "run.jsonl"
+    cassette = Cassette.record(str(path), {"task_id": "DEV-1"})
+    recorder = RecordingLLM(NativeLLM(), cassette=cassette, route="native")
+    cassette.update_route("native", model=recorder.model,
+                          supports_function_calling=recorder.supports_function_calling())
+    first = [{"role": "user", "content": "go"}]
+    second = first + [{"role": "tool", "content": "code"}]
+    assert recorder.supports_function_calling()
+    assert recorder.call(first, tools=TOOLS)[0].function.name == "read_file"
+    assert recorder.call(second, tools=TOOLS) == "done"
+
+    replay = ReplayLLM(Cassette.load(str(path)), route="native")
+    assert replay.supports_function_calling()
+    assert replay.call(first, tools=TOOLS) == [{
+        "id": "call_1", "type": "function",
+        "function": {"name": "read_file", "arguments": '{"file_path": "a.py"}'},
+    }]
+    assert replay.call(second, tools=TOOLS) == "done"
+    assert replay.cassette.stats["llm_misses"] == 0
+
+
+def test_old_cassettes_replay_as_react(tmp_path):
+    path = tmp_path / "run.jsonl"
+    Cassette.record(str(path), {}).update_route("gpt-4o", model="gpt-4o")
+    assert not ReplayLLM(Cassette.load(str(path)), route="gpt-4o").supports_function_calling()
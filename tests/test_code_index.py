@@ -0,0 +1,90 @@
+import re
+import subprocess
+
+import pytest
+
+from sissificate_dev import code_index
+from sissificate_dev.code_index import CodeIndex, index_path, literal_fragments, prune_indexes
+
+
+@pytest.mark.parametrize("pattern, fragments", [
+    ("useState", ["useState"]),
+    (r"def \w+_handler", ["def ", "_handler"]),
+    (r"import\.meta", ["import", "meta"]),
+    (r"foo\x41bar", ["foo", "bar"]),
+    (r"caf\u00e9s", ["caf"]),
+    (r"abc\101def", ["abc", "def"]),
+    (r"(ab)cd\1xyz", ["xyz"]),
+    (r"\N{BULLET}item", ["item"]),
+    (r"\d\d\dabc", ["abc"]),
+    ("colou?r", ["colo"]),
+    ("fooo*bar", ["foo", "bar"]),
+    ("ab{0,2}cde", ["cde"]),
+    ("abc+def", ["abc", "def"]),
+    ("[abc]defg", ["defg"]),
+    ("(xyz)?tail", ["tail"]),
+    ("^export default$", ["export default"]),
+    ("foo|bar", []),
+    ("(?x) foo bar", []),
+    ("a.b", []),
+])
+def test_literal_fragments(pattern, fragments):
+    assert literal_fragments(pattern) == fragments
+
+
+@pytest.mark.parametrize("pattern, text", [
+    ("colou?r", "color"),
+    ("ab{0,2}cde", "acde"),
+    ("[abc]defg", "bdefg"),
+    ("(xyz)?tail", "tail"),
+    ("fooo*bar", "foobar"),
+    (r"foo\x41bar", "fooAbar"),
+    (r"abc\101def", "abcAdef"),
+])
+def test_every_match_contains_the_fragments(pattern, text):
+    assert re.search(pattern, text)
+    assert all(fragment in text for fragment in literal_fragments(pattern))
+
+
+def git(root, *args: str):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=root, capture_output=True, check=True)
+
+
+@pytest.fixture
+def checkout(tmp_path):
+    root = tmp_path / "checkout"
+    root.mkdir()
+    git(root, "init", "-q")
+    (root / "button.tsx").write_text("export const Button = 'primary'\n", encoding="utf-8")
+    (root / "card.tsx").write_text("export const Card = 'plain'\n", encoding="utf-8")
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+def test_worktree_searches_the_checkout_index_plus_its_changes(checkout, tmp_path, cache_dir):
+    worktree = tmp_path / "worktree"
+    git(checkout, "worktree", "add", "-q", "--detach", str(worktree))
+    (worktree / "card.tsx").write_text("export const Card = 'primary'\n", encoding="utf-8")
+    (worktree / "badge.tsx").write_text("export const Badge = 'primary'\n", encoding="utf-8")
+    (worktree / "button.tsx").unlink()
+    # The checkout's own uncommitted edit must not leak into the worktree's results
+    (checkout / "notes.tsx").write_text("'primary'\n", encoding="utf-8")
+
+    hits = CodeIndex(str(checkout), workspace=str(worktree)).search("primary")
+    assert sorted(path for path, _, _ in hits) == ["badge.tsx", "card.tsx"]
+    assert sorted(path for path, _, _ in CodeIndex(str(checkout)).search("primary")) == ["button.tsx", "notes.tsx"]
+    # One index, for the checkout
+    assert [p.name for p in cache_dir.glob("code-index-*.sqlite3")] == [index_path(str(checkout)).name]
+
+
+def test_prune_indexes_drops_indexes_of_removed_trees(checkout, tmp_path, cache_dir, monkeypatch):
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    CodeIndex(str(gone))
+    CodeIndex(str(checkout))
+    gone.rmdir()
+    monkeypatch.setattr(code_index, "PRUNE_AGE", 0)
+    assert prune_indexes() == 1
+    assert [p.name for p in cache_dir.glob("code-index-*.sqlite3")] == [index_path(str(checkout)).name]
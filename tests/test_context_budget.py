@@ -0,0 +1,59 @@
+import json
+import re
+from types import SimpleNamespace
+
+from crewai.tools import tool
+
+from sissificate_dev.command_runner import log_path
+from sissificate_dev.context_budget import (
+    CHARS_PER_TOKEN, budgeted, clip, compact_output, extract_json, output_guardrail, slim_github
+)
+
+
+def test_clip_keeps_head_and_tail_and_spills_the_rest():
+    text = "".join(f"line {n}\n" for n in range(2000))
+    assert clip("short", 10) == "short"
+    clipped = clip(text, 100)
+    assert clipped.startswith("line 0\n") and clipped.endswith("line 1999\n")
+    assert len(clipped) < 100 * CHARS_PER_TOKEN + 400
+    run_id = re.search(r'run_id="(out-[0-9a-f]+)"', clipped).group(1)
+    assert log_path(run_id).read_text(encoding="utf-8") == text
+
+
+def test_budgeted_tool_clips_string_results():
+    @tool("dump")
+    def dump(size: int) -> str:
+        """Return `size` characters."""
+        return "x" * size
+
+    small = budgeted(dump, max_tokens=10)
+    assert small.run(size=20) == "x" * 20
+    assert "characters omitted" in small.run(size=1000)
+    # The original tool is untouched
+    assert dump.run(size=1000) == "x" * 1000
+
+
+def test_slim_github_drops_link_fields_and_user_details():
+    issue = {"number": 1, "url": "u", "html_url": "h", "comments_url": "c",
+             "user": {"login": "bot", "avatar_url": "a", "id": 3}}
+    assert slim_github([issue]) == [{"number": 1, "url": "u", "html_url": "h", "user": {"login": "bot"}}]
+
+
+def test_extract_json_prefers_fenced_blocks():
+    assert extract_json('Done.\n```json\n{"files": ["a.py"]}\n```') == {"files": ["a.py"]}
+    assert extract_json('Result: {"ok": true} and [1]') == {"ok": True}
+    assert extract_json("no json {here") is None
+
+
+def test_compact_output_shrinks_json_to_the_budget():
+    data = {"summary": "y" * 5000, "files": [f"src/{n}.py" for n in range(500)]}
+    compact = compact_output(f"```json\n{json.dumps(data, indent=2)}\n```", max_tokens=200)
+    shrunk = json.loads(compact)
+    assert len(compact) <= 200 * CHARS_PER_TOKEN
+    assert shrunk["summary"].endswith("…")
+    assert shrunk["files"][-1].startswith("(+")
+
+
+def test_output_guardrail_replaces_the_raw_output():
+    ok, output = output_guardrail(50)(SimpleNamespace(raw='```json\n{"a": 1}\n```'))
+    assert ok and output == '{"a":1}'
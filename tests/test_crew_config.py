@@ -0,0 +1,80 @@
+import pytest
+import yaml
+
+from sissificate_dev.crew_config import CONFIG_DIR, ConfigError, _find_cycles, required_tasks, validate
+
+
+def agents_doc(**crew):
+    return {
+        "crew": crew,
+        "models": {"fast": "gpt-4o-mini", "smart": ["gpt-4o", "gpt-4o-mini"]},
+        "agents": [{"id": "dev", "role": "Developer", "goal": "Ship", "backstory": "Writes code"}],
+    }
+
+
+def task(task_id, context=(), **fields):
+    return {"id": task_id, "description": "Do it", "expected_output": "Done", "agent": "dev",
+            "context": list(context), **fields}
+
+
+def test_shipped_config_is_valid():
+    with open(CONFIG_DIR / "agents.yaml", encoding="utf-8") as f:
+        agents = yaml.safe_load(f)
+    with open(CONFIG_DIR / "tasks.yaml", encoding="utf-8") as f:
+        tasks = yaml.safe_load(f)
+    config = validate(agents, tasks)
+    assert config["targets"] == ["update_github_issue"]
+
+
+def test_validate_fills_defaults_and_targets():
+    config = validate(agents_doc(), {"tasks": [task("plan"), task("build", ["plan"])]})
+    assert config["models"] == {"fast": ["gpt-4o-mini"], "smart": ["gpt-4o", "gpt-4o-mini"]}
+    assert config["agents"]["dev"]["max_iter"] == 15
+    assert config["tasks"]["plan"]["output_tokens"] is None
+    # Without `targets:`, the tasks nothing depends on are built
+    assert config["targets"] == ["build"]
+    assert required_tasks(config) == ["plan", "build"]
+
+
+def test_validate_reports_every_problem():
+    tasks = {"tasks": [
+        task("plan", max_tokens=5),
+        task("build", agent="nobody"),
+        task("test"),
+        task("test", ["missing"]),
+        {"id": "broken"},
+    ], "targets": ["ship"]}
+    with pytest.raises(ConfigError) as error:
+        validate(agents_doc(max_concurrent_tasks=0), tasks)
+    message = str(error.value)
+    for problem in ("unknown key 'max_tokens'", "unknown agent 'nobody'", "unknown task 'missing'",
+                    "duplicate id", "missing 'description'", "unknown task 'ship'",
+                    "max_concurrent_tasks must be a positive int"):
+        assert problem in message
+
+
+def test_validate_rejects_bool_for_int_fields():
+    doc = agents_doc()
+    doc["agents"][0]["max_iter"] = True
+    with pytest.raises(ConfigError, match="'max_iter' must be int, got bool"):
+        validate(doc, {"tasks": [task("plan")]})
+
+
+def test_validate_rejects_context_cycles():
+    with pytest.raises(ConfigError, match="context cycle"):
+        validate(agents_doc(), {"tasks": [task("a", ["b"]), task("b", ["a"])], "targets": ["a"]})
+
+
+def test_find_cycles():
+    tasks = {
+        "a": task("a", ["b"]),
+        "b": task("b", ["c"]),
+        "c": task("c", ["a"]),
+        "d": task("d", ["d"]),
+        "e": task("e", ["a", "unknown"]),
+    }
+    assert _find_cycles(tasks) == [
+        "tasks.yaml: context cycle a -> b -> c -> a",
+        "tasks.yaml: context cycle d -> d",
+    ]
+    assert _find_cycles({"a": task("a"), "b": task("b", ["a"])}) == []
@@ -0,0 +1,86 @@
+import multiprocessing as mp
+import os
+
+import pytest
+
+from sissificate_dev import daemon
+from sissificate_dev.daemon import MAX_STARTUP_CRASHES, MIN_RESTART_INTERVAL, Supervisor
+from sissificate_dev.task_lease import LeaseManager
+
+
+class DeadProcess:
+    pid = os.getpid()
+    exitcode = 1
+
+    def is_alive(self):
+        return False
+
+
+class Mirror:
+    def version(self):
+        return 0
+
+
+class Claims:
+    unclaimed = []
+
+    def unclaim(self, number, failed=False, agent=None):
+        self.unclaimed.append((number, failed, agent))
+
+
+@pytest.fixture
+def supervisor(monkeypatch, tmp_path):
+    monkeypatch.setenv("SISSIFICATE_PROJECT_PATH", str(tmp_path))
+    monkeypatch.setattr(daemon, "open_mirror", Mirror)
+    monkeypatch.setattr(daemon, "GitHubClaim", Claims)
+    Claims.unclaimed = []
+    supervisor = Supervisor(1, agent_prefix="t")
+    supervisor.spawned = []
+
+    def spawn(worker_id):
+        supervisor.spawned.append(worker_id)
+        supervisor.processes[worker_id] = DeadProcess()
+        supervisor.ready.discard(worker_id)
+
+    monkeypatch.setattr(supervisor, "_spawn", spawn)
+    return supervisor
+
+
+def test_startup_crashes_back_off_then_give_up(supervisor):
+    supervisor.processes[1] = DeadProcess()
+    delays = []
+    while not supervisor.stopping:
+        supervisor._check_workers()
+        if 1 in supervisor.restart_at:
+            delays.append(supervisor.restart_at[1] - daemon.time.time())
+            # Nothing is restarted before its time
+            assert supervisor.spawned.count(1) == len(delays) - 1
+            supervisor.restart_at[1] = 0
+    assert len(supervisor.spawned) == MAX_STARTUP_CRASHES - 1
+    assert [round(d) for d in delays[:3]] == [MIN_RESTART_INTERVAL, 2 * MIN_RESTART_INTERVAL, 4 * MIN_RESTART_INTERVAL]
+    assert not supervisor.processes and not supervisor.restart_at
+
+
+def test_dead_worker_task_is_released(supervisor):
+    LeaseManager(owner="agent-t-1").acquire("DEV-1")
+    reader, writer = mp.Pipe(duplex=False)
+    supervisor.events[1] = reader
+    supervisor.ready.add(1)
+    supervisor.processes[1] = DeadProcess()
+    # Sent right before the worker died; the supervisor has not read it yet
+    writer.send(("started", 1, "DEV-1", 7))
+    writer.close()
+    supervisor._check_workers()
+    assert Claims.unclaimed == [(7, True, "agent-t-1")]
+    assert not LeaseManager().is_locked("DEV-1")
+    assert supervisor.failed == 1
+    # It had got through startup, so it comes back right away
+    assert supervisor.spawned == [1]
+
+
+def test_lease_of_another_process_is_left_alone(supervisor):
+    LeaseManager(owner="agent-2").acquire("DEV-1")
+    supervisor.running[1] = {"task_id": "DEV-1", "issue_number": 7, "started": False}
+    supervisor._release_crashed(1, DeadProcess.pid + 1, supervisor.running[1])
+    assert Claims.unclaimed == []
+    assert LeaseManager().is_locked("DEV-1")
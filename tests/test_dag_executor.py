@@ -0,0 +1,46 @@
+from typing import Any
+
+from crewai import Agent, Task
+from crewai.llms.base_llm import BaseLLM
+
+from sissificate_dev.dag_executor import DagExecutor
+
+
+class AnswerLLM(BaseLLM):
+    """Answers every call straight away with the agent's role."""
+
+    prompts: list = []
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(model="answer", **kwargs)
+        self.prompts = []
+
+    def call(self, messages: Any, tools: Any = None, callbacks: Any = None, available_functions: Any = None,
+             from_task: Any = None, from_agent: Any = None, response_model: Any = None) -> Any:
+        self.prompts.append(str(messages))
+        return f"Thought: done\nFinal Answer: {from_agent.role if from_agent else 'answer'}"
+
+
+def agent(role, delegation=False):
+    return Agent(role=role, goal="Ship", backstory="Works", llm=AnswerLLM(), allow_delegation=delegation)
+
+
+def test_runs_copies_and_leaves_tasks_alone():
+    dev, coordinator = agent("Developer"), agent("Coordinator", delegation=True)
+    plan = Task(name="plan", description="Plan", expected_output="Plan", agent=dev)
+    build = Task(name="build", description="Build", expected_output="Code", agent=dev, context=[plan])
+    test = Task(name="test", description="Test", expected_output="Report", agent=dev, context=[plan])
+    report = Task(name="report", description="Report", expected_output="Summary", agent=coordinator,
+                  context=[build, test])
+    executor = DagExecutor([plan, build, test, report], max_concurrency=2, verbose=False)
+    output = executor.kickoff()
+
+    assert [task.raw for task in output.tasks_output] == ["Developer"] * 3 + ["Coordinator"]
+    assert output.raw == "Coordinator"
+    # build and test share an agent and may run together, but neither original is touched
+    assert [task.agent for task in (plan, build, test, report)] == [dev, dev, dev, coordinator]
+    assert all(task.output is None for task in (plan, build, test, report))
+    assert set(executor.timings) == {"plan", "build", "test", "report"}
+    # The delegating agent sees its coworkers, as in a sequential crew
+    assert "delegate_work_to_coworker" in coordinator.llm.prompts[0]
+    assert "following coworkers: Developer" in coordinator.llm.prompts[0]
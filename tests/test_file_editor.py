@@ -0,0 +1,57 @@
+import pytest
+
+from sissificate_dev.file_editor import EditError, apply_edits, apply_search_replace, parse_unified_diff
+
+SQL = "SELECT 1;\n-- old note\nSELECT 2;\n"
+
+
+def test_removed_double_dash_line_is_part_of_the_hunk():
+    diff = (
+        "--- a/query.sql\n"
+        "+++ b/query.sql\n"
+        "@@ -1,3 +1,3 @@\n"
+        " SELECT 1;\n"
+        "--- old note\n"
+        "+++ new note\n"
+        " SELECT 2;\n"
+    )
+    hunks = parse_unified_diff(diff)
+    assert hunks == [("SELECT 1;\n-- old note\nSELECT 2;\n", "SELECT 1;\n++ new note\nSELECT 2;\n")]
+    assert apply_search_replace(SQL, hunks) == "SELECT 1;\n++ new note\nSELECT 2;\n"
+
+
+def test_diff_naming_two_files_is_rejected():
+    diff = (
+        "--- a/one.ts\n+++ b/one.ts\n@@ -1 +1 @@\n-a\n+b\n"
+        "--- a/two.ts\n+++ b/two.ts\n@@ -1 +1 @@\n-c\n+d\n"
+    )
+    with pytest.raises(EditError, match="touches 2 files"):
+        parse_unified_diff(diff)
+
+
+def test_rename_header_names_one_file():
+    diff = "--- a/old.ts\n+++ b/new.ts\n@@ -1 +1 @@\n-a\n+b\n"
+    assert parse_unified_diff(diff) == [("a\n", "b\n")]
+
+
+def test_multiple_hunks_and_missing_newline():
+    diff = (
+        "@@ -1,2 +1,2 @@\n one\n-two\n+2\n"
+        "@@ -9,2 +9,2 @@\n nine\n-ten\n\\ No newline at end of file\n+10\n\\ No newline at end of file\n"
+    )
+    assert parse_unified_diff(diff) == [("one\ntwo\n", "one\n2\n"), ("nine\nten", "nine\n10")]
+
+
+def test_diff_without_hunks_is_rejected():
+    with pytest.raises(EditError, match="No @@ hunks"):
+        parse_unified_diff("--- a/x\n+++ b/x\n")
+
+
+def test_apply_edits_validates_every_hunk_first(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("alpha\nbeta\nbeta\n", encoding="utf-8")
+    with pytest.raises(EditError, match="matches 2 places"):
+        apply_edits(str(path), [("alpha", "ALPHA"), ("beta", "BETA")])
+    assert path.read_text(encoding="utf-8") == "alpha\nbeta\nbeta\n"
+    assert apply_edits(str(path), [("alpha", "ALPHA")])
+    assert not apply_edits(str(path), [("ALPHA", "ALPHA")])
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from sissificate_dev import file_reader
+from sissificate_dev.file_reader import read_file_range, read_scope
+
+
+@pytest.fixture
+def small_limit(monkeypatch):
+    monkeypatch.setattr(file_reader, "MAX_READ_BYTES", 100)
+
+
+@pytest.fixture(params=["text", "mmap"])
+def big_file(request, tmp_path, small_limit, monkeypatch):
+    if request.param == "mmap":
+        monkeypatch.setattr(file_reader, "MMAP_THRESHOLD", 0)
+    path = tmp_path / "big.txt"
+    path.write_text("".join(f"line {n:04}\n" for n in range(1, 101)), encoding="utf-8")
+    return str(path)
+
+
+def test_open_ended_line_range_is_cut_with_a_continuation(big_file):
+    content = read_file_range(big_file, start_line=1)
+    assert content.startswith("[lines 1-10]\nline 0001\n")
+    assert content.endswith("line 0010\n\n[cut at 100 bytes; continue with start_line=11]")
+    assert read_file_range(big_file, start_line=95).endswith("line 0100\n")
+
+
+def test_bounded_line_range_is_not_cut(big_file):
+    assert read_file_range(big_file, start_line=3, end_line=4) == "[lines 3-4]\nline 0003\nline 0004\n"
+
+
+def test_overlong_line_continues_by_byte_offset(tmp_path, small_limit):
+    path = tmp_path / "min.js"
+    path.write_text("short\n" + "x" * 250 + "\n", encoding="utf-8")
+    content = read_file_range(str(path), start_line=2)
+    assert content == f"[lines 2-2]\n{'x' * 100}\n[cut at 100 bytes; continue with byte_offset=106]"
+
+
+def test_byte_range_is_clamped(big_file):
+    content = read_file_range(big_file, byte_offset=10, byte_length=10 ** 9)
+    assert content == "".join(f"line {n:04}\n" for n in range(2, 12)) + "\n[cut at 100 bytes; continue with byte_offset=110]"
+    assert read_file_range(big_file, byte_offset=990, byte_length=500) == "line 0100\n"
+
+
+def test_whole_file_over_the_limit_is_summarized(tmp_path, small_limit):
+    path = tmp_path / "big.txt"
+    path.write_text("".join(f"line {n:04}\n" for n in range(1, 101)), encoding="utf-8")
+    assert read_file_range(str(path)).startswith("File is 1000 bytes / 100 lines")
+
+
+def test_large_json_is_not_parsed(tmp_path, small_limit, monkeypatch):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"alpha": "x" * 200, "beta": 1}), encoding="utf-8")
+    assert "Top-level keys: alpha, beta" in read_file_range(str(path))
+    monkeypatch.setattr(file_reader, "JSON_SUMMARY_MAX_BYTES", 100)
+    assert "Top-level keys" not in read_file_range(str(path))
+
+
+def test_unchanged_note_is_scoped(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("hello\n", encoding="utf-8")
+    with read_scope("run:task:dev"):
+        assert read_file_range(str(path)) == "hello\n"
+        assert read_file_range(str(path)).startswith("Unchanged since last read")
+    with read_scope("run:task:qa"):
+        assert read_file_range(str(path)) == "hello\n"
+    assert read_file_range(str(path)) == "hello\n"
@@ -0,0 +1,72 @@
+import pytest
+import requests
+
+from sissificate_dev import rate_limit
+from sissificate_dev.github_client import MAX_RATE_LIMIT_RETRIES, ConditionalCache, GitHubClient
+from sissificate_dev.rate_limit import Governor
+
+
+def response(status, body="", **headers):
+    r = requests.Response()
+    r.status_code = status
+    r._content = body.encode()
+    r.headers.update(headers)
+    return r
+
+
+class Server:
+    """Plays scripted responses and records the headers of each request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(rate_limit, "_governor", Governor(str(tmp_path / "limits.sqlite3")))
+    return GitHubClient(token="t", base_url="https://github.test", cache=ConditionalCache(tmp_path / "http"))
+
+
+def test_unchanged_get_is_served_from_the_cache(client):
+    client.session = Server(
+        response(200, '[{"number": 1}]', ETag='"v1"', Link='<https://github.test/next>; rel="next"'),
+        response(304),
+    )
+    first = client.get("/repos/o/r/issues", params={"state": "open"})
+    second = client.get("/repos/o/r/issues", params={"state": "open"})
+    assert client.session.sent[1]["If-None-Match"] == '"v1"'
+    assert not first.from_cache and second.from_cache
+    assert second.json() == [{"number": 1}]
+    assert second.links == {"next": "https://github.test/next"}
+
+
+def test_cache_is_per_token(client):
+    client.session = Server(response(200, "[]", ETag='"v1"'))
+    client.get("/user")
+    other = GitHubClient(token="u", base_url="https://github.test", cache=client.cache)
+    other.session = Server(response(200, "[]"))
+    other.get("/user")
+    assert "If-None-Match" not in other.session.sent[0]
+
+
+def test_rate_limited_requests_are_retried(client):
+    client.session = Server(
+        response(429, "slow down", **{"Retry-After": "0"}),
+        response(403, "You have exceeded a secondary rate limit", **{"Retry-After": "0"}),
+        response(200, "{}"),
+    )
+    assert client.request("POST", "/repos/o/r/issues/1/labels", json_data={}).status_code == 200
+    assert len(client.session.sent) == 3
+
+
+def test_permission_errors_and_exhausted_retries_are_returned(client):
+    client.session = Server(response(403, "Resource not accessible by integration"))
+    assert client.get("/repos/o/r").status_code == 403
+    client.session = Server(*[response(429, "", **{"Retry-After": "0"})] * (MAX_RATE_LIMIT_RETRIES + 1))
+    assert client.get("/repos/o/r").status_code == 429
+    assert not client.session.responses
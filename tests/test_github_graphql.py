@@ -0,0 +1,55 @@
+import json
+
+from sissificate_dev.github_client import GitHubResponse
+from sissificate_dev.github_graphql import GitHubGraphQL, project_status
+
+
+class ScriptedClient:
+    """Answers each GraphQL POST with the next scripted `data` payload."""
+
+    def __init__(self, *pages):
+        self.pages = list(pages)
+        self.requests = []
+
+    def request(self, method, endpoint, json_data=None, **kwargs):
+        self.requests.append(json_data)
+        return GitHubResponse(200, json.dumps({"data": self.pages.pop(0)}), {})
+
+
+def page(key, nodes, cursor=None):
+    return {"repository": {"issue": {key: {
+        "nodes": nodes, "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor}
+    }}}}
+
+
+def test_paginate_follows_cursors():
+    client = ScriptedClient(page("labels", [{"name": "a"}], "c1"), page("labels", [{"name": "b"}]))
+    nodes = list(GitHubGraphQL(client).paginate("query", {"number": 1}, ("repository", "issue", "labels")))
+    assert nodes == [{"name": "a"}, {"name": "b"}]
+    assert [r["variables"]["cursor"] for r in client.requests] == [None, "c1"]
+
+
+def test_paginate_yields_nothing_for_a_missing_object():
+    client = ScriptedClient({"repository": {"issue": None}})
+    assert list(GitHubGraphQL(client).paginate("query", {}, ("repository", "issue", "labels"))) == []
+
+
+def test_fetch_issues_completes_cut_off_connections(monkeypatch):
+    monkeypatch.delenv("GITHUB_PROJECT_NUMBER", raising=False)
+    first_item = {"id": "I1", "project": {"number": 1}, "status": None}
+    board_item = {"id": "I2", "project": {"number": 6}, "status": {"name": "Ready"}}
+    issue = {
+        "number": 7,
+        "labels": {"nodes": [{"name": "a"}], "pageInfo": {"hasNextPage": True, "endCursor": "l1"}},
+        "projectItems": {"nodes": [first_item], "pageInfo": {"hasNextPage": True, "endCursor": "p1"}},
+    }
+    client = ScriptedClient(
+        {"repository": {"i7": issue}},
+        page("labels", [{"name": "dev_ready"}]),
+        page("projectItems", [board_item]),
+    )
+    fetched = GitHubGraphQL(client).fetch_issues("o", "r", [7])[7]
+    assert [label["name"] for label in fetched["labels"]["nodes"]] == ["a", "dev_ready"]
+    assert client.requests[2]["variables"]["cursor"] == "p1"
+    monkeypatch.setenv("GITHUB_PROJECT_NUMBER", "6")
+    assert project_status(fetched) == "Ready"
@@ -0,0 +1,95 @@
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from sissificate_dev import issue_sync
+from sissificate_dev.github_client import GitHubResponse
+from sissificate_dev.issue_sync import MIGRATIONS, SCHEMA_VERSION, IssueMirror
+
+
+def issue(number, updated_at="2026-01-01T00:00:00Z", **fields):
+    return {"number": number, "node_id": f"I_{number}", "title": f"DEV-{number:04}: Task", "state": "open",
+            "labels": [], "updated_at": updated_at, **fields}
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    return IssueMirror("o", "r", db_path=tmp_path / "issues.sqlite3")
+
+
+def test_changes_since_lists_every_change_in_order(mirror):
+    start = mirror.version()
+    mirror.upsert([issue(1), issue(2)])
+    mirror.set_project_status("I_1", "Ready")
+    mirror.delete(2)
+    changes = mirror.changes_since(start)
+    assert [(c["number"], c["kind"]) for c in changes] == [(1, "issue"), (2, "issue"), (1, "project_status"),
+                                                           (2, "deleted")]
+    assert mirror.changes_since(changes[-1]["version"]) == []
+
+
+def test_wait_for_change_wakes_on_a_write_from_another_thread(mirror):
+    start = mirror.version()
+    threading.Timer(0.1, mirror.upsert, args=([issue(1)],)).start()
+    assert mirror.wait_for_change(start, timeout=5, interval=0.02) > start
+    assert mirror.wait_for_change(mirror.version(), timeout=0.05) == mirror.version()
+
+
+class Pages:
+    """GitHub stand-in serving canned issue pages, linked with Link headers."""
+
+    def __init__(self, *pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    def get(self, url, params=None, priority=None):
+        self.calls.append((url, params))
+        index = len(self.calls) - 1
+        headers = {}
+        if index + 1 < len(self.pages):
+            headers["Link"] = f'<https://api.github.com/page/{index + 1}>; rel="next"'
+        return GitHubResponse(200, json.dumps(self.pages[index]), headers)
+
+
+def test_migrations_run_once_per_database(tmp_path, monkeypatch):
+    path = tmp_path / "issues.sqlite3"
+    IssueMirror("o", "r", db_path=path)
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert "project_status" in [row[1] for row in conn.execute("PRAGMA table_info(issues)")]
+    monkeypatch.setattr(issue_sync, "SCHEMA", "this is not SQL")
+    IssueMirror("o", "r", db_path=path)
+
+
+def test_mirror_from_before_user_version_is_upgraded(tmp_path):
+    path = tmp_path / "issues.sqlite3"
+    with sqlite3.connect(path) as conn:
+        conn.executescript(issue_sync.SCHEMA)
+        conn.execute(MIGRATIONS[0])
+    IssueMirror("o", "r", db_path=path)
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_upsert_never_rolls_an_issue_back(mirror):
+    assert mirror.upsert([issue(1, "2026-01-02T00:00:00Z", body="new")]) == 1
+    assert mirror.upsert([issue(1, "2026-01-01T00:00:00Z", body="old")]) == 0
+    assert mirror.upsert([issue(1, "2026-01-02T00:00:00Z", body="new")]) == 0
+    assert mirror.upsert([issue(2, pull_request={})]) == 0
+    assert [i["body"] for i in mirror.query()] == ["new"]
+
+
+def test_sync_pulls_everything_once_then_deltas(mirror):
+    full = Pages([issue(1, "2026-01-01T00:00:00Z")], [issue(2, "2026-01-03T00:00:00Z")])
+    assert mirror.sync(full) == 2
+    assert full.calls[0][1]["state"] == "open" and "since" not in full.calls[0][1]
+    assert full.calls[1] == ("https://api.github.com/page/1", None)
+
+    delta = Pages([issue(2, "2026-01-03T00:00:00Z"), issue(1, "2026-01-04T00:00:00Z", state="closed")])
+    assert mirror.sync(delta) == 1
+    assert delta.calls[0][1]["since"] == "2026-01-03T00:00:00Z"
+    assert delta.calls[0][1]["state"] == "all"
+    assert mirror.get_state("since") == "2026-01-04T00:00:00Z"
+    assert [i["number"] for i in mirror.query()] == [2]
@@ -0,0 +1,33 @@
+import json
+
+from sissificate_dev import model_router
+from sissificate_dev.model_router import record, resolve
+
+CONFIG = {
+    "models": {"fast": ["gpt-4o-mini", "gpt-4.1-mini"]},
+    "agents": {"dev": {"llm": "fast"}, "qa": {}},
+    "tasks": {"build": {"llm": "o3"}, "test": {}},
+}
+
+
+def test_resolve_prefers_task_then_agent_then_default(monkeypatch):
+    monkeypatch.delenv("SISSIFICATE_MODELS_FAST", raising=False)
+    assert resolve(CONFIG, "dev", "build") == {"tier": None, "models": ["o3"], "source": "task"}
+    assert resolve(CONFIG, "dev", "test") == {"tier": "fast", "models": ["gpt-4o-mini", "gpt-4.1-mini"],
+                                              "source": "agent"}
+    assert resolve(CONFIG, "qa", "test", default="gpt-4o")["models"] == ["gpt-4o"]
+    monkeypatch.setenv("SISSIFICATE_MODELS_FAST", "haiku, gpt-4o-mini")
+    assert resolve(CONFIG, "dev")["models"] == ["haiku", "gpt-4o-mini"]
+
+
+def test_routing_log_is_rotated(monkeypatch, tmp_path):
+    path = tmp_path / "routing.jsonl"
+    monkeypatch.setenv("SISSIFICATE_ROUTING_LOG", str(path))
+    monkeypatch.setattr(model_router, "ROUTING_LOG_MAX_BYTES", 300)
+    for n in range(10):
+        record("route", task=f"task-{n}")
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    old = [json.loads(line) for line in (tmp_path / "routing.jsonl.1").read_text().splitlines()]
+    assert path.stat().st_size < 300 + 200
+    assert [line["task"] for line in old + lines][-len(lines):] == [f"task-{n}" for n in range(10 - len(lines), 10)]
+    assert old[-1]["task"] == f"task-{9 - len(lines)}"
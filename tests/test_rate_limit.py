@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from sissificate_dev.rate_limit import PRIORITY_HIGH, PRIORITY_LOW, Governor, RateLimitExceeded
+
+
+@pytest.fixture
+def governor(tmp_path):
+    return Governor(str(tmp_path / "limits.sqlite3"))
+
+
+def test_buckets_are_shared_between_governors(governor):
+    other = Governor(governor.db_path)
+    governor.acquire("api", priority=PRIORITY_HIGH, capacity=2, rate=0)
+    other.acquire("api", priority=PRIORITY_HIGH, capacity=2, rate=0)
+    with pytest.raises(RateLimitExceeded):
+        governor.acquire("api", priority=PRIORITY_HIGH, capacity=2, rate=0, max_wait=1)
+
+
+def test_low_priority_leaves_a_reserve(governor):
+    governor.learn("api", remaining=20, limit=100, reset_at=time.time() + 3600)
+    with pytest.raises(RateLimitExceeded):
+        governor.acquire("api", priority=PRIORITY_LOW, max_wait=1)
+    assert governor.acquire("api", priority=PRIORITY_HIGH) == pytest.approx(0, abs=0.05)
+    assert governor.snapshot()["api"]["tokens"] == 19
+
+
+def test_retry_after_blocks_every_caller(governor):
+    governor.learn("api", retry_after=0.2)
+    assert governor.acquire("api", priority=PRIORITY_HIGH) >= 0.15
+
+
+def test_bucket_refills_at_its_rate(governor):
+    governor.acquire("llm", cost=2, capacity=2, rate=20)
+    assert 0.02 < governor.acquire("llm", capacity=2, rate=20, priority=PRIORITY_HIGH) < 1
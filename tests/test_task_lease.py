@@ -0,0 +1,100 @@
+import json
+import os
+import time
+
+import pytest
+
+from sissificate_dev.github_client import GitHubResponse
+from sissificate_dev.task_lease import RECLAIM_GUARD_TTL, GitHubClaim, LeaseManager
+
+
+def test_acquire_is_exclusive(tmp_path):
+    first = LeaseManager(str(tmp_path), owner="agent-1")
+    second = LeaseManager(str(tmp_path), owner="agent-2")
+    lease = first.acquire("DEV-1")
+    assert lease["owner"] == "agent-1"
+    assert second.acquire("DEV-1") is None
+    assert second.read("DEV-1")["token"] == lease["token"]
+
+
+def test_release_only_drops_our_own_lease(tmp_path):
+    first = LeaseManager(str(tmp_path), owner="agent-1")
+    second = LeaseManager(str(tmp_path), owner="agent-2")
+    first.acquire("DEV-1")
+    assert not second.release("DEV-1")
+    assert first.is_locked("DEV-1")
+    assert first.release("DEV-1")
+    assert second.acquire("DEV-1")
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    first = LeaseManager(str(tmp_path), owner="agent-1", ttl=0)
+    second = LeaseManager(str(tmp_path), owner="agent-2")
+    first.acquire("DEV-1")
+    lease = second.acquire("DEV-1")
+    assert lease["owner"] == "agent-2"
+    # The old owner's heartbeat and release must not touch the new lease
+    assert not first.heartbeat("DEV-1")
+    assert not first.release("DEV-1")
+    assert second.read("DEV-1")["owner"] == "agent-2"
+
+
+def test_heartbeat_extends_the_lease(tmp_path):
+    leases = LeaseManager(str(tmp_path), owner="agent-1", ttl=60)
+    lease = leases.acquire("DEV-1")
+    time.sleep(0.01)
+    assert leases.heartbeat("DEV-1")
+    assert leases.read("DEV-1")["expires_at"] > lease["expires_at"]
+
+
+def test_unreadable_lock_file_is_reclaimed_only_after_a_ttl(tmp_path):
+    (tmp_path / ".lock.DEV-1").write_text("{not json", encoding="utf-8")
+    assert LeaseManager(str(tmp_path), owner="agent-1", ttl=60).acquire("DEV-1") is None
+    assert LeaseManager(str(tmp_path), owner="agent-1", ttl=0).acquire("DEV-1")
+
+
+def test_reclaim_waits_for_another_reclaimer(tmp_path):
+    (tmp_path / ".lock.DEV-1").write_text(json.dumps({"owner": "agent-0", "expires_at": 0}), encoding="utf-8")
+    guard = tmp_path / ".lock.DEV-1.reclaim"
+    guard.touch()
+    leases = LeaseManager(str(tmp_path), owner="agent-1")
+    assert leases.acquire("DEV-1") is None
+    # A guard left by a process that died mid-reclaim is cleared once it is old enough
+    stale = time.time() - RECLAIM_GUARD_TTL - 1
+    os.utime(guard, (stale, stale))
+    assert leases.acquire("DEV-1") is None
+    assert not guard.exists()
+    assert leases.acquire("DEV-1")["owner"] == "agent-1"
+
+
+class ClaimClient:
+    """Records GitHub writes; every REST call succeeds and the board knows issue #7."""
+
+    def __init__(self):
+        self.writes = []
+        self.statuses = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        return GitHubResponse(200, "[]", {})
+
+    def request(self, method, endpoint, json_data=None, **kwargs):
+        if endpoint != "/graphql":
+            self.writes.append((method, endpoint))
+            return GitHubResponse(200, "{}", {})
+        if "option" in json_data["variables"]:
+            self.statuses.append(json_data["variables"]["option"])
+            return GitHubResponse(200, json.dumps({"data": {}}), {})
+        field = {"id": "F", "options": [{"id": name, "name": name} for name in ("Ready", "In Progress")]}
+        items = {"nodes": [{"id": "I", "project": {"id": "P", "number": 6, "field": field}}],
+                 "pageInfo": {"hasNextPage": False, "endCursor": None}}
+        return GitHubResponse(200, json.dumps({"data": {"repository": {"issue": {"projectItems": items}}}}), {})
+
+
+@pytest.mark.parametrize("failed", [False, True])
+def test_unclaim_moves_the_issue_back_to_ready(monkeypatch, failed):
+    monkeypatch.delenv("GITHUB_PROJECT_NUMBER", raising=False)
+    monkeypatch.setenv("GITHUB_ASSIGNEE", "bot")
+    client = ClaimClient()
+    GitHubClaim(client, "o", "r", agent="agent-1@host").unclaim(7, failed=failed)
+    assert client.statuses == ["Ready"]
+    assert (("POST", "/repos/o/r/issues/7/labels") in client.writes) == failed
@@ -0,0 +1,52 @@
+import pytest
+
+from sissificate_dev import task_selector
+from sissificate_dev.task_selector import first_ready_on_board, ptask_status, upstream_dev_ready
+
+
+@pytest.mark.parametrize("text, status", [
+    ("# PTASK-1\n\nStatus: dev_ready\n", "dev_ready"),
+    ("---\nid: PTASK-1\nstatus: dev_ready\n---\n", "dev_ready"),
+    ("- **Status:** `dev_ready`\n", "dev_ready"),
+    ("status: dev_ready: false\n", "dev_ready: false"),
+    ("Status: draft\n\nMove to dev_ready once reviewed\n", "draft"),
+    ("No metadata, but mentions dev_ready\n", None),
+])
+def test_ptask_status(text, status):
+    assert ptask_status(text) == status
+
+
+def write_ptask(root, ptask, text):
+    path = root / "docs" / "workboard" / "product" / "tasks"
+    path.mkdir(parents=True, exist_ok=True)
+    (path / f"{ptask}.md").write_text(text, encoding="utf-8")
+
+
+def test_upstream_dev_ready_compares_the_status_value(tmp_path):
+    write_ptask(tmp_path, "PTASK-1", "Status: dev_ready\n")
+    write_ptask(tmp_path, "PTASK-2", "Status: draft\nNot dev_ready yet\n")
+    assert upstream_dev_ready({"body": "Implements PTASK-1"}, str(tmp_path))
+    assert not upstream_dev_ready({"body": "Implements PTASK-1 and PTASK-2"}, str(tmp_path))
+    assert not upstream_dev_ready({"body": "Implements PTASK-3"}, str(tmp_path))
+    assert upstream_dev_ready({"body": "PTASK-2", "labels": [{"name": "dev_ready"}]}, str(tmp_path))
+    assert upstream_dev_ready({"body": "No upstream"}, str(tmp_path))
+
+
+class Mirror:
+    owner, repo = "o", "r"
+
+    def webhook_live(self):
+        return False
+
+
+def test_first_ready_on_board_skips_issues_without_a_status(monkeypatch):
+    statuses = {1: None, 2: "In Progress", 3: "Ready"}
+
+    class GraphQL:
+        def get_project_statuses(self, owner, repo, numbers):
+            return {n: statuses[n] for n in numbers}
+
+    monkeypatch.setattr(task_selector, "GitHubGraphQL", GraphQL)
+    candidates = [{"number": n} for n in (1, 2, 3)]
+    assert first_ready_on_board(Mirror(), candidates) == {"number": 3}
+    assert first_ready_on_board(Mirror(), candidates[:2]) is None
@@ -0,0 +1,78 @@
+import subprocess
+
+import pytest
+
+from sissificate_dev import validation
+
+
+def git(root, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=root, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def write(root, path: str, text: str = ""):
+    (root / path).parent.mkdir(parents=True, exist_ok=True)
+    (root / path).write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    git(root, "init", "-q", "-b", "main")
+    write(root, "src/button.tsx", "export const Button = () => null\n")
+    write(root, "src/card.tsx", "export const Card = () => null\n")
+    write(root, "tests/button.spec.ts", "import { Button } from '../src/button'\n")
+    write(root, "README.md", "# app\n")
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", "init")
+    git(root, "checkout", "-q", "-b", "dev/DEV-1")
+    return root
+
+
+def changed(root):
+    return validation.changed_files(str(root), validation.merge_base(str(root), "origin/main"))
+
+
+def test_changed_files_lists_edits_untracked_and_deletions(repo):
+    write(repo, "src/card.tsx", "export const Card = () => 1\n")
+    write(repo, "src/new.tsx")
+    write(repo, "docs/notes.md")
+    (repo / "src/button.tsx").unlink()
+    assert changed(repo) == ["src/button.tsx", "src/card.tsx", "src/new.tsx"]
+
+
+def test_changed_files_lists_both_sides_of_a_rename(repo):
+    git(repo, "mv", "src/card.tsx", "src/panel.tsx")
+    git(repo, "commit", "-q", "-m", "rename")
+    assert changed(repo) == ["src/card.tsx", "src/panel.tsx"]
+
+
+def test_plan_scopes_steps_to_the_change(repo):
+    write(repo, "src/button.tsx", "export const Button = () => 1\n")
+    steps = validation.plan(str(repo), changed(repo))
+    assert steps["lint"]["files"] == ["src/button.tsx"]
+    assert steps["build"]["scope"] == "full"
+    assert steps["test"]["files"] == ["tests/button.spec.ts"]
+
+
+def test_plan_builds_and_tests_when_a_source_file_is_deleted(repo):
+    (repo / "src/button.tsx").unlink()
+    steps = validation.plan(str(repo), changed(repo))
+    assert steps["lint"]["command"] is None
+    assert steps["build"]["command"] == validation.STEP_COMMANDS["build"]
+    assert steps["test"]["files"] == ["tests/button.spec.ts"]
+
+
+def test_plan_skips_a_deleted_spec(repo):
+    (repo / "tests/button.spec.ts").unlink()
+    steps = validation.plan(str(repo), changed(repo))
+    assert all(entry["command"] is None for entry in steps.values())
+
+
+def test_plan_runs_everything_when_a_global_file_changes(repo):
+    steps = validation.plan(str(repo), ["package.json"])
+    assert {entry["scope"] for entry in steps.values()} == {"full"}
+    assert steps["test"]["command"] == validation.FULL_COMMANDS["test"]
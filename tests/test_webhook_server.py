@@ -0,0 +1,60 @@
+import pytest
+
+from sissificate_dev.issue_sync import IssueMirror
+from sissificate_dev.webhook_server import WebhookProcessor, serve
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = IssueMirror("o", "r", db_path=tmp_path / "issues.sqlite3")
+    mirror.upsert([{"number": 1, "node_id": "I_1", "title": "DEV-0001: Login", "state": "open",
+                    "labels": [], "updated_at": "2026-01-01T00:00:00Z"}])
+    return mirror
+
+
+def item_event(field_name, to=None, action="edited"):
+    changes = {"field_value": {"field_name": field_name, "to": to}} if field_name else {}
+    return {"action": action, "projects_v2_item": {"content_type": "Issue", "content_node_id": "I_1"},
+            "changes": changes}
+
+
+def test_only_deliveries_make_webhooks_live(mirror, monkeypatch):
+    mirror.set_state("since", "2026-01-01T00:00:00Z")
+    monkeypatch.setenv("GITHUB_WEBHOOK_SECRET", "secret")
+    server = serve(port=0, mirror=mirror)
+    try:
+        assert not mirror.webhook_live()
+        WebhookProcessor(mirror).handle("ping", {})
+        assert mirror.webhook_live()
+    finally:
+        server.shutdown()
+
+
+def test_webhooks_are_not_live_before_the_first_sync(mirror):
+    WebhookProcessor(mirror).handle("ping", {})
+    assert not mirror.webhook_live()
+    assert mirror.needs_sync()
+
+
+def test_live_webhooks_still_reconcile(mirror):
+    mirror.set_state("since", "2026-01-01T00:00:00Z")
+    WebhookProcessor(mirror).handle("ping", {})
+    assert mirror.needs_sync()
+    mirror.set_state("synced_at", "1e12")
+    assert not mirror.needs_sync()
+    mirror.set_state("synced_at", "0")
+    assert mirror.needs_sync()
+
+
+def test_status_edits_update_the_mirror(mirror):
+    processor = WebhookProcessor(mirror)
+    assert processor.handle("projects_v2_item", item_event("Status", {"name": "In QA"})) == "#1 status In QA"
+    assert mirror.project_statuses() == {1: "In QA"}
+
+
+@pytest.mark.parametrize("event", [item_event("Priority", {"name": "High"}), item_event(None)])
+def test_other_field_edits_leave_the_status_alone(mirror, event):
+    processor = WebhookProcessor(mirror)
+    processor.handle("projects_v2_item", item_event("Status", {"name": "Ready"}))
+    assert processor.handle("projects_v2_item", event).startswith("ignored")
+    assert mirror.project_statuses() == {1: "Ready"}
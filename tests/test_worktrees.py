@@ -0,0 +1,68 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from sissificate_dev import worktrees
+from sissificate_dev.task_lease import LeaseManager
+from sissificate_dev.worktrees import WorktreeError, create_worktree, task_worktree
+
+
+def git(root, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=root, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def checkout(tmp_path, monkeypatch):
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    git(origin, "init", "-q", "-b", "main")
+    (origin / "app.ts").write_text("export {}\n", encoding="utf-8")
+    git(origin, "add", "-A")
+    git(origin, "commit", "-q", "-m", "init")
+    git(tmp_path, "clone", "-q", str(origin), "checkout")
+    root = tmp_path / "checkout"
+    (root / "node_modules").mkdir()
+    monkeypatch.setenv("SISSIFICATE_PROJECT_PATH", str(root))
+    monkeypatch.setenv("SISSIFICATE_WORKTREE_DIR", str(tmp_path / "worktrees"))
+    monkeypatch.setenv("AGENT_NAME", "agent-1")
+    monkeypatch.setattr(worktrees, "WORKTREE_BASE", "origin/main")
+    return root
+
+
+def test_worktree_starts_from_the_fetched_base_branch(checkout, tmp_path):
+    origin = tmp_path / "origin"
+    (origin / "app.ts").write_text("export const v = 2\n", encoding="utf-8")
+    git(origin, "commit", "-q", "-am", "upstream")
+    # The shared checkout is on another branch and behind origin
+    git(checkout, "checkout", "-q", "-b", "local-work")
+    with task_worktree("DEV-1") as path:
+        assert git(path, "branch", "--show-current") == "dev/DEV-1"
+        assert git(path, "rev-parse", "HEAD") == git(origin, "rev-parse", "HEAD")
+
+
+def test_failed_task_keeps_its_worktree(checkout):
+    with pytest.raises(RuntimeError):
+        with task_worktree("DEV-1") as path:
+            raise RuntimeError("boom")
+    assert (Path(path) / "app.ts").exists()
+    with task_worktree("DEV-1") as again:
+        assert again == path
+
+
+def test_branch_held_by_a_live_agent_is_not_removed(checkout):
+    other = create_worktree("DEV-1-agent-2", branch="dev/DEV-1")
+    LeaseManager(owner="agent-2").acquire("DEV-1")
+    with pytest.raises(WorktreeError, match="agent-2 holds the lease"):
+        create_worktree("DEV-1-agent-1", branch="dev/DEV-1", task_id="DEV-1")
+    assert other.exists()
+
+
+def test_shared_links_are_excluded_once(checkout):
+    create_worktree("a")
+    create_worktree("b")
+    exclude = checkout / ".git" / "info" / "exclude"
+    assert exclude.read_text(encoding="utf-8").splitlines().count("/node_modules") == 1